@@ -1 +1,96 @@
-BASE_URL = "https://restful-booker.herokuapp.com"
\ No newline at end of file
+import os
+
+BASE_URL = "https://restful-booker.herokuapp.com"
+
+# --- Authentication ---
+AUTH_USERNAME = "admin"
+AUTH_PASSWORD = "password123"
+# Seconds a cached /auth token is reused before it is fetched again.
+AUTH_TOKEN_TTL = float(os.getenv("AUTH_TOKEN_TTL", "600"))
+
+# --- Connection pooling ---
+# Number of host pools kept per base URL and keep-alive connections kept per host.
+POOL_CONNECTIONS = int(os.getenv("POOL_CONNECTIONS", "10"))
+POOL_MAXSIZE = int(os.getenv("POOL_MAXSIZE", "20"))
+# Record DNS/connect/TLS/send/TTFB/body timings per request (helpers/phase_timing.py).
+PHASE_TIMING = os.getenv("PHASE_TIMING", "0") == "1"
+
+# --- Retries (helpers/retry.py) ---
+RETRY_TOTAL = int(os.getenv("RETRY_TOTAL", "5"))
+RETRY_BACKOFF_FACTOR = float(os.getenv("RETRY_BACKOFF_FACTOR", "0.5"))
+RETRY_STATUSES = [500, 502, 503, 504]
+# A call stops retrying once waiting again would take it past this many seconds.
+RETRY_CALL_BUDGET = float(os.getenv("RETRY_CALL_BUDGET", "10"))
+# Total retry backoff allowed per test, shared by its reruns.
+RETRY_TEST_BUDGET = float(os.getenv("RETRY_TEST_BUDGET", "30"))
+
+# --- Circuit breaker (helpers/circuit_breaker.py) ---
+# Consecutive connection errors / 503s that open the circuit for a base URL.
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+# Seconds an open circuit fails calls immediately before letting one probe through.
+CIRCUIT_RESET_TIMEOUT = float(os.getenv("CIRCUIT_RESET_TIMEOUT", "10"))
+
+# --- Session health gate (helpers/health.py) ---
+# Probe /ping before the session starts and stop the run if the API never answers.
+HEALTH_GATE = os.getenv("HEALTH_GATE", "1") == "1"
+HEALTH_GATE_ATTEMPTS = int(os.getenv("HEALTH_GATE_ATTEMPTS", "5"))
+HEALTH_GATE_BACKOFF = float(os.getenv("HEALTH_GATE_BACKOFF", "1"))
+HEALTH_GATE_TIMEOUT = float(os.getenv("HEALTH_GATE_TIMEOUT", "5"))
+
+# --- Client-side rate limiting (helpers/rate_limit.py), off by default ---
+# Requests per second ceiling per base URL (0 = no ceiling).
+RATE_LIMIT_RPS = float(os.getenv("RATE_LIMIT_RPS", "0"))
+# AIMD limit on requests in flight: grows on success, halves on 503/429 or latency spikes.
+RATE_LIMIT_ADAPTIVE = os.getenv("RATE_LIMIT_ADAPTIVE", "0") == "1"
+RATE_LIMIT_INITIAL_CONCURRENCY = int(os.getenv("RATE_LIMIT_INITIAL_CONCURRENCY", "4"))
+RATE_LIMIT_MAX_CONCURRENCY = int(os.getenv("RATE_LIMIT_MAX_CONCURRENCY", "64"))
+# A response slower than this many times the running average counts as a spike.
+RATE_LIMIT_LATENCY_SPIKE = float(os.getenv("RATE_LIMIT_LATENCY_SPIKE", "3"))
+
+# --- Async client ---
+# Upper bound on in-flight requests per AsyncAPIClient.
+ASYNC_MAX_CONCURRENCY = int(os.getenv("ASYNC_MAX_CONCURRENCY", "100"))
+
+# --- Reporting ---
+# Machine-readable per-endpoint latency summary written at the end of every run.
+LATENCY_REPORT_PATH = os.getenv("LATENCY_REPORT_PATH", "latency-summary.json")
+
+# Allure attachments from helpers/attachments.py: "failure" (only for failed tests)
+# or "always"; each attachment is truncated above ATTACHMENT_MAX_BYTES.
+ALLURE_ATTACH_MODE = os.getenv("ALLURE_ATTACH_MODE", "failure")
+ATTACHMENT_MAX_BYTES = int(os.getenv("ATTACHMENT_MAX_BYTES", "65536"))
+
+# --- Pre-provisioned bookings (helpers/booking_pool.py) ---
+# Upper bound on shared read-only bookings; they can be leased to any number of tests.
+BOOKING_POOL_SHARED_MAX = int(os.getenv("BOOKING_POOL_SHARED_MAX", "3"))
+BOOKING_POOL_WORKERS = int(os.getenv("BOOKING_POOL_WORKERS", "8"))
+# Exclusive bookings are topped up in the background when fewer than this are queued.
+BOOKING_POOL_REFILL_BELOW = int(os.getenv("BOOKING_POOL_REFILL_BELOW", "2"))
+BOOKING_POOL_TIMEOUT = float(os.getenv("BOOKING_POOL_TIMEOUT", "30"))
+# Seed for the synthetic payloads the pool creates (helpers/booking_payloads.py).
+PAYLOAD_SEED = int(os.getenv("PAYLOAD_SEED", "0"))
+
+# --- Session cleanup (helpers/cleanup.py) ---
+# Delete every booking the run created once the session ends.
+CLEANUP_BOOKINGS = os.getenv("CLEANUP_BOOKINGS", "1") == "1"
+CLEANUP_WORKERS = int(os.getenv("CLEANUP_WORKERS", "8"))
+
+# --- Record / replay (helpers/cassette.py) ---
+# "off", "record" (append every exchange to CASSETTE_PATH) or "replay" (serve responses from it).
+CASSETTE_MODE = os.getenv("CASSETTE_MODE", "off")
+CASSETTE_PATH = os.getenv("CASSETTE_PATH", "cassettes/restful-booker.jsonl")
+
+# --- Local stand-in (helpers/local_server.py) ---
+# Processes serving --local-server; above 1 they share one port via SO_REUSEPORT.
+LOCAL_SERVER_WORKERS = int(os.getenv("LOCAL_SERVER_WORKERS", "1"))
+
+# --- Micro-benchmarks (helpers/microbench.py) ---
+BENCH_RESULTS_PATH = os.getenv("BENCH_RESULTS_PATH", "benchmark-results.json")
+# Results a run is compared against; written with --save-baseline on the reference machine.
+BENCH_BASELINE_PATH = os.getenv("BENCH_BASELINE_PATH", "benchmarks/baseline.json")
+# Fail when a benchmark's best time is more than this fraction slower than its baseline.
+BENCH_REGRESSION_THRESHOLD = float(os.getenv("BENCH_REGRESSION_THRESHOLD", "0.25"))
+
+# --- Parallel runs (helpers/scheduling.py) ---
+# Distribute tests across xdist workers longest-first using durations from earlier runs.
+DURATION_SCHEDULING = os.getenv("DURATION_SCHEDULING", "1") == "1"
@@ -1,51 +1,196 @@
+import json as jsonlib
+import time
+from urllib.parse import urlencode, urlsplit
+
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-from config.config import BASE_URL
+from requests.utils import requote_uri
+from config import config
+from helpers import metrics
+from helpers.cassette import active_cassette
+from helpers.circuit_breaker import breaker_for
+from helpers.connection_pool import mount_shared_adapter
+from helpers.rate_limit import limiter_for
+from helpers.responses import APIResponse
+from helpers.retry import RetryPolicy
 
 
 class APIClient:
 
-    def __init__(self, token=None):
-        self.base_url = BASE_URL
+    def __init__(self, token=None, base_url: str | None = None, token_provider=None, metrics_registry=None,
+                 cassette=None, retry_policy=None, rate_limiter=None):
+        # base_url is resolved per instance so fixtures can repoint config.BASE_URL.
+        self.base_url = base_url or config.BASE_URL
         self.token = token
+        # Optional helpers.auth.TokenProvider; takes precedence over a static token.
+        self.token_provider = token_provider
+        # Every call is recorded into a per-(method, route) latency histogram.
+        self.metrics = metrics_registry or metrics.registry
+        # Optional helpers.cassette.Cassette; defaults to the one selected by config.CASSETTE_MODE.
+        # False opts out even when a cassette is active (e.g. clients on a mock transport).
+        self.cassette = active_cassette() if cassette is None else None if cassette is False else cassette
 
         # --- Stable retry session for CI ---
+        # Retries are decided per call by helpers.retry.RetryPolicy (idempotency,
+        # Retry-After, time budgets), so the urllib3 adapter itself never retries.
+        self.retry_policy = retry_policy or RetryPolicy()
+        # Shared per base URL: once the server is down every client fails fast.
+        self.circuit_breaker = breaker_for(self.base_url)
+        # Optional helpers.rate_limit.RateLimiter, shared per base URL when enabled in config.
+        self.rate_limiter = rate_limiter if rate_limiter is not None else limiter_for(self.base_url)
         self.session = requests.Session()
 
-        retries = Retry(
-            total=5,
-            backoff_factor=0.5,
-            status_forcelist=[500, 502, 503, 504],
-            allowed_methods=False,        # Retry ВСЕ методы, включая POST
-            raise_on_status=False,        # НЕ выбрасывать ResponseError
-            raise_on_redirect=False       # Избегает RetryError от heroku redirects
-        )
+        # Connections are pooled per base URL and shared by all clients in the process.
+        mount_shared_adapter(self.session, self.base_url)
 
-        adapter = HTTPAdapter(max_retries=retries)
+        # --- Prepared-request fast path ---
+        # Session.request re-merges session headers, re-parses the URL and re-reads
+        # proxy settings from os.environ on every call. Instead, one template per
+        # method holds the merged headers and token cookie, and the environment is
+        # read once here; calls only fill in URL and body (see _prepare).
+        self._templates = {}
+        self._send_settings = self.session.merge_environment_settings(self.base_url, {}, None, None, None)
+        self._send_settings.pop("stream")
 
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
+    def _current_token(self):
+        if self.token_provider is not None:
+            return self.token_provider.get()
+        return self.token
 
-    def _headers(self) -> dict:
+    def _headers(self, token=None) -> dict:
         headers = {
             "Content-Type": "application/json"
         }
-        if self.token:
-            headers["Cookie"] = f"token={self.token}"
+        token = token or self._current_token()
+        if token:
+            headers["Cookie"] = f"token={token}"
         return headers
 
-    def get(self, endpoint: str, params: dict | None = None):
-        return self.session.get(self.base_url + endpoint, headers=self._headers(), params=params)
+    def _template(self, method: str, token) -> requests.PreparedRequest:
+        # Built by Session.prepare_request once per (method, token); a new token
+        # (e.g. after a refresh) replaces the method's template.
+        cached = self._templates.get(method)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+        headers = self._headers(token)
+        template = self.session.prepare_request(requests.Request(method, self.base_url, headers=headers))
+        if "Cookie" not in headers:
+            # Session cookies can change between calls; _prepare merges the current ones.
+            template.headers.pop("Cookie", None)
+        self._templates[method] = (token, template)
+        return template
+
+    def _prepare(self, method: str, url: str, token, params=None, body: bytes | None = None):
+        # Same request Session.request would build, from a copy of the template.
+        prepared = self._template(method, token).copy()
+        if params:
+            query = urlencode([(k, v) for k, v in params.items() if v is not None], doseq=True)
+            if query:
+                url += ("&" if "?" in url else "?") + query
+        prepared.url = requote_uri(url)
+        prepared.body = body
+        prepared.prepare_content_length(body)
+        if self.session.cookies:
+            # Cookies the server set on this session, merged as Session.prepare_request would.
+            prepared.prepare_cookies(self.session.cookies)
+        return prepared
+
+    def _request(self, method: str, endpoint: str, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = self._send(method, endpoint, **kwargs)
+        finally:
+            self.metrics.record(method, endpoint, time.perf_counter() - started)
+
+        # Present when config.PHASE_TIMING mounts helpers.phase_timing.TimingHTTPAdapter.
+        timings = getattr(response, "timings", None)
+        if timings is not None:
+            self.metrics.record_phases(method, endpoint, timings)
+        # Decodes JSON once however many times tests and helpers call .json().
+        return APIResponse(response)
+
+    def _transport(self, method: str, url: str, token, params=None, json=None, body=None, stream=False):
+        if self.cassette is not None and self.cassette.mode == "replay":
+            return self.cassette.replay(method, url, params, json)
+
+        # Recording needs the whole body, so a cassette turns streaming off.
+        stream = stream and self.cassette is None
+        prepared = self._prepare(method, url, token, params=params, body=body)
+        response = self._send_with_retries(prepared, stream=stream)
+        if self.cassette is not None:
+            self.cassette.record(method, url, params, json, response)
+        return response
+
+    def _send_with_retries(self, prepared: requests.PreparedRequest, stream=False):
+        # Every attempt resends the same PreparedRequest, body included.
+        method = prepared.method
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            self.circuit_breaker.before_call()
+            permit = self.rate_limiter.acquire() if self.rate_limiter is not None else None
+            sent = time.perf_counter()
+            response, error = None, None
+            try:
+                response = self.session.send(prepared, stream=stream, **self._send_settings)
+            except requests.exceptions.ConnectionError as e:
+                error = e
+            except BaseException as e:
+                # Not retried, but still a failed attempt: a half-open probe must resolve.
+                error = e
+                raise
+            finally:
+                # An exception leaves status None, which the limiter treats as overload.
+                status = response.status_code if response is not None else None
+                if self.rate_limiter is not None:
+                    self.rate_limiter.release(permit, status, time.perf_counter() - sent)
+                self.circuit_breaker.record(status, error)
+
+            wait = self.retry_policy.delay(
+                method, attempt, time.perf_counter() - started,
+                status=response.status_code if response is not None else None,
+                headers=response.headers if response is not None else None,
+                error=error
+            )
+            if wait is None:
+                if error is not None:
+                    raise error
+                return response
+
+            if response is not None:
+                # Hands an unread streamed connection back before the next attempt.
+                response.close()
+            self.metrics.record_retry(method, urlsplit(prepared.url).path, wait)
+            self.retry_policy.wait(wait)
+            attempt += 1
+
+    def _send(self, method: str, endpoint: str, json=None, **kwargs):
+        token = self._current_token()
+        # Serialized once, like requests does, and reused by retries and the 403 replay.
+        body = jsonlib.dumps(json, allow_nan=False).encode("utf-8") if json is not None else None
+        response = self._transport(method, self.base_url + endpoint, token, json=json, body=body, **kwargs)
+
+        # A 403 on a cookie-authenticated call means the shared token went stale:
+        # refresh it once and replay the request.
+        if response.status_code == 403 and token and self.token_provider is not None:
+            token = self.token_provider.refresh(stale=token)
+            response.close()
+            response = self._transport(method, self.base_url + endpoint, token, json=json, body=body, **kwargs)
+        return response
+
+    def get(self, endpoint: str, params: dict | None = None, stream: bool = False):
+        # stream=True returns once the headers arrive and leaves the body on the
+        # socket for response.iter_content() (see helpers.streaming). Latency is
+        # then time to headers, and the caller must read or close the response.
+        return self._request("GET", endpoint, params=params, stream=stream)
 
     def post(self, endpoint: str, json: dict | None = None):
-        return self.session.post(self.base_url + endpoint, headers=self._headers(), json=json)
+        return self._request("POST", endpoint, json=json)
 
     def put(self, endpoint: str, json: dict | None = None):
-        return self.session.put(self.base_url + endpoint, headers=self._headers(), json=json)
+        return self._request("PUT", endpoint, json=json)
 
     def patch(self, endpoint: str, json: dict | None = None):
-        return self.session.patch(self.base_url + endpoint, headers=self._headers(), json=json)
+        return self._request("PATCH", endpoint, json=json)
 
     def delete(self, endpoint: str):
-        return self.session.delete(self.base_url + endpoint, headers=self._headers())
+        return self._request("DELETE", endpoint)
@@ -0,0 +1,198 @@
+import asyncio
+import datetime
+import json as jsonlib
+import time
+
+import aiohttp
+from requests.structures import CaseInsensitiveDict
+
+from config import config
+from helpers import metrics
+from helpers.cassette import active_cassette
+from helpers.circuit_breaker import breaker_for
+from helpers.rate_limit import limiter_for
+from helpers.responses import BookingAccessors
+from helpers.retry import RetryPolicy
+
+
+_UNSET = object()
+
+
+class AsyncResponse(BookingAccessors):
+    # Fully read response exposing the attributes tests use on requests.Response.
+    # Like APIResponse, json() decodes the body once and caches it.
+
+    def __init__(self, method: str, url: str, status_code: int, headers, content: bytes,
+                 elapsed: datetime.timedelta, encoding: str | None = None, reason: str | None = None):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+        self.elapsed = elapsed
+        self.encoding = encoding or "utf-8"
+        self._json = _UNSET
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self):
+        if self._json is _UNSET:
+            self._json = jsonlib.loads(self.content)
+        return self._json
+
+    def __repr__(self):
+        return f"<AsyncResponse [{self.status_code}]>"
+
+
+class AsyncAPIClient:
+    # asyncio counterpart of APIClient with the same get/post/put/patch/delete surface.
+    # Usage:
+    #     async with AsyncAPIClient() as client:
+    #         response = await client.get("/ping")
+
+    def __init__(self, token=None, base_url: str | None = None, token_provider=None,
+                 max_concurrency: int | None = None, metrics_registry=None, cassette=None,
+                 retry_policy=None, rate_limiter=None):
+        self.base_url = base_url or config.BASE_URL
+        self.token = token
+        self.token_provider = token_provider
+        self.max_concurrency = max_concurrency or config.ASYNC_MAX_CONCURRENCY
+        self.metrics = metrics_registry or metrics.registry
+        # False opts out of the active cassette, as in APIClient.
+        self.cassette = active_cassette() if cassette is None else None if cassette is False else cassette
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = breaker_for(self.base_url)
+        self.rate_limiter = rate_limiter if rate_limiter is not None else limiter_for(self.base_url)
+
+        # Bounds in-flight requests; extra callers wait here instead of opening sockets.
+        self._semaphore = asyncio.BoundedSemaphore(self.max_concurrency)
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily so the session binds to the running event loop.
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def _current_token(self):
+        if self.token_provider is None:
+            return self.token
+        # The provider is synchronous; only hop to a thread when /auth has to be called.
+        return self.token_provider.peek() or await asyncio.to_thread(self.token_provider.get)
+
+    def _headers(self, token=None) -> dict:
+        headers = {
+            "Content-Type": "application/json"
+        }
+        if token:
+            headers["Cookie"] = f"token={token}"
+        return headers
+
+    async def _send(self, method: str, url: str, token, params=None, json=None):
+        # Cassette replay/record wraps the network call exactly as in APIClient._transport.
+        if self.cassette is not None and self.cassette.mode == "replay":
+            return self.cassette.replay(method, url, params, json)
+
+        response = await self._send_with_retries(method, url, token, params=params, json=json)
+        if self.cassette is not None:
+            self.cassette.record(method, url, params, json, response)
+        return response
+
+    async def _send_with_retries(self, method: str, url: str, token, params=None, json=None) -> AsyncResponse:
+        # Same RetryPolicy as APIClient; only the wait is asynchronous.
+        session = self._get_session()
+        first_started = time.perf_counter()
+        attempt = 0
+        while True:
+            self.circuit_breaker.before_call()
+            permit = await self.rate_limiter.acquire_async() if self.rate_limiter is not None else None
+            started = time.perf_counter()
+            response, error = None, None
+            try:
+                async with session.request(method, url, headers=self._headers(token),
+                                           params=params, json=json) as resp:
+                    content = await resp.read()
+                    response = AsyncResponse(
+                        method, str(resp.url), resp.status, resp.headers, content,
+                        datetime.timedelta(seconds=time.perf_counter() - started),
+                        resp.charset, resp.reason
+                    )
+            except aiohttp.ClientConnectionError as e:
+                error = e
+            except BaseException as e:
+                # Not retried, but still a failed attempt: a half-open probe must resolve.
+                error = e
+                raise
+            finally:
+                # An exception leaves status None, which the limiter treats as overload.
+                status = response.status_code if response is not None else None
+                if self.rate_limiter is not None:
+                    self.rate_limiter.release(permit, status, time.perf_counter() - started)
+                self.circuit_breaker.record(status, error)
+
+            wait = self.retry_policy.delay(
+                method, attempt, time.perf_counter() - first_started,
+                status=response.status_code if response is not None else None,
+                headers=response.headers if response is not None else None,
+                error=error
+            )
+            if wait is None:
+                if error is not None:
+                    raise error
+                return response
+
+            self.metrics.record_retry(method, url[len(self.base_url):], wait)
+            self.retry_policy.charge(wait)
+            await asyncio.sleep(wait)
+            attempt += 1
+
+    async def _request(self, method: str, endpoint: str, params=None, json=None) -> AsyncResponse:
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+
+        async with self._semaphore:
+            started = time.perf_counter()
+            token = await self._current_token()
+            url = self.base_url + endpoint
+            response = await self._send(method, url, token, params=params, json=json)
+
+            # Stale shared token: refresh once and replay, as APIClient does.
+            if response.status_code == 403 and token and self.token_provider is not None:
+                token = await asyncio.to_thread(self.token_provider.refresh, token)
+                response = await self._send(method, url, token, params=params, json=json)
+            self.metrics.record(method, endpoint, time.perf_counter() - started)
+        return response
+
+    async def get(self, endpoint: str, params: dict | None = None):
+        return await self._request("GET", endpoint, params=params)
+
+    async def post(self, endpoint: str, json: dict | None = None):
+        return await self._request("POST", endpoint, json=json)
+
+    async def put(self, endpoint: str, json: dict | None = None):
+        return await self._request("PUT", endpoint, json=json)
+
+    async def patch(self, endpoint: str, json: dict | None = None):
+        return await self._request("PATCH", endpoint, json=json)
+
+    async def delete(self, endpoint: str):
+        return await self._request("DELETE", endpoint)
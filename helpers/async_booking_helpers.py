@@ -0,0 +1,52 @@
+import asyncio
+
+from helpers.booking_payloads import valid_booking_payload
+from helpers.cleanup import created_bookings
+
+
+# asyncio variants of helpers.booking_helpers for AsyncAPIClient.
+
+
+async def create_booking(client, payload=None):
+    # Creates a booking using the provided async client.
+    # Returns (booking_id, full_response).
+
+    body = payload or valid_booking_payload()
+    response = await client.post("/booking", json=body)
+
+    try:
+        # Decoded once; later response.json() calls reuse it.
+        booking_id = response.booking_id
+    except Exception:
+        booking_id = None
+
+    created_bookings.record(client.base_url, booking_id)
+    return booking_id, response
+
+
+async def create_bookings(client, payloads):
+    # Creates bookings concurrently; the client's semaphore bounds the fan-out.
+    return await asyncio.gather(*(create_booking(client, p) for p in payloads))
+
+
+async def get_booking(client, booking_id: int):
+    # Retrieves booking details by ID.
+    return await client.get(f"/booking/{booking_id}")
+
+
+async def delete_booking(client, booking_id: int):
+    # Deletes a booking. Requires an authenticated client.
+    response = await client.delete(f"/booking/{booking_id}")
+    if response.status_code == 201:
+        created_bookings.discard(client.base_url, booking_id)
+    return response
+
+
+async def update_booking_full(client, booking_id: int, payload: dict):
+    # Performs full update (PUT) of booking.
+    return await client.put(f"/booking/{booking_id}", json=payload)
+
+
+async def update_booking_partial(client, booking_id: int, payload: dict):
+    # Performs partial update (PATCH).
+    return await client.patch(f"/booking/{booking_id}", json=payload)
@@ -0,0 +1,86 @@
+import hashlib
+import json
+import threading
+
+import allure
+
+from config import config
+
+
+def render(body) -> str:
+    # Turns a captured reference into text: JSON responses and dicts/lists are
+    # pretty-printed, other responses give their body, callables are called first.
+    if callable(body):
+        body = body()
+    if hasattr(body, "text") and hasattr(body, "status_code"):
+        try:
+            body = body.json()
+        except ValueError:
+            return body.text
+    if isinstance(body, (dict, list)):
+        return json.dumps(body, indent=2, ensure_ascii=False)
+    return str(body)
+
+
+def truncate(text: str, max_bytes: int) -> str:
+    data = text.encode("utf-8")
+    if len(data) <= max_bytes:
+        return text
+    kept = data[:max_bytes].decode("utf-8", errors="ignore")
+    return f"{kept}\n... truncated {len(data) - max_bytes} of {len(data)} bytes"
+
+
+class LazyAttachments:
+    # Allure attachments captured as references during a test and only serialized
+    # when flush() is called, which tests_api/conftest.py does when a test fails
+    # (or for every test with ALLURE_ATTACH_MODE=always). Each attachment is
+    # capped at `max_bytes`; identical content within a test is written once.
+
+    def __init__(self, max_bytes: int | None = None):
+        self.max_bytes = max_bytes or config.ATTACHMENT_MAX_BYTES
+        self._lock = threading.Lock()
+        self._pending = []
+
+    def add(self, body, name: str, attachment_type=None):
+        with self._lock:
+            self._pending.append((body, name, attachment_type))
+
+    def __len__(self):
+        return len(self._pending)
+
+    def discard(self):
+        with self._lock:
+            self._pending.clear()
+
+    def flush(self) -> int:
+        # Writes the captured attachments to Allure; returns how many were written.
+        with self._lock:
+            pending, self._pending = self._pending, []
+
+        written = {}
+        for body, name, attachment_type in pending:
+            try:
+                text = render(body)
+            except Exception as e:
+                text = f"<could not render attachment: {type(e).__name__}: {e}>"
+            digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+            if digest in written:
+                continue
+            written[digest] = name
+
+            if attachment_type is None:
+                attachment_type = (allure.attachment_type.JSON if isinstance(body, (dict, list))
+                                   else allure.attachment_type.TEXT)
+            allure.attach(truncate(text, self.max_bytes), name=name, attachment_type=attachment_type)
+        return len(written)
+
+
+# Process-wide buffer for the test that is running.
+attachments = LazyAttachments()
+
+
+def attach(body, name: str, attachment_type=None):
+    # Drop-in for allure.attach() that defers the work; `body` may be a response,
+    # a dict/list, a string or a zero-argument callable. Objects are kept by
+    # reference, so attach a copy of anything the test mutates afterwards.
+    attachments.add(body, name, attachment_type)
@@ -0,0 +1,75 @@
+import threading
+import time
+
+from config import config
+
+
+class AuthError(Exception):
+    # Raised when /auth does not hand out a token.
+    pass
+
+
+class TokenProvider:
+    # Fetches an auth token once and shares it between clients and threads.
+    # The token is reused until `ttl` seconds have passed or a client reports it stale.
+
+    def __init__(self, username: str | None = None, password: str | None = None,
+                 ttl: float | None = None, base_url: str | None = None):
+        self.username = username or config.AUTH_USERNAME
+        self.password = password or config.AUTH_PASSWORD
+        self.ttl = config.AUTH_TOKEN_TTL if ttl is None else ttl
+        self.base_url = base_url
+        self.fetch_count = 0
+
+        self._lock = threading.Lock()
+        self._token = None
+        self._expires_at = 0.0
+
+    def get(self) -> str:
+        # Returns the cached token, fetching a new one when missing or expired.
+        token = self.peek()
+        if token:
+            return token
+
+        with self._lock:
+            if not self._token or time.monotonic() >= self._expires_at:
+                self._fetch()
+            return self._token
+
+    def peek(self) -> str | None:
+        # Returns the cached token without blocking, or None if a fetch is needed.
+        token = self._token
+        if token and time.monotonic() < self._expires_at:
+            return token
+        return None
+
+    def refresh(self, stale: str | None = None) -> str:
+        # Replaces `stale` with a fresh token. Concurrent callers holding the same
+        # stale token trigger a single /auth call between them.
+        with self._lock:
+            if stale is None or self._token == stale:
+                self._fetch()
+            return self._token
+
+    def invalidate(self):
+        with self._lock:
+            self._token = None
+            self._expires_at = 0.0
+
+    def _fetch(self):
+        # Imported lazily: APIClient itself accepts a TokenProvider.
+        from helpers.api_client import APIClient
+
+        client = APIClient(base_url=self.base_url)
+        response = client.post("/auth", json={"username": self.username, "password": self.password})
+        self.fetch_count += 1
+
+        try:
+            token = response.json().get("token")
+        except ValueError:
+            token = None
+        if not token:
+            raise AuthError(f"Auth token was not generated: {response.status_code} {response.text}")
+
+        self._token = token
+        self._expires_at = time.monotonic() + self.ttl
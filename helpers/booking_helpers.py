@@ -1,5 +1,7 @@
 from helpers.booking_payloads import valid_booking_payload
 from helpers.api_client import APIClient
+from helpers.cleanup import created_bookings
+from helpers.streaming import stream_booking_ids
 
 
 def create_booking(client, payload=None):
@@ -9,13 +11,14 @@ def create_booking(client, payload=None):
     body = payload or valid_booking_payload()
     response = client.post("/booking", json=body)
 
-    booking_id = None
     try:
-        data = response.json()
-        booking_id = data.get("bookingid")
+        # Decoded once; later response.json() calls reuse it.
+        booking_id = response.booking_id
     except Exception:
         booking_id = None
 
+    # Tracked so the session can delete it at the end.
+    created_bookings.record(client.base_url, booking_id)
     return booking_id, response
 
 
@@ -24,9 +27,32 @@ def get_booking(client, booking_id: int):
     return client.get(f"/booking/{booking_id}")
 
 
+def iter_booking_ids(client, params: dict | None = None):
+    # Streams GET /booking and yields booking IDs as they are parsed, holding one
+    # chunk of the body at a time. Stopping early closes the connection without
+    # reading the rest of the list.
+    response = client.get("/booking", params=params, stream=True)
+    if response.status_code != 200:
+        response.close()
+        raise AssertionError(f"GET /booking returned {response.status_code}")
+    yield from stream_booking_ids(response)
+
+
+def booking_in_results(client, booking_id: int, params: dict | None = None) -> bool:
+    # True as soon as booking_id shows up in the filtered GET /booking stream.
+    ids = iter_booking_ids(client, params)
+    try:
+        return any(found == booking_id for found in ids)
+    finally:
+        ids.close()
+
+
 def delete_booking(client, booking_id: int):
     # Deletes a booking. Requires an authenticated client.
-    return client.delete(f"/booking/{booking_id}")
+    response = client.delete(f"/booking/{booking_id}")
+    if response.status_code == 201:
+        created_bookings.discard(client.base_url, booking_id)
+    return response
 
 
 def update_booking_full(client, booking_id: int, payload: dict):
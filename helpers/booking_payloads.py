@@ -1,4 +1,9 @@
 import datetime
+import itertools
+import math
+import random
+import string
+import threading
 
 
 def valid_booking_payload():
@@ -51,3 +56,163 @@ def invalid_dates_payload():
             "checkout": "2025/15/90"
         }
     }
+
+
+# --- Bulk synthetic payloads ---
+
+FIRST_NAMES = (
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
+    "William", "Elizabeth", "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+    "Thomas", "Sarah", "Charles", "Karen", "Daniel", "Nancy", "Matthew", "Lisa",
+    "Anthony", "Betty", "Mark", "Margaret", "Paul", "Sandra", "Steven", "Ashley",
+    "Andrew", "Emily", "Kenneth", "Donna", "Joshua", "Michelle", "Kevin", "Carol",
+    "Brian", "Amanda", "George", "Melissa", "Edward", "Deborah", "Ronald", "Stephanie",
+    "Timothy", "Rebecca", "Jason", "Sharon", "Jeffrey", "Laura", "Ryan", "Cynthia",
+    "Jacob", "Kathleen", "Gary", "Amy", "Nicholas", "Angela", "Eric", "Helen"
+)
+
+LAST_NAMES = (
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas",
+    "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson", "White",
+    "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson", "Walker", "Young",
+    "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill", "Flores",
+    "Green", "Adams", "Nelson", "Baker", "Hall", "Rivera", "Campbell", "Mitchell",
+    "Carter", "Roberts", "Kowalski", "Novak", "Horvat", "Petrenko", "Rozhko", "Ivanova",
+    "Schmidt", "Muller", "Rossi", "Bianchi", "Dubois", "Laurent", "Tanaka", "Sato"
+)
+
+# additionalneeds values and their relative weights.
+ADDITIONAL_NEEDS = {
+    "Breakfast": 40,
+    "Lunch": 10,
+    "Dinner": 10,
+    "Late checkout": 8,
+    "Airport transfer": 5,
+    "Parking": 7,
+    "None": 20
+}
+
+
+class BookingPayloadGenerator:
+    # Reproducible stream of realistic, unique booking payloads.
+    #
+    # Payload i is built from batch i // batch_size, and every batch draws from its
+    # own Random seeded with (seed, batch number), so any batch can be rebuilt on
+    # its own and the same seed always gives the same stream. Columns are drawn
+    # for a whole batch at once and check-in/check-out strings come from a table
+    # built once, so producing a payload is a few list lookups.
+    #
+    # Uniqueness: the (firstname, lastname, checkin, nights) space is walked in a
+    # seeded permutation (i * stride + offset mod capacity, stride coprime with
+    # capacity), so the first `capacity` payloads never repeat that tuple. Both
+    # names also carry a letter tag spelled from the permuted key ("James-Kqzdbm"),
+    # so each firstname and each lastname on its own matches a single payload.
+    # `name_prefix` is prepended to both names (see helpers/parallel.worker_prefix).
+
+    def __init__(self, seed: int = 0, batch_size: int = 1000,
+                 start_date: datetime.date = datetime.date(2025, 1, 1), days: int = 730,
+                 max_nights: int = 14, price_median: float = 150, price_sigma: float = 0.6,
+                 deposit_ratio: float = 0.7, name_prefix: str = ""):
+        self.seed = seed
+        self.batch_size = batch_size
+        self.days = days
+        self.max_nights = max_nights
+        self.price_median = price_median
+        self.price_sigma = price_sigma
+        self.deposit_ratio = deposit_ratio
+        self.name_prefix = name_prefix
+
+        self._dates = [(start_date + datetime.timedelta(days=d)).isoformat()
+                       for d in range(days + max_nights + 1)]
+        self.capacity = len(FIRST_NAMES) * len(LAST_NAMES) * days * max_nights
+        self._tag_width = 1
+        while 26 ** self._tag_width < self.capacity:
+            self._tag_width += 1
+
+        rng = random.Random(seed)
+        self._offset = rng.randrange(self.capacity)
+        stride = rng.randrange(1, self.capacity)
+        while math.gcd(stride, self.capacity) != 1:
+            stride += 1
+        self._stride = stride
+
+        self._needs = list(ADDITIONAL_NEEDS)
+        self._needs_weights = list(itertools.accumulate(ADDITIONAL_NEEDS.values()))
+
+    def _tag(self, key: int) -> str:
+        # Fixed-width base-26 spelling of `key`, e.g. "Kqzdbm".
+        letters = []
+        for _ in range(self._tag_width):
+            key, digit = divmod(key, 26)
+            letters.append(string.ascii_lowercase[digit])
+        return "".join(letters).capitalize()
+
+    def _unpack(self, index: int) -> tuple:
+        key = (index * self._stride + self._offset) % self.capacity
+        tag = self._tag(key)
+        key, nights = divmod(key, self.max_nights)
+        key, checkin = divmod(key, self.days)
+        first, last = divmod(key, len(LAST_NAMES))
+        prefix = self.name_prefix
+        return (f"{prefix}{FIRST_NAMES[first]}-{tag}", f"{prefix}{LAST_NAMES[last]}-{tag}",
+                checkin, nights + 1)
+
+    def batch(self, number: int) -> list[dict]:
+        # Payloads number * batch_size .. (number + 1) * batch_size - 1.
+        size = self.batch_size
+        rng = random.Random(f"{self.seed}:{number}")
+        prices = [max(1, round(rng.lognormvariate(math.log(self.price_median), self.price_sigma)))
+                  for _ in range(size)]
+        deposits = [rng.random() < self.deposit_ratio for _ in range(size)]
+        needs = rng.choices(self._needs, cum_weights=self._needs_weights, k=size)
+
+        dates = self._dates
+        payloads = []
+        for offset in range(size):
+            firstname, lastname, checkin, nights = self._unpack(number * size + offset)
+            payloads.append({
+                "firstname": firstname,
+                "lastname": lastname,
+                "totalprice": prices[offset] * nights,
+                "depositpaid": deposits[offset],
+                "bookingdates": {
+                    "checkin": dates[checkin],
+                    "checkout": dates[checkin + nights]
+                },
+                "additionalneeds": needs[offset]
+            })
+        return payloads
+
+    def stream(self, count: int | None = None, start: int = 0):
+        # Lazily yields `count` payloads (endless when None) starting at payload `start`.
+        number, skip = divmod(start, self.batch_size)
+        produced = 0
+        while count is None or produced < count:
+            for payload in self.batch(number)[skip:]:
+                if count is not None and produced >= count:
+                    return
+                yield payload
+                produced += 1
+            number, skip = number + 1, 0
+
+    def __iter__(self):
+        return self.stream()
+
+
+class PayloadStream:
+    # Thread-safe `next()` over a generator stream, for worker pools that share one.
+
+    def __init__(self, generator: BookingPayloadGenerator | None = None):
+        self.generator = generator or BookingPayloadGenerator()
+        self._iterator = self.generator.stream()
+        self._lock = threading.Lock()
+
+    def next(self) -> dict:
+        with self._lock:
+            return next(self._iterator)
+
+
+def generate_bookings(count: int | None = None, seed: int = 0, batch_size: int = 1000):
+    # Shortcut for BookingPayloadGenerator(seed, batch_size).stream(count).
+    return BookingPayloadGenerator(seed=seed, batch_size=batch_size).stream(count)
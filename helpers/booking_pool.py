@@ -0,0 +1,162 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from config import config
+from helpers.api_client import APIClient
+from helpers.booking_helpers import create_booking
+from helpers.booking_payloads import BookingPayloadGenerator, PayloadStream
+from helpers.parallel import worker_prefix
+from helpers.retry import RetryBudget, RetryPolicy
+
+
+class Lease:
+    # A pre-created booking handed to a test.
+
+    def __init__(self, booking_id: int, booking: dict):
+        self.booking_id = booking_id
+        self.booking = booking
+
+    def __iter__(self):
+        # Allows `booking_id, booking = lease`, like create_booking's return value.
+        return iter((self.booking_id, self.booking))
+
+    def __repr__(self):
+        return f"<Lease booking_id={self.booking_id}>"
+
+
+class BookingPool:
+    # Bookings created in parallel ahead of the tests that need them.
+    #
+    # Shared bookings are leased to read-only tests (GET, filters) and may be handed
+    # to many tests; tests must not modify them. Exclusive bookings are handed to
+    # exactly one test, which may update or delete them. The exclusive queue is
+    # refilled in the background whenever it drops below `refill_below`.
+    # Every booking gets a distinct payload from `payloads`, so name filters match
+    # only the bookings a test leased rather than every booking the suite created.
+    # Under pytest-xdist the default payloads carry the worker's name prefix.
+
+    def __init__(self, shared: int = 1, exclusive: int = 0, base_url: str | None = None,
+                 workers: int | None = None, refill_below: int | None = None,
+                 payloads: PayloadStream | None = None):
+        self.shared_size = max(shared, 1)
+        self.exclusive_size = exclusive
+        self.base_url = base_url
+        self.refill_below = config.BOOKING_POOL_REFILL_BELOW if refill_below is None else refill_below
+        self.payloads = payloads or PayloadStream(
+            BookingPayloadGenerator(seed=config.PAYLOAD_SEED, name_prefix=worker_prefix())
+        )
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers or config.BOOKING_POOL_WORKERS,
+            thread_name_prefix="booking-pool"
+        )
+        self._local = threading.local()
+        # Pool threads run between and alongside tests, so their backoff must not
+        # be charged to whichever test is current; they share a budget of their own.
+        self._retry_policy = RetryPolicy(budget=RetryBudget())
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self._shared = []
+        self._shared_ready = threading.Event()
+        self._shared_pending = 0
+        self._next_shared = 0
+        self._exclusive = queue.Queue()
+        self._pending = 0
+
+        self.created = 0
+        self.failed = 0
+        self.last_error = None
+
+    def _client(self) -> APIClient:
+        # One client per pool thread; they all share the same connection pool.
+        if not hasattr(self._local, "client"):
+            self._local.client = APIClient(base_url=self.base_url, retry_policy=self._retry_policy)
+        return self._local.client
+
+    def _create(self) -> Lease | None:
+        try:
+            booking_id, response = create_booking(self._client(), self.payloads.next())
+        except Exception as e:
+            # e.g. helpers.circuit_breaker.CircuitOpenError while the server is down.
+            booking_id, response = None, None
+            self.last_error = e
+        with self._lock:
+            if booking_id is None:
+                self.failed += 1
+                if response is not None:
+                    self.last_error = f"POST /booking returned {response.status_code}"
+                return None
+            self.created += 1
+        return Lease(booking_id, response.booking)
+
+    def _create_shared(self):
+        lease = self._create()
+        with self._lock:
+            self._shared_pending -= 1
+            if lease is not None:
+                self._shared.append(lease)
+            if lease is not None or not self._shared_pending:
+                # Also wakes waiters when every attempt failed, so they fail fast.
+                self._shared_ready.set()
+
+    def _create_exclusive(self):
+        try:
+            # A failed creation queues None so a waiting take_exclusive() gives up
+            # on the queue right away instead of after BOOKING_POOL_TIMEOUT.
+            self._exclusive.put(self._create())
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _submit_exclusive(self, count: int):
+        with self._lock:
+            if self._closed:
+                return
+            self._pending += count
+        for _ in range(count):
+            self._executor.submit(self._create_exclusive)
+
+    def start(self):
+        # Returns immediately; bookings are created on the pool threads.
+        self._shared_pending = self.shared_size
+        for _ in range(self.shared_size):
+            self._executor.submit(self._create_shared)
+        self._submit_exclusive(self.exclusive_size)
+        return self
+
+    def lease_shared(self) -> Lease:
+        # Read-only booking, handed out round-robin.
+        if not self._shared_ready.wait(config.BOOKING_POOL_TIMEOUT) or not self._shared:
+            raise RuntimeError(f"No shared booking could be created (last error: {self.last_error})")
+        with self._lock:
+            lease = self._shared[self._next_shared % len(self._shared)]
+            self._next_shared += 1
+        return lease
+
+    def take_exclusive(self) -> Lease:
+        # Booking owned by the caller. Falls back to creating one inline if the
+        # queue stays empty (e.g. reruns needed more than were collected).
+        try:
+            lease = self._exclusive.get(timeout=config.BOOKING_POOL_TIMEOUT if self._pending else 0.001)
+        except queue.Empty:
+            lease = None
+
+        with self._lock:
+            missing = self.refill_below - (self._exclusive.qsize() + self._pending)
+        if missing > 0:
+            self._submit_exclusive(missing)
+
+        if lease is None:
+            lease = self._create()
+            if lease is None:
+                raise RuntimeError(
+                    f"Booking could not be created for an exclusive lease (last error: {self.last_error})"
+                )
+        return lease
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=True, cancel_futures=True)
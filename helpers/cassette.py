@@ -0,0 +1,185 @@
+import datetime
+import hashlib
+import json
+import mmap
+import os
+import threading
+from urllib.parse import urlencode, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from config import config
+
+
+MODES = ("off", "record", "replay")
+_KEY_PREFIX = b'{"key": "'
+
+
+class CassetteMiss(LookupError):
+    # Raised in replay mode when no recorded exchange matches a request.
+    pass
+
+
+def normalize_url(url: str, params: dict | None = None) -> str:
+    # Path plus sorted query; scheme and host are dropped so a cassette recorded
+    # against one server replays against any base URL.
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in (params or {}).items() if v is not None]
+    if parts.query:
+        query += [tuple(pair.split("=", 1)) if "=" in pair else (pair, "") for pair in parts.query.split("&")]
+    path = parts.path or "/"
+    return f"{path}?{urlencode(sorted(query))}" if query else path
+
+
+def body_hash(body) -> str:
+    if body is None:
+        return "-"
+    canonical = json.dumps(body, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+class Cassette:
+    # Record/replay store for HTTP exchanges, one JSON object per line.
+    #
+    # record: every exchange is appended and flushed as soon as it completes, so
+    #         nothing is buffered in memory and a crashed run keeps what it sent.
+    # replay: the file is memory-mapped and indexed on first use by reading only
+    #         the "key" prefix of each line; a response body is decoded only when
+    #         a request actually asks for it.
+    #
+    # Exchanges are keyed by method, normalized URL, request body hash and the
+    # call ordinal of that triple, so repeated identical calls (GET before and
+    # after a DELETE) replay in the order they were recorded. Calls beyond the
+    # recorded count reuse the last recorded ordinal.
+
+    def __init__(self, path: str, mode: str):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Cassette mode must be 'record' or 'replay', got '{mode}'")
+        self.path = path
+        self.mode = mode
+
+        self._lock = threading.Lock()
+        self._ordinals = {}
+        self._file = None
+        self._mmap = None
+        self._index = None
+        self._last_ordinal = {}
+
+    # --- keys ---
+
+    def _next_key(self, method: str, url: str, params, body) -> tuple:
+        base = f"{method.upper()} {normalize_url(url, params)} {body_hash(body)}"
+        with self._lock:
+            ordinal = self._ordinals.get(base, 0)
+            self._ordinals[base] = ordinal + 1
+        return base, ordinal
+
+    # --- record ---
+
+    def record(self, method: str, url: str, params, body, response):
+        base, ordinal = self._next_key(method, url, params, body)
+        line = json.dumps({
+            "key": f"{base} {ordinal}",
+            "request": {"method": method.upper(), "url": normalize_url(url, params), "body": body},
+            "response": {
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": dict(response.headers),
+                "body": response.text,
+                "elapsed": response.elapsed.total_seconds()
+            }
+        })
+
+        with self._lock:
+            if self._file is None:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._file = open(self.path, "w", encoding="utf-8")
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    # --- replay ---
+
+    def _build_index(self):
+        index = {}
+        last = {}
+        if os.path.getsize(self.path):
+            with open(self.path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            mm = self._mmap
+            pos, size = 0, len(mm)
+            while pos < size:
+                end = mm.find(b"\n", pos)
+                if end == -1:
+                    end = size
+                if mm[pos:pos + len(_KEY_PREFIX)] == _KEY_PREFIX:
+                    key_end = mm.find(b'"', pos + len(_KEY_PREFIX), end)
+                    key = mm[pos + len(_KEY_PREFIX):key_end].decode("ascii")
+                    index[key] = (pos, end)
+                    base, _, ordinal = key.rpartition(" ")
+                    last[base] = max(last.get(base, 0), int(ordinal))
+                pos = end + 1
+
+        self._index = index
+        self._last_ordinal = last
+
+    def replay(self, method: str, url: str, params, body) -> requests.Response:
+        base, ordinal = self._next_key(method, url, params, body)
+        with self._lock:
+            if self._index is None:
+                self._build_index()
+
+        if base not in self._last_ordinal:
+            raise CassetteMiss(f"No recorded exchange for {base} in {self.path}")
+        start, end = self._index[f"{base} {min(ordinal, self._last_ordinal[base])}"]
+        exchange = json.loads(self._mmap[start:end])["response"]
+
+        response = requests.Response()
+        response.status_code = exchange["status"]
+        response.reason = exchange["reason"]
+        response.headers = CaseInsensitiveDict(exchange["headers"])
+        response._content = exchange["body"].encode("utf-8")
+        # Marks the body as read, so iter_content() serves it from memory.
+        response._content_consumed = True
+        response.encoding = "utf-8"
+        response.url = url
+        response.elapsed = datetime.timedelta(seconds=exchange["elapsed"])
+        return response
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            self._index = None
+
+
+_active = None
+_active_lock = threading.Lock()
+
+
+def active_cassette() -> Cassette | None:
+    # Process-wide cassette selected by config.CASSETTE_MODE / CASSETTE_PATH.
+    global _active
+    if config.CASSETTE_MODE == "off":
+        return None
+    with _active_lock:
+        if _active is None or (_active.path, _active.mode) != (config.CASSETTE_PATH, config.CASSETTE_MODE):
+            if _active is not None:
+                _active.close()
+            _active = Cassette(config.CASSETTE_PATH, config.CASSETTE_MODE)
+        return _active
+
+
+def close_active_cassette():
+    global _active
+    with _active_lock:
+        if _active is not None:
+            _active.close()
+            _active = None
@@ -0,0 +1,87 @@
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+from config import config
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    # Raised instead of sending a request while the server is considered down.
+    pass
+
+
+class CircuitBreaker:
+    # Stops calls to a server that keeps failing.
+    #
+    # closed:    calls go through; connection errors and 503s are counted, any
+    #            other response resets the count.
+    # open:      after `failure_threshold` consecutive failures every call fails
+    #            immediately with CircuitOpenError for `reset_timeout` seconds.
+    # half-open: then exactly one call is let through as a probe; success closes
+    #            the circuit, failure opens it for another `reset_timeout`.
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+    def __init__(self, name: str = "", failure_threshold: int | None = None,
+                 reset_timeout: float | None = None):
+        self.name = name
+        self.failure_threshold = failure_threshold or config.CIRCUIT_FAILURE_THRESHOLD
+        self.reset_timeout = config.CIRCUIT_RESET_TIMEOUT if reset_timeout is None else reset_timeout
+
+        self._lock = threading.Lock()
+        self.state = self.CLOSED
+        self.failures = 0
+        self.last_failure = None
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self._probing = False
+
+    def before_call(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+
+            retry_in = max(self.reset_timeout - (time.monotonic() - self.opened_at), 0.0)
+            raise CircuitOpenError(
+                f"Circuit for {self.name} is {self.state} after {self.failures} consecutive failures "
+                f"(last: {self.last_failure}); not sending the request, next probe in {retry_in:.1f}s"
+            )
+
+    def record(self, status: int | None = None, error: BaseException | None = None):
+        failed = error is not None or status == 503
+        with self._lock:
+            self._probing = False
+            if not failed:
+                self.state = self.CLOSED
+                self.failures = 0
+                return
+
+            self.failures += 1
+            self.last_failure = f"{type(error).__name__}" if error is not None else f"HTTP {status}"
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.times_opened += 1
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+# One breaker per scheme://host:port, shared by every client in the process.
+_breakers = {}
+_lock = threading.Lock()
+
+
+def breaker_for(base_url: str) -> CircuitBreaker:
+    parts = urlsplit(base_url)
+    key = f"{parts.scheme}://{parts.netloc}".lower()
+    with _lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = _breakers[key] = CircuitBreaker(key)
+    return breaker
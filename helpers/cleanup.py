@@ -0,0 +1,87 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from config import config
+
+
+class CleanupResult:
+
+    def __init__(self):
+        self.cleaned = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def add(self, other: "CleanupResult"):
+        self.cleaned += other.cleaned
+        self.skipped += other.skipped
+        self.failed += other.failed
+
+    def __str__(self):
+        return f"{self.cleaned} cleaned, {self.skipped} skipped, {self.failed} failed"
+
+
+class BookingRegistry:
+    # Booking IDs created during the session, grouped by base URL, so they can be
+    # deleted at the end instead of piling up on the shared server.
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bookings = {}
+
+    def record(self, base_url: str, booking_id):
+        if booking_id is None:
+            return
+        with self._lock:
+            self._bookings.setdefault(base_url, set()).add(booking_id)
+
+    def discard(self, base_url: str, booking_id):
+        with self._lock:
+            self._bookings.get(base_url, set()).discard(booking_id)
+
+    def forget(self, base_url: str):
+        # Drops every ID for a server that is going away (e.g. a local stand-in).
+        with self._lock:
+            self._bookings.pop(base_url, None)
+
+    def pending(self, base_url: str | None = None) -> list:
+        with self._lock:
+            if base_url is not None:
+                return sorted(self._bookings.get(base_url, ()))
+            return sorted(i for ids in self._bookings.values() for i in ids)
+
+    @property
+    def base_urls(self) -> list:
+        with self._lock:
+            return [url for url, ids in self._bookings.items() if ids]
+
+    def cleanup(self, client, workers: int | None = None) -> CleanupResult:
+        # Deletes every recorded booking for client.base_url with a bounded pool of
+        # threads. `client` must be authenticated. 404/405 means the booking was
+        # already gone and counts as skipped.
+        from helpers.booking_helpers import delete_booking
+
+        result = CleanupResult()
+        lock = threading.Lock()
+        ids = self.pending(client.base_url)
+
+        def delete(booking_id):
+            try:
+                status = delete_booking(client, booking_id).status_code
+            except Exception:
+                status = None
+            with lock:
+                if status in (200, 201):
+                    result.cleaned += 1
+                elif status in (404, 405):
+                    result.skipped += 1
+                    self.discard(client.base_url, booking_id)
+                else:
+                    result.failed += 1
+
+        with ThreadPoolExecutor(max_workers=workers or config.CLEANUP_WORKERS) as pool:
+            list(pool.map(delete, ids))
+        return result
+
+
+# Process-wide registry fed by helpers.booking_helpers.create_booking.
+created_bookings = BookingRegistry()
@@ -0,0 +1,83 @@
+import threading
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+
+from config import config
+from helpers.phase_timing import TimingHTTPAdapter
+
+
+# Process-wide registry: one HTTPAdapter (and so one urllib3 pool) per base URL.
+# Every APIClient for the same host mounts the same adapter, so keep-alive
+# connections opened by one fixture are reused by the next ad-hoc client.
+_adapters = {}
+_lock = threading.Lock()
+
+
+def _pool_key(base_url: str) -> str:
+    parts = urlsplit(base_url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def get_adapter(base_url: str, max_retries=None) -> HTTPAdapter:
+    # Returns the shared adapter for base_url, creating it on first use.
+    # max_retries only applies to the client that creates the adapter.
+    key = _pool_key(base_url)
+    adapter = _adapters.get(key)
+    if adapter is not None:
+        return adapter
+
+    with _lock:
+        adapter = _adapters.get(key)
+        if adapter is None:
+            adapter_cls = TimingHTTPAdapter if config.PHASE_TIMING else HTTPAdapter
+            adapter = adapter_cls(
+                pool_connections=config.POOL_CONNECTIONS,
+                pool_maxsize=config.POOL_MAXSIZE,
+                max_retries=max_retries if max_retries is not None else 0
+            )
+            _adapters[key] = adapter
+    return adapter
+
+
+def mount_shared_adapter(session, base_url: str, max_retries=None) -> HTTPAdapter:
+    # Routes every request the session makes to base_url through the shared pool.
+    adapter = get_adapter(base_url, max_retries=max_retries)
+    session.mount(_pool_key(base_url) + "/", adapter)
+    return adapter
+
+
+def pool_stats(base_url: str | None = None) -> dict:
+    # Connections opened vs requests served on reused keep-alive connections.
+    with _lock:
+        if base_url is None:
+            adapters = list(_adapters.values())
+        else:
+            adapter = _adapters.get(_pool_key(base_url))
+            adapters = [adapter] if adapter else []
+
+    opened = 0
+    requests_sent = 0
+    for adapter in adapters:
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            opened += pool.num_connections
+            requests_sent += pool.num_requests
+
+    return {
+        "opened": opened,
+        "requests": requests_sent,
+        "reused": max(requests_sent - opened, 0)
+    }
+
+
+def close_all():
+    # Closes every pooled connection and forgets the adapters.
+    with _lock:
+        adapters = list(_adapters.values())
+        _adapters.clear()
+    for adapter in adapters:
+        adapter.close()
@@ -0,0 +1,29 @@
+import time
+
+import requests
+
+from config import config
+
+
+def wait_until_healthy(base_url: str, attempts: int | None = None, backoff: float | None = None,
+                       timeout: float | None = None) -> tuple:
+    # Probes GET /ping until it answers 201, sleeping backoff, 2 * backoff, ...
+    # between attempts. Returns (healthy, detail). Uses plain requests so the probe
+    # bypasses APIClient retries, circuit breakers and latency metrics.
+    attempts = attempts or config.HEALTH_GATE_ATTEMPTS
+    backoff = config.HEALTH_GATE_BACKOFF if backoff is None else backoff
+    timeout = timeout or config.HEALTH_GATE_TIMEOUT
+
+    detail = "no attempt made"
+    for attempt in range(attempts):
+        if attempt:
+            time.sleep(backoff * 2 ** (attempt - 1))
+        try:
+            response = requests.get(base_url + "/ping", timeout=timeout)
+        except requests.exceptions.RequestException as e:
+            detail = f"{type(e).__name__}: {e}"
+            continue
+        if response.status_code == 201:
+            return True, f"healthy after {attempt + 1} attempt(s)"
+        detail = f"HTTP {response.status_code}"
+    return False, f"{base_url}/ping failed {attempts} times, last: {detail}"
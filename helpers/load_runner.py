@@ -0,0 +1,428 @@
+import argparse
+import json
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from config import config
+from helpers.api_client import APIClient
+from helpers.auth import TokenProvider
+from helpers.booking_helpers import (
+    create_booking,
+    get_booking,
+    update_booking_full,
+    update_booking_partial,
+    delete_booking)
+from helpers.booking_payloads import FIRST_NAMES, BookingPayloadGenerator, PayloadStream
+from helpers.metrics import LatencyHistogram, MetricsRegistry
+from helpers.schemas import registry as schema_registry
+
+
+# Default weighted mix of booking operations (relative weights).
+DEFAULT_MIX = {
+    "create": 2,
+    "get": 4,
+    "filter": 1,
+    "put": 1,
+    "patch": 1,
+    "delete": 1
+}
+
+# Open-loop requests that start this long after their scheduled time count as late.
+LATE_THRESHOLD = 0.010
+
+# Bookings created up front for get/filter/put/patch; the workload never deletes them.
+SEED_BOOKINGS = 10
+
+
+class BookingIds:
+    # Thread-safe booking IDs the workload can act on. Seeded IDs are read and
+    # updated, IDs created during the run are the only ones deleted, so a worker
+    # never updates a booking another worker just removed. New bookings and full
+    # updates take their bodies from `payloads`.
+
+    def __init__(self, payloads: PayloadStream | None = None):
+        self.payloads = payloads or PayloadStream()
+        self._lock = threading.Lock()
+        self._stable = []
+        self._disposable = deque()
+
+    def seed(self, booking_id):
+        if booking_id is not None:
+            self._stable.append(booking_id)
+
+    def add(self, booking_id):
+        if booking_id is None:
+            return
+        with self._lock:
+            self._disposable.append(booking_id)
+
+    def pick(self):
+        # A random seeded ID.
+        return random.choice(self._stable)
+
+    def take(self):
+        # Removes and returns a booking created during the run, or None.
+        with self._lock:
+            if not self._disposable:
+                return None
+            return self._disposable.popleft()
+
+    def __len__(self):
+        return len(self._stable) + len(self._disposable)
+
+
+# --- Operations ---
+# Each returns (response, ok). `ok` means the status is what the API documents.
+
+def op_create(client, ids):
+    booking_id, response = create_booking(client, ids.payloads.next())
+    ids.add(booking_id)
+    return response, response.status_code == 200 and booking_id is not None
+
+
+def op_get(client, ids):
+    response = get_booking(client, ids.pick())
+    return response, response.status_code == 200
+
+
+def op_filter(client, ids):
+    response = client.get("/booking", params={"firstname": random.choice(FIRST_NAMES)})
+    return response, response.status_code == 200
+
+
+def op_put(client, ids):
+    response = update_booking_full(client, ids.pick(), ids.payloads.next())
+    return response, response.status_code == 200
+
+
+def op_patch(client, ids):
+    response = update_booking_partial(client, ids.pick(), {"additionalneeds": "Dinner"})
+    return response, response.status_code == 200
+
+
+def op_delete(client, ids):
+    booking_id = ids.take()
+    if booking_id is None:
+        # Nothing disposable yet; LoadRunner runs (and records) a create instead.
+        return None, None
+    response = delete_booking(client, booking_id)
+    return response, response.status_code == 201
+
+
+# Schemas checked with --validate; a response that does not match counts as an error.
+RESPONSE_SCHEMAS = {
+    "get": "booking",
+    "filter": "booking_list",
+    "put": "booking",
+    "patch": "booking"
+}
+
+OPERATIONS = {
+    "create": op_create,
+    "get": op_get,
+    "filter": op_filter,
+    "put": op_put,
+    "patch": op_patch,
+    "delete": op_delete
+}
+
+
+class OperationStats:
+    # Latency histogram and error count for one operation.
+
+    def __init__(self, name: str):
+        self.name = name
+        self.latency = LatencyHistogram()
+        self.errors = 0
+        # Open-loop only: started after their slot, or never sent because the in-flight cap was hit.
+        self.late = 0
+        self.dropped = 0
+
+    @property
+    def count(self) -> int:
+        return self.latency.count
+
+    def record(self, latency: float, ok: bool):
+        self.latency.record(latency)
+        if not ok:
+            self.errors += 1
+
+    def merge(self, other: "OperationStats"):
+        self.latency.merge(other.latency)
+        self.errors += other.errors
+        self.late += other.late
+        self.dropped += other.dropped
+
+    def as_dict(self, elapsed: float) -> dict:
+        latency = self.latency.summary()
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "error_rate": self.errors / self.count if self.count else 0.0,
+            "late": self.late,
+            "dropped": self.dropped,
+            "throughput": self.count / elapsed if elapsed else 0.0,
+            "p50": latency["p50"],
+            "p90": latency["p90"],
+            "p99": latency["p99"],
+            "max": latency["max"]
+        }
+
+
+class LoadReport:
+
+    def __init__(self, stats: dict, elapsed: float, concurrency: int, rate: float | None = None):
+        self.stats = stats
+        self.elapsed = elapsed
+        self.concurrency = concurrency
+        self.rate = rate
+
+    @property
+    def total(self) -> int:
+        return sum(s.count for s in self.stats.values())
+
+    @property
+    def errors(self) -> int:
+        return sum(s.errors for s in self.stats.values())
+
+    @property
+    def late(self) -> int:
+        return sum(s.late for s in self.stats.values())
+
+    @property
+    def dropped(self) -> int:
+        return sum(s.dropped for s in self.stats.values())
+
+    def as_dict(self) -> dict:
+        return {
+            "mode": "closed" if self.rate is None else "open",
+            "target_rate": self.rate,
+            "elapsed": self.elapsed,
+            "concurrency": self.concurrency,
+            "total": self.total,
+            "errors": self.errors,
+            "late": self.late,
+            "dropped": self.dropped,
+            "throughput": self.total / self.elapsed if self.elapsed else 0.0,
+            "operations": {name: s.as_dict(self.elapsed) for name, s in self.stats.items()}
+        }
+
+    def summary(self) -> str:
+        data = self.as_dict()
+        if self.rate is None:
+            header = f"{data['total']} requests in {data['elapsed']:.1f}s at concurrency {data['concurrency']} "
+        else:
+            header = (f"{data['total']} requests in {data['elapsed']:.1f}s at target {self.rate:g} req/s, "
+                      f"max {data['concurrency']} in flight ({data['late']} late, {data['dropped']} dropped) ")
+        lines = [
+            header + f"({data['throughput']:.1f} req/s, {data['errors']} errors)",
+            f"{'operation':<10}{'count':>8}{'req/s':>9}{'err%':>7}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+        ]
+        for name, op in data["operations"].items():
+            lines.append(
+                f"{name:<10}{op['count']:>8}{op['throughput']:>9.1f}{op['error_rate'] * 100:>7.1f}"
+                f"{op['p50'] * 1000:>9.1f}{op['p90'] * 1000:>9.1f}{op['p99'] * 1000:>9.1f}{op['max'] * 1000:>9.1f}"
+            )
+        return "\n".join(lines)
+
+
+class LoadRunner:
+    # Load generator for the weighted operation mix.
+    # Closed loop (rate=None): `concurrency` workers run operations back to back
+    # until `duration` seconds have passed, so throughput follows the server.
+    # Open loop (rate=N): operations are scheduled at N per second on a fixed
+    # timeline and latency is measured from the scheduled send time, so server
+    # stalls show up as latency instead of silently lowering the request rate.
+    # `concurrency` then caps requests in flight; slots past the cap are dropped.
+
+    def __init__(self, mix: dict | None = None, concurrency: int = 4, duration: float = 10.0,
+                 base_url: str | None = None, token_provider=None, rate: float | None = None,
+                 validate: bool = False, seed: int | None = None):
+        self.mix = mix or DEFAULT_MIX
+        unknown = set(self.mix) - set(OPERATIONS)
+        if unknown:
+            raise ValueError(f"Unknown operations in mix: {sorted(unknown)}")
+
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.concurrency = concurrency
+        self.duration = duration
+        self.rate = rate
+        self.validate = validate
+        self.base_url = base_url or config.BASE_URL
+        self.token_provider = token_provider or TokenProvider(base_url=self.base_url)
+        # Load traffic has its own OperationStats; keep it out of the session latency report.
+        self.metrics = MetricsRegistry()
+        seed = config.PAYLOAD_SEED if seed is None else seed
+        self.ids = BookingIds(PayloadStream(BookingPayloadGenerator(seed=seed)))
+
+    def _client(self) -> APIClient:
+        return APIClient(base_url=self.base_url, token_provider=self.token_provider, metrics_registry=self.metrics)
+
+    def _new_stats(self) -> dict:
+        # "delete" falls back to "create" when nothing is disposable, so it needs a slot too.
+        names = list(self.mix) + (["create"] if "delete" in self.mix and "create" not in self.mix else [])
+        return {name: OperationStats(name) for name in names}
+
+    def _execute(self, name: str, client) -> tuple:
+        # Returns (name the call is recorded under, ok).
+        try:
+            response, ok = OPERATIONS[name](client, self.ids)
+            if name == "delete" and response is None:
+                # Keeps delete percentiles free of POST timings.
+                name = "create"
+                response, ok = op_create(client, self.ids)
+            schema = RESPONSE_SCHEMAS.get(name)
+            if ok and self.validate and schema:
+                ok = schema_registry.is_valid(schema, response.json())
+        except Exception:
+            ok = False
+        return name, ok
+
+    def _seed(self):
+        client = self._client()
+        for _ in range(SEED_BOOKINGS):
+            booking_id, _ = create_booking(client, self.ids.payloads.next())
+            self.ids.seed(booking_id)
+
+    def _worker(self, deadline: float, stats: dict):
+        client = self._client()
+        names = list(self.mix)
+        weights = [self.mix[n] for n in names]
+
+        while time.perf_counter() < deadline:
+            name = random.choices(names, weights)[0]
+            started = time.perf_counter()
+            name, ok = self._execute(name, client)
+            stats[name].record(time.perf_counter() - started, ok)
+
+    def _run_open_loop(self, stats: dict) -> float:
+        names = list(self.mix)
+        weights = [self.mix[n] for n in names]
+        lock = threading.Lock()
+        in_flight = [0]
+        local = threading.local()
+
+        def execute(name: str, intended: float):
+            if not hasattr(local, "client"):
+                local.client = self._client()
+            late = time.perf_counter() - intended > LATE_THRESHOLD
+            name, ok = self._execute(name, local.client)
+            # Latency from the scheduled send time, not from when a thread got to it.
+            latency = time.perf_counter() - intended
+            with lock:
+                stats[name].record(latency, ok)
+                if late:
+                    stats[name].late += 1
+                in_flight[0] -= 1
+
+        interval = 1.0 / self.rate
+        started = time.perf_counter()
+        total_slots = int(self.duration * self.rate)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            for i in range(total_slots):
+                intended = started + i * interval
+                delay = intended - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+                name = random.choices(names, weights)[0]
+                with lock:
+                    if in_flight[0] >= self.concurrency:
+                        stats[name].dropped += 1
+                        continue
+                    in_flight[0] += 1
+                pool.submit(execute, name, intended)
+
+        return time.perf_counter() - started
+
+    def run(self) -> LoadReport:
+        self._seed()
+
+        if self.rate is not None:
+            stats = self._new_stats()
+            elapsed = self._run_open_loop(stats)
+            return LoadReport(stats, elapsed, self.concurrency, rate=self.rate)
+
+        per_worker = [self._new_stats() for _ in range(self.concurrency)]
+        started = time.perf_counter()
+        deadline = started + self.duration
+
+        threads = [
+            threading.Thread(target=self._worker, args=(deadline, stats), daemon=True)
+            for stats in per_worker
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - started
+
+        merged = self._new_stats()
+        for stats in per_worker:
+            for name, op_stats in stats.items():
+                merged[name].merge(op_stats)
+        return LoadReport(merged, elapsed, self.concurrency)
+
+
+def parse_mix(value: str) -> dict:
+    # "create=2,get=4" -> {"create": 2, "get": 4}
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a weighted booking workload and report latency percentiles.")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="Workers in closed-loop mode, max requests in flight with --rate.")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="Open-loop mode: schedule this many requests per second.")
+    parser.add_argument("--mix", type=parse_mix, default=None, help="e.g. create=2,get=4,filter=1")
+    parser.add_argument("--validate", action="store_true",
+                        help="Validate every response against its JSON schema.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the generated booking payloads.")
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--local-server", action="store_true", help="Target an in-process stand-in.")
+    parser.add_argument("--server-workers", type=int, default=1,
+                        help="With --local-server, run the stand-in across this many processes.")
+    parser.add_argument("--preload", type=int, default=0,
+                        help="With --local-server, seed the stand-in with this many bookings first.")
+    parser.add_argument("--json", dest="json_path", default=None, help="Write the report as JSON here.")
+    args = parser.parse_args(argv)
+
+    server = None
+    base_url = args.base_url
+    if args.local_server:
+        from helpers.local_server import LocalBookerServer, MultiProcessBookerServer
+        if args.server_workers > 1:
+            server = MultiProcessBookerServer(args.server_workers).start()
+        else:
+            server = LocalBookerServer().start()
+        base_url = server.url
+        if args.preload:
+            server.preload(args.preload, seed=args.seed or 0)
+
+    try:
+        report = LoadRunner(args.mix, args.concurrency, args.duration, base_url=base_url,
+                            rate=args.rate, validate=args.validate, seed=args.seed).run()
+    finally:
+        if server is not None:
+            server.stop()
+
+    print(report.summary())
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report.as_dict(), f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
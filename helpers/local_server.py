@@ -0,0 +1,741 @@
+import bisect
+import datetime
+import hmac
+import itertools
+import json
+import multiprocessing
+import secrets
+import socket
+import sys
+import threading
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.managers import BaseManager
+from urllib.parse import parse_qs, urlsplit
+
+
+ADMIN_USERNAME = "admin"
+ADMIN_PASSWORD = "password123"
+# Basic auth header accepted by Restful Booker as an alternative to the token cookie.
+ADMIN_BASIC_AUTH = "Basic YWRtaW46cGFzc3dvcmQxMjM="
+
+REQUIRED_FIELDS = ("firstname", "lastname", "totalprice", "depositpaid", "bookingdates")
+INVALID_DATE = "0NaN-aN-aN"
+# Column value for bookings created without "additionalneeds".
+_ABSENT = object()
+
+
+def _normalize_date(value) -> str:
+    # Restful Booker runs dates through JS Date, so unparsable values come back as NaN.
+    try:
+        return datetime.date.fromisoformat(str(value)).isoformat()
+    except ValueError:
+        return INVALID_DATE
+
+
+def _build_booking(payload) -> dict | None:
+    # Returns a normalized booking, or None when required fields are missing.
+    if not isinstance(payload, dict):
+        return None
+    if any(field not in payload for field in REQUIRED_FIELDS):
+        return None
+
+    dates = payload["bookingdates"]
+    if not isinstance(dates, dict) or "checkin" not in dates or "checkout" not in dates:
+        return None
+
+    booking = {
+        "firstname": payload["firstname"],
+        "lastname": payload["lastname"],
+        "totalprice": payload["totalprice"],
+        "depositpaid": payload["depositpaid"],
+        "bookingdates": {
+            "checkin": _normalize_date(dates["checkin"]),
+            "checkout": _normalize_date(dates["checkout"])
+        }
+    }
+    if "additionalneeds" in payload:
+        booking["additionalneeds"] = payload["additionalneeds"]
+    return booking
+
+
+class SortedKeyIndex:
+    # Sorted distinct keys, each with the set of booking IDs holding it. Dates
+    # repeat across bookings (a few thousand distinct days for millions of
+    # bookings), so `keys` stays short and insort is cheap. Range queries bisect
+    # to the first key and read the posting sets from there.
+
+    def __init__(self):
+        self.keys = []
+        self.postings = {}
+
+    def add(self, key: str, booking_id: int):
+        ids = self.postings.get(key)
+        if ids is None:
+            ids = self.postings[key] = set()
+            bisect.insort(self.keys, key)
+        ids.add(booking_id)
+
+    def remove(self, key: str, booking_id: int):
+        ids = self.postings[key]
+        ids.discard(booking_id)
+        if not ids:
+            del self.postings[key]
+            del self.keys[bisect.bisect_left(self.keys, key)]
+
+    def at_least(self, key: str) -> list:
+        # Posting sets of every key >= `key`.
+        return [self.postings[k] for k in self.keys[bisect.bisect_left(self.keys, key):]]
+
+
+class BookingStore:
+    # Thread-safe in-memory storage behind the local stand-in, sized for million-
+    # booking runs. Bookings are stored column-wise: booking N lives in slot N - 1
+    # of each column (IDs are never reused), names and dates are interned so equal
+    # values share one string, and `_alive` marks deleted slots. GET /booking
+    # filters go through hash indexes on firstname/lastname and sorted indexes on
+    # checkin/checkout, all updated on create/replace/delete.
+    # IDs run first_id, first_id + id_step, ...; MultiProcessBookerServer gives
+    # each worker's store its own residue class so their IDs never collide.
+
+    def __init__(self, first_id: int = 1, id_step: int = 1):
+        self._lock = threading.Lock()
+        self._tokens = set()
+        self._first_id = first_id
+        self._id_step = id_step
+
+        self._alive = bytearray()
+        self._count = 0
+        self._firstname = []
+        self._lastname = []
+        self._totalprice = []
+        self._depositpaid = []
+        self._checkin = []
+        self._checkout = []
+        self._additionalneeds = []
+
+        self._by_firstname = {}
+        self._by_lastname = {}
+        self._by_checkin = SortedKeyIndex()
+        self._by_checkout = SortedKeyIndex()
+
+    def issue_token(self) -> str:
+        token = secrets.token_hex(8)[:15]
+        with self._lock:
+            self._tokens.add(token)
+        return token
+
+    def is_valid_token(self, token: str) -> bool:
+        return token in self._tokens
+
+    def revoke_tokens(self):
+        # Simulates server-side token expiry.
+        with self._lock:
+            self._tokens.clear()
+
+    # --- columns and indexes (callers hold the lock) ---
+
+    @staticmethod
+    def _intern(value):
+        return sys.intern(value) if type(value) is str else value
+
+    def _write(self, slot: int, booking: dict):
+        dates = booking["bookingdates"]
+        self._firstname[slot] = self._intern(booking["firstname"])
+        self._lastname[slot] = self._intern(booking["lastname"])
+        self._totalprice[slot] = booking["totalprice"]
+        self._depositpaid[slot] = booking["depositpaid"]
+        self._checkin[slot] = sys.intern(dates["checkin"])
+        self._checkout[slot] = sys.intern(dates["checkout"])
+        self._additionalneeds[slot] = booking.get("additionalneeds", _ABSENT)
+
+    def _index(self, slot: int):
+        booking_id = self._first_id + slot * self._id_step
+        # Names may be any JSON value; unhashable ones are not indexed and never
+        # match a query string anyway.
+        for index, value in ((self._by_firstname, self._firstname[slot]),
+                             (self._by_lastname, self._lastname[slot])):
+            if isinstance(value, str):
+                index.setdefault(value, set()).add(booking_id)
+        self._by_checkin.add(self._checkin[slot], booking_id)
+        self._by_checkout.add(self._checkout[slot], booking_id)
+
+    def _unindex(self, slot: int):
+        booking_id = self._first_id + slot * self._id_step
+        for index, value in ((self._by_firstname, self._firstname[slot]),
+                             (self._by_lastname, self._lastname[slot])):
+            if isinstance(value, str):
+                ids = index[value]
+                ids.discard(booking_id)
+                if not ids:
+                    del index[value]
+        self._by_checkin.remove(self._checkin[slot], booking_id)
+        self._by_checkout.remove(self._checkout[slot], booking_id)
+
+    def _append(self, booking: dict) -> int:
+        slot = len(self._alive)
+        self._alive.append(1)
+        for column in (self._firstname, self._lastname, self._totalprice, self._depositpaid,
+                       self._checkin, self._checkout, self._additionalneeds):
+            column.append(None)
+        self._write(slot, booking)
+        self._index(slot)
+        self._count += 1
+        return self._first_id + slot * self._id_step
+
+    def _slot(self, booking_id) -> int | None:
+        if type(booking_id) is not int:
+            return None
+        slot, rest = divmod(booking_id - self._first_id, self._id_step)
+        if rest or not 0 <= slot < len(self._alive):
+            return None
+        return slot if self._alive[slot] else None
+
+    # --- public API ---
+
+    def create(self, booking: dict) -> int:
+        with self._lock:
+            return self._append(booking)
+
+    def create_many(self, bookings) -> list:
+        # Bulk load under a single lock acquisition, e.g. to seed a million bookings.
+        with self._lock:
+            return [self._append(booking) for booking in bookings]
+
+    def get(self, booking_id: int) -> dict | None:
+        # Rebuilt from the columns, so callers get a fresh dict every time.
+        with self._lock:
+            slot = self._slot(booking_id)
+            if slot is None:
+                return None
+            booking = {
+                "firstname": self._firstname[slot],
+                "lastname": self._lastname[slot],
+                "totalprice": self._totalprice[slot],
+                "depositpaid": self._depositpaid[slot],
+                "bookingdates": {
+                    "checkin": self._checkin[slot],
+                    "checkout": self._checkout[slot]
+                }
+            }
+            if self._additionalneeds[slot] is not _ABSENT:
+                booking["additionalneeds"] = self._additionalneeds[slot]
+        return booking
+
+    def replace(self, booking_id: int, booking: dict) -> bool:
+        with self._lock:
+            slot = self._slot(booking_id)
+            if slot is None:
+                return False
+            self._unindex(slot)
+            self._write(slot, booking)
+            self._index(slot)
+        return True
+
+    def delete(self, booking_id: int) -> bool:
+        with self._lock:
+            slot = self._slot(booking_id)
+            if slot is None:
+                return False
+            self._unindex(slot)
+            self._alive[slot] = 0
+            self._count -= 1
+            # Drop the references so deleted bookings do not pin their values.
+            self._totalprice[slot] = self._depositpaid[slot] = self._additionalneeds[slot] = None
+        return True
+
+    def filter(self, firstname=None, lastname=None, checkin=None, checkout=None) -> list:
+        # Same semantics as GET /booking: exact names, dates on or after the given
+        # day (compared as ISO strings), IDs in ascending order.
+        with self._lock:
+            if firstname is None and lastname is None and checkin is None and checkout is None:
+                ids = range(self._first_id, self._first_id + len(self._alive) * self._id_step, self._id_step)
+                return list(itertools.compress(ids, self._alive))
+
+            # Name filters intersect their hash-index sets. Otherwise the smaller
+            # date range supplies the candidates. Only predicates not already
+            # satisfied by the candidates are checked per booking.
+            names = []
+            if firstname is not None:
+                names.append(self._by_firstname.get(firstname, set()))
+            if lastname is not None:
+                names.append(self._by_lastname.get(lastname, set()))
+            ranges = []
+            if checkin is not None:
+                ranges.append((self._checkin, checkin, self._by_checkin.at_least(checkin)))
+            if checkout is not None:
+                ranges.append((self._checkout, checkout, self._by_checkout.at_least(checkout)))
+
+            if names:
+                candidates = set.intersection(*names) if len(names) > 1 else names[0]
+            else:
+                ranges.sort(key=lambda r: sum(map(len, r[2])))
+                candidates = itertools.chain.from_iterable(ranges.pop(0)[2])
+
+            result = list(candidates)
+            first, step = self._first_id, self._id_step
+            for column, key, _ in ranges:
+                result = [booking_id for booking_id in result if column[(booking_id - first) // step] >= key]
+        result.sort()
+        return result
+
+    def __len__(self):
+        return self._count
+
+    def size(self) -> int:
+        # len() for callers holding a multiprocessing proxy, which has no __len__.
+        return self._count
+
+
+class BookerRequestHandler(BaseHTTPRequestHandler):
+    # Mirrors the status codes and bodies of https://restful-booker.herokuapp.com.
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; avoid Nagle + delayed ACK stalls.
+    disable_nagle_algorithm = True
+    server_version = "Cowboy"
+    sys_version = ""
+
+    @property
+    def store(self) -> BookingStore:
+        return self.server.store
+
+    def log_message(self, format, *args):
+        # Keep pytest output clean.
+        pass
+
+    # --- Response helpers ---
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_text(self, status: int, text: str):
+        self._send(status, text.encode("utf-8"), "text/plain; charset=utf-8")
+
+    def _send_json(self, status: int, data):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self._send(status, body, "application/json; charset=utf-8")
+
+    # --- Request helpers ---
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if not raw:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    def _is_authorized(self) -> bool:
+        if self.headers.get("Authorization") == ADMIN_BASIC_AUTH:
+            return True
+
+        cookie = SimpleCookie()
+        try:
+            cookie.load(self.headers.get("Cookie") or "")
+        except Exception:
+            return False
+        token = cookie.get("token")
+        return token is not None and self.store.is_valid_token(token.value)
+
+    def _route(self):
+        # Returns (path, booking_id_segment, query).
+        parts = urlsplit(self.path)
+        segments = [s for s in parts.path.split("/") if s]
+        query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+
+        if len(segments) == 2 and segments[0] == "booking":
+            return "/booking/{id}", segments[1], query
+        return "/" + "/".join(segments), None, query
+
+    @staticmethod
+    def _parse_id(raw) -> int | None:
+        try:
+            return int(raw)
+        except (TypeError, ValueError):
+            return None
+
+    # --- Verbs ---
+
+    def do_GET(self):
+        route, raw_id, query = self._route()
+        self._read_json()
+
+        if route == "/ping":
+            return self._send_text(201, "Created")
+
+        if route == "/booking":
+            ids = self.store.filter(
+                firstname=query.get("firstname"),
+                lastname=query.get("lastname"),
+                checkin=query.get("checkin"),
+                checkout=query.get("checkout")
+            )
+            return self._send_json(200, [{"bookingid": i} for i in ids])
+
+        if route == "/booking/{id}":
+            booking = self.store.get(self._parse_id(raw_id))
+            if booking is None:
+                return self._send_text(404, "Not Found")
+            return self._send_json(200, booking)
+
+        self._send_text(404, "Not Found")
+
+    def do_POST(self):
+        route, _, _ = self._route()
+        payload = self._read_json()
+
+        if route == "/auth":
+            payload = payload if isinstance(payload, dict) else {}
+            if payload.get("username") == ADMIN_USERNAME and payload.get("password") == ADMIN_PASSWORD:
+                return self._send_json(200, {"token": self.store.issue_token()})
+            return self._send_json(200, {"reason": "Bad credentials"})
+
+        if route == "/booking":
+            booking = _build_booking(payload)
+            if booking is None:
+                return self._send_text(500, "Internal Server Error")
+            booking_id = self.store.create(booking)
+            return self._send_json(200, {"bookingid": booking_id, "booking": booking})
+
+        self._send_text(404, "Not Found")
+
+    def do_PUT(self):
+        route, raw_id, _ = self._route()
+        payload = self._read_json()
+
+        if route != "/booking/{id}":
+            return self._send_text(404, "Not Found")
+        if not self._is_authorized():
+            return self._send_text(403, "Forbidden")
+
+        booking_id = self._parse_id(raw_id)
+        if self.store.get(booking_id) is None:
+            return self._send_text(405, "Method Not Allowed")
+
+        booking = _build_booking(payload)
+        if booking is None:
+            return self._send_text(400, "Bad Request")
+
+        self.store.replace(booking_id, booking)
+        self._send_json(200, booking)
+
+    def do_PATCH(self):
+        route, raw_id, _ = self._route()
+        payload = self._read_json()
+
+        if route != "/booking/{id}":
+            return self._send_text(404, "Not Found")
+        if not self._is_authorized():
+            return self._send_text(403, "Forbidden")
+
+        booking_id = self._parse_id(raw_id)
+        current = self.store.get(booking_id)
+        if current is None:
+            return self._send_text(405, "Method Not Allowed")
+
+        merged = {**current, **(payload if isinstance(payload, dict) else {})}
+        if isinstance(merged.get("bookingdates"), dict):
+            merged["bookingdates"] = {**current["bookingdates"], **merged["bookingdates"]}
+
+        booking = _build_booking(merged)
+        if booking is None:
+            return self._send_text(400, "Bad Request")
+
+        self.store.replace(booking_id, booking)
+        self._send_json(200, booking)
+
+    def do_DELETE(self):
+        route, raw_id, _ = self._route()
+        self._read_json()
+
+        if route != "/booking/{id}":
+            return self._send_text(404, "Not Found")
+        if not self._is_authorized():
+            return self._send_text(403, "Forbidden")
+
+        if not self.store.delete(self._parse_id(raw_id)):
+            return self._send_text(405, "Method Not Allowed")
+        self._send_text(201, "Created")
+
+
+class LocalBookerServer:
+    # In-process Restful Booker stand-in running on a background thread.
+    # Usage:
+    #     with LocalBookerServer() as server:
+    #         APIClient(base_url=server.url).get("/ping")
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self.store = BookingStore()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def preload(self, count: int, seed: int = 0, batch_size: int = 10_000) -> int:
+        # Seeds the store with `count` generated bookings without going through HTTP,
+        # e.g. a million of them before a filter benchmark. Returns the store size.
+        from helpers.booking_payloads import generate_bookings
+
+        bookings = (_build_booking(payload) for payload in generate_bookings(count, seed=seed))
+        # Batched so a store proxy (MultiProcessBookerServer) gets picklable lists.
+        while batch := list(itertools.islice(bookings, batch_size)):
+            self.store.create_many(batch)
+        return self.store.size()
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer((self.host, self.port), BookerRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.store = self.store
+        self.port = self._httpd.server_address[1]
+
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            name="local-booker",
+            daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+        self._httpd = None
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class _WorkerManager(BaseManager):
+    # Serves one worker's BookingStore to the other workers and to the parent.
+    pass
+
+
+# Client side; each worker registers "store" again with its own instance.
+_WorkerManager.register("store")
+
+
+class PartitionedStore:
+    # BookingStore interface over the per-worker stores of MultiProcessBookerServer.
+    #
+    # Booking N belongs to worker (N - 1) % workers (see BookingStore's first_id
+    # and id_step). A worker creates bookings in its own store and reaches the
+    # others only for IDs they own and for GET /booking, which merges every
+    # store's matches. `stores[i]` is worker i's store: the object itself inside
+    # that worker, a manager proxy everywhere else.
+    #
+    # Tokens are not stored at all: they are signed with a key every worker
+    # holds, so any worker validates any token locally. revoke_tokens() bumps a
+    # shared generation counter that is part of every signature.
+
+    def __init__(self, stores: list, token_key: bytes, generation, local: int | None = None):
+        self.stores = stores
+        self.local = local
+        self._token_key = token_key
+        self._generation = generation
+        self._next = itertools.count()
+
+    def _owner(self, booking_id):
+        if type(booking_id) is not int or booking_id < 1:
+            return None
+        return self.stores[(booking_id - 1) % len(self.stores)]
+
+    def _target(self):
+        # Where new bookings go: this worker's store, or round-robin from the parent.
+        if self.local is not None:
+            return self.stores[self.local]
+        return self.stores[next(self._next) % len(self.stores)]
+
+    def _sign(self, nonce: str) -> str:
+        message = f"{nonce}:{self._generation.value}".encode()
+        return hmac.new(self._token_key, message, "sha256").hexdigest()[:8]
+
+    def issue_token(self) -> str:
+        # 15 hex characters, like Restful Booker's tokens.
+        nonce = secrets.token_hex(4)[:7]
+        return nonce + self._sign(nonce)
+
+    def is_valid_token(self, token: str) -> bool:
+        if type(token) is not str or len(token) != 15:
+            return False
+        return hmac.compare_digest(token[7:], self._sign(token[:7]))
+
+    def revoke_tokens(self):
+        with self._generation.get_lock():
+            self._generation.value += 1
+
+    def create(self, booking: dict) -> int:
+        return self._target().create(booking)
+
+    def create_many(self, bookings) -> list:
+        if self.local is not None:
+            return self.stores[self.local].create_many(bookings)
+        # Bulk loads from the parent (preload) are spread over every worker.
+        bookings = list(bookings)
+        count = len(self.stores)
+        return [booking_id for index, store in enumerate(self.stores)
+                for booking_id in store.create_many(bookings[index::count])]
+
+    def get(self, booking_id: int) -> dict | None:
+        store = self._owner(booking_id)
+        return store.get(booking_id) if store is not None else None
+
+    def replace(self, booking_id: int, booking: dict) -> bool:
+        store = self._owner(booking_id)
+        return store is not None and store.replace(booking_id, booking)
+
+    def delete(self, booking_id: int) -> bool:
+        store = self._owner(booking_id)
+        return store is not None and store.delete(booking_id)
+
+    def filter(self, firstname=None, lastname=None, checkin=None, checkout=None) -> list:
+        result = []
+        for store in self.stores:
+            result.extend(store.filter(firstname, lastname, checkin, checkout))
+        result.sort()
+        return result
+
+    def size(self) -> int:
+        return sum(store.size() for store in self.stores)
+
+    def __len__(self):
+        return self.size()
+
+
+def _connect_stores(addresses: list, authkey: bytes, local=None) -> list:
+    stores = []
+    for index, address in enumerate(addresses):
+        if index == local:
+            stores.append(None)
+            continue
+        manager = _WorkerManager(address=address, authkey=authkey)
+        manager.connect()
+        stores.append(manager.store())
+    return stores
+
+
+class _ReusePortHTTPServer(ThreadingHTTPServer):
+    # One per worker process; every worker binds the same port and the kernel
+    # spreads incoming connections across them.
+    daemon_threads = True
+
+    def server_bind(self):
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
+def _serve_worker(index: int, workers: int, host: str, port: int, authkey: bytes, token_key: bytes,
+                  generation, conn, ready):
+    # Worker process entry point; runs until the parent terminates it.
+    store = BookingStore(first_id=index + 1, id_step=workers)
+    _WorkerManager.register("store", callable=lambda: store)
+    manager_server = _WorkerManager(address=(host, 0), authkey=authkey).get_server()
+    threading.Thread(target=manager_server.serve_forever, name="store-server", daemon=True).start()
+
+    # Tell the parent where this store is served, then learn where the others are.
+    conn.send(manager_server.address)
+    stores = _connect_stores(conn.recv(), authkey, local=index)
+    stores[index] = store
+
+    httpd = _ReusePortHTTPServer((host, port), BookerRequestHandler)
+    httpd.store = PartitionedStore(stores, token_key, generation, local=index)
+    ready.release()
+    httpd.serve_forever()
+
+
+class MultiProcessBookerServer(LocalBookerServer):
+    # The stand-in spread over `workers` processes listening on one SO_REUSEPORT
+    # port, so HTTP parsing, JSON encoding and store work all scale with cores
+    # and the server stops being the bottleneck of client-side throughput runs.
+    # Booking state is partitioned, not centralized: every worker owns the IDs
+    # in its own residue class and the bookings created through it, and serves
+    # its store to the others through a multiprocessing manager, so a booking
+    # created through one worker is still visible through all of them (see
+    # PartitionedStore). `store` is a PartitionedStore over those proxies, so
+    # fixtures and tests use it exactly like LocalBookerServer.store (use
+    # store.size() instead of len()). Needs SO_REUSEPORT (Linux, BSD, macOS).
+
+    def __init__(self, workers: int = 2, host: str = "127.0.0.1", port: int = 0,
+                 start_timeout: float = 30):
+        super().__init__(host, port)
+        if not hasattr(socket, "SO_REUSEPORT"):
+            raise RuntimeError("MultiProcessBookerServer needs SO_REUSEPORT, which this platform lacks")
+        self.workers = workers
+        self.start_timeout = start_timeout
+        self.store = None
+        self._context = multiprocessing.get_context("spawn")
+        self._placeholder = None
+        self._processes = []
+
+    def start(self):
+        # Reserves the port (bound, never listening) so port=0 resolves to one
+        # number every worker can join, and nothing else grabs it meanwhile.
+        self._placeholder = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._placeholder.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        self._placeholder.bind((self.host, self.port))
+        self.port = self._placeholder.getsockname()[1]
+
+        authkey, token_key = secrets.token_bytes(16), secrets.token_bytes(16)
+        generation = self._context.Value("i", 0)
+        ready = self._context.Semaphore(0)
+        pipes = []
+        for index in range(self.workers):
+            parent_end, child_end = self._context.Pipe()
+            process = self._context.Process(
+                target=_serve_worker,
+                args=(index, self.workers, self.host, self.port, authkey, token_key, generation, child_end, ready),
+                name=f"local-booker-{index}",
+                daemon=True
+            )
+            process.start()
+            self._processes.append(process)
+            pipes.append(parent_end)
+
+        try:
+            addresses = []
+            for conn in pipes:
+                if not conn.poll(self.start_timeout):
+                    raise RuntimeError(f"Stand-in workers did not start within {self.start_timeout}s")
+                addresses.append(conn.recv())
+            for conn in pipes:
+                conn.send(addresses)
+            for _ in range(self.workers):
+                if not ready.acquire(timeout=self.start_timeout):
+                    raise RuntimeError(f"Stand-in workers did not start within {self.start_timeout}s")
+        except BaseException:
+            self.stop()
+            raise
+        finally:
+            for conn in pipes:
+                conn.close()
+
+        self.store = PartitionedStore(_connect_stores(addresses, authkey), token_key, generation)
+        return self
+
+    def stop(self):
+        for process in self._processes:
+            process.terminate()
+        for process in self._processes:
+            process.join()
+        self._processes = []
+        if self._placeholder is not None:
+            self._placeholder.close()
+            self._placeholder = None
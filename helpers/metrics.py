@@ -0,0 +1,256 @@
+import json
+import math
+import re
+import threading
+
+
+# 2**7 = 128 sub-buckets per power of two keeps the relative error under 1%.
+SUB_BUCKET_BITS = 7
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+
+# Concrete paths are aggregated under their route template.
+ROUTE_TEMPLATES = [
+    (re.compile(r"^/booking/[^/]+$"), "/booking/{id}"),
+]
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def route_template(path: str) -> str:
+    # "/booking/123?x=1" -> "/booking/{id}"
+    path = path.split("?", 1)[0] or "/"
+    for pattern, template in ROUTE_TEMPLATES:
+        if pattern.match(path):
+            return template
+    return _NUMERIC_SEGMENT.sub("/{id}", path)
+
+
+def _bucket_index(value: int) -> int:
+    # Values below SUB_BUCKET_COUNT get exact buckets; above that each power of
+    # two is split into SUB_BUCKET_COUNT equal sub-buckets.
+    if value < SUB_BUCKET_COUNT:
+        return value
+    shift = value.bit_length() - 1 - SUB_BUCKET_BITS
+    return (shift << SUB_BUCKET_BITS) + (value >> shift)
+
+
+def _bucket_upper_bound(index: int) -> int:
+    # Highest value that lands in `index`.
+    shift = max((index >> SUB_BUCKET_BITS) - 1, 0)
+    mantissa = index - (shift << SUB_BUCKET_BITS)
+    return ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    # HDR-style log-bucketed latency histogram.
+    # Samples are recorded in seconds and stored as microsecond buckets, so memory
+    # depends on the spread of latencies, never on the number of samples.
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def record(self, seconds: float):
+        value = max(int(seconds * 1_000_000), 0)
+        index = _bucket_index(value)
+        with self._lock:
+            self._buckets[index] = self._buckets.get(index, 0) + 1
+            self.count += 1
+            self.total += value
+            if self.min is None or value < self.min:
+                self.min = value
+            if value > self.max:
+                self.max = value
+
+    def merge(self, other: "LatencyHistogram"):
+        with other._lock:
+            buckets = dict(other._buckets)
+            count, total, low, high = other.count, other.total, other.min, other.max
+        with self._lock:
+            for index, n in buckets.items():
+                self._buckets[index] = self._buckets.get(index, 0) + n
+            self.count += count
+            self.total += total
+            if low is not None and (self.min is None or low < self.min):
+                self.min = low
+            self.max = max(self.max, high)
+
+    def percentile(self, q: float) -> float:
+        # Latency in seconds at percentile q (0-100); the bucket's upper bound, capped at max.
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(math.ceil(self.count * q / 100), 1)
+            seen = 0
+            for index in sorted(self._buckets):
+                seen += self._buckets[index]
+                if seen >= rank:
+                    return min(_bucket_upper_bound(index), self.max) / 1_000_000
+            return self.max / 1_000_000
+
+    def to_dict(self) -> dict:
+        # Plain-data form (e.g. to ship from a pytest-xdist worker to the controller).
+        with self._lock:
+            return {
+                "buckets": sorted(self._buckets.items()),
+                "count": self.count,
+                "total": self.total,
+                "min": self.min,
+                "max": self.max
+            }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        histogram = cls()
+        histogram._buckets = {int(index): n for index, n in data["buckets"]}
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        return histogram
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count / 1_000_000 if self.count else 0.0
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max / 1_000_000
+        }
+
+
+class MetricsRegistry:
+    # Latency histograms keyed by (HTTP method, route template), plus per-phase
+    # histograms when requests carry phase timings (see helpers/phase_timing.py)
+    # and retry counts / backoff seconds (see helpers/retry.py).
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._phases = {}
+        self._retries = {}
+
+    def histogram(self, method: str, path: str) -> LatencyHistogram:
+        key = (method.upper(), route_template(path))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, LatencyHistogram())
+        return histogram
+
+    def record(self, method: str, path: str, seconds: float):
+        self.histogram(method, path).record(seconds)
+
+    def record_phases(self, method: str, path: str, timings: dict):
+        key = (method.upper(), route_template(path))
+        phases = self._phases.get(key)
+        if phases is None:
+            with self._lock:
+                phases = self._phases.setdefault(key, {})
+        for phase, seconds in timings.items():
+            if isinstance(seconds, bool):
+                continue
+            histogram = phases.get(phase)
+            if histogram is None:
+                with self._lock:
+                    histogram = phases.setdefault(phase, LatencyHistogram())
+            histogram.record(seconds)
+
+    def record_retry(self, method: str, path: str, waited: float):
+        key = (method.upper(), route_template(path))
+        with self._lock:
+            count, total = self._retries.get(key, (0, 0.0))
+            self._retries[key] = (count + 1, total + waited)
+
+    def retry_totals(self) -> tuple:
+        # (retries, seconds spent in backoff) across every endpoint.
+        with self._lock:
+            values = list(self._retries.values())
+        return sum(count for count, _ in values), sum(waited for _, waited in values)
+
+    def items(self):
+        with self._lock:
+            return sorted(self._histograms.items())
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._phases.clear()
+            self._retries.clear()
+
+    def export(self) -> dict:
+        # Every histogram as plain data; the inverse of merge_export().
+        with self._lock:
+            histograms = list(self._histograms.items())
+            phases = [(key, dict(by_phase)) for key, by_phase in self._phases.items()]
+            retries = list(self._retries.items())
+        return {
+            "histograms": [[method, route, h.to_dict()] for (method, route), h in histograms],
+            "phases": [
+                [method, route, phase, h.to_dict()]
+                for (method, route), by_phase in phases for phase, h in by_phase.items()
+            ],
+            "retries": [[method, route, count, waited] for (method, route), (count, waited) in retries]
+        }
+
+    def merge_export(self, data: dict):
+        for method, route, histogram in data["histograms"]:
+            self.histogram(method, route).merge(LatencyHistogram.from_dict(histogram))
+        for method, route, phase, histogram in data["phases"]:
+            with self._lock:
+                target = self._phases.setdefault((method, route), {}).setdefault(phase, LatencyHistogram())
+            target.merge(LatencyHistogram.from_dict(histogram))
+        for method, route, count, waited in data.get("retries", []):
+            with self._lock:
+                old_count, old_waited = self._retries.get((method, route), (0, 0.0))
+                self._retries[(method, route)] = (old_count + count, old_waited + waited)
+
+    def phase_summary(self, method: str, route: str) -> dict:
+        phases = self._phases.get((method, route), {})
+        return {
+            phase: {"p50": h.percentile(50), "p90": h.percentile(90), "p99": h.percentile(99)}
+            for phase, h in phases.items()
+        }
+
+    def summary(self) -> dict:
+        # {"GET /booking/{id}": {"count": ..., "p50": ..., ..., "phases": {...}}, ...}
+        result = {}
+        for (method, route), histogram in self.items():
+            entry = histogram.summary()
+            phases = self.phase_summary(method, route)
+            if phases:
+                entry["phases"] = phases
+            if (method, route) in self._retries:
+                entry["retries"], entry["backoff"] = self._retries[(method, route)]
+            result[f"{method} {route}"] = entry
+        return result
+
+    def summary_text(self) -> str:
+        lines = [f"{'endpoint':<28}{'count':>8}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'max ms':>9}"]
+        for name, s in self.summary().items():
+            lines.append(
+                f"{name:<28}{s['count']:>8}{s['p50'] * 1000:>9.1f}{s['p90'] * 1000:>9.1f}"
+                f"{s['p99'] * 1000:>9.1f}{s['max'] * 1000:>9.1f}"
+            )
+            if "phases" in s:
+                phases = "  ".join(f"{phase} {v['p50'] * 1000:.1f}" for phase, v in s["phases"].items())
+                lines.append(f"    p50 ms by phase: {phases}")
+            if "retries" in s:
+                lines.append(f"    retries: {s['retries']}, {s['backoff']:.2f}s in backoff")
+        return "\n".join(lines)
+
+    def write_json(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+
+
+# Process-wide registry every APIClient records into by default.
+registry = MetricsRegistry()
@@ -0,0 +1,257 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from config import config
+from helpers.api_client import APIClient
+from helpers.booking_helpers import create_booking
+from helpers.booking_payloads import generate_bookings, valid_booking_payload
+from helpers.cleanup import created_bookings
+from helpers.metrics import MetricsRegistry
+from helpers.responses import APIResponse
+from helpers.schemas import assert_matches
+from helpers.streaming import stream_booking_ids
+
+
+# Host the mock transport answers for; nothing ever resolves it.
+MOCK_BASE_URL = "http://bench.invalid"
+
+# Bookings in the canned GET /booking list.
+LIST_SIZE = 100
+
+
+def _json_bytes(data) -> bytes:
+    return json.dumps(data).encode("utf-8")
+
+
+class MockTransportAdapter(BaseAdapter):
+    # requests transport adapter that answers Restful Booker routes from canned
+    # bodies without touching a socket, so benchmarks see only client-side cost.
+
+    def __init__(self, booking: dict | None = None, list_size: int = LIST_SIZE):
+        super().__init__()
+        booking = booking or valid_booking_payload()
+        self.bodies = {
+            ("POST", "/booking"): (200, _json_bytes({"bookingid": 1, "booking": booking})),
+            ("GET", "/booking"): (200, _json_bytes([{"bookingid": i} for i in range(1, list_size + 1)])),
+            ("GET", "/booking/{id}"): (200, _json_bytes(booking)),
+            ("PUT", "/booking/{id}"): (200, _json_bytes(booking)),
+            ("PATCH", "/booking/{id}"): (200, _json_bytes(booking)),
+            ("DELETE", "/booking/{id}"): (201, b"Created"),
+            ("GET", "/ping"): (201, b"Created"),
+            ("POST", "/auth"): (200, _json_bytes({"token": "abc123"}))
+        }
+        self.calls = 0
+
+    def send(self, request, stream=False, **kwargs):
+        self.calls += 1
+        path = request.path_url.split("?", 1)[0]
+        route = "/booking/{id}" if path.startswith("/booking/") else path
+        status, body = self.bodies.get((request.method, route), (404, b"Not Found"))
+
+        response = requests.Response()
+        response.status_code = status
+        response.reason = "OK" if status < 400 else "Not Found"
+        response.headers = CaseInsensitiveDict({
+            "Content-Type": "application/json; charset=utf-8" if body[:1] in (b"{", b"[") else "text/plain",
+            "Content-Length": str(len(body))
+        })
+        response._content = body
+        response._content_consumed = True
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
+
+
+def mock_client(token: str | None = "abc123") -> APIClient:
+    # APIClient wired to MockTransportAdapter, with its own metrics registry so
+    # benchmark calls stay out of the session latency report, and no cassette.
+    client = APIClient(token=token, base_url=MOCK_BASE_URL, metrics_registry=MetricsRegistry(), cassette=False)
+    client.session.mount(MOCK_BASE_URL + "/", MockTransportAdapter())
+    return client
+
+
+def _raw_response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response._content_consumed = True
+    response.encoding = "utf-8"
+    return response
+
+
+def benchmarks(client: APIClient) -> dict:
+    # name -> zero-argument callable timed per call. `client` is either a mock
+    # client or one pointed at a local stand-in.
+    payload = valid_booking_payload()
+    booking_id = create_booking(client, payload)[0] or 1
+    generator = iter(generate_bookings(seed=1))
+    booking_body = _json_bytes(payload)
+    list_body = _json_bytes([{"bookingid": i} for i in range(1, LIST_SIZE + 1)])
+    booking_list = json.loads(list_body)
+
+    return {
+        # --- APIClient per-call overhead ---
+        "client.headers": lambda: client._headers(),
+        "client.get": lambda: client.get(f"/booking/{booking_id}"),
+        "client.get_list": lambda: client.get("/booking", params={"firstname": payload["firstname"]}),
+        "client.post": lambda: client.post("/booking", json=payload),
+        "client.put": lambda: client.put(f"/booking/{booking_id}", json=payload),
+        "client.patch": lambda: client.patch(f"/booking/{booking_id}", json={"firstname": "Bench"}),
+        "client.delete": lambda: client.delete("/booking/999999999"),
+        "helpers.create_booking": lambda: create_booking(client, payload),
+        # --- Payload builders ---
+        "payloads.valid_booking_payload": valid_booking_payload,
+        "payloads.generator": lambda: next(generator),
+        # --- Schema validation ---
+        "schemas.booking": lambda: assert_matches("booking", payload),
+        "schemas.booking_list": lambda: assert_matches("booking_list", booking_list),
+        # --- Response parsing ---
+        "responses.json": lambda: APIResponse(_raw_response(booking_body)).json(),
+        "responses.booking_ids": lambda: APIResponse(_raw_response(list_body)).booking_ids,
+        "streaming.booking_ids": lambda: sum(1 for _ in stream_booking_ids(_raw_response(list_body)))
+    }
+
+
+def measure(fn, min_time: float = 0.2, repeats: int = 5) -> dict:
+    # timeit-style: calibrate the loop count to take about `min_time`, then time
+    # `repeats` such loops. The minimum is the least noisy estimate of the cost.
+    timer = timeit.Timer(fn)
+    number = 1
+    while (elapsed := timer.timeit(number)) < min_time / 10:
+        number *= 10
+    number = max(1, int(number * min_time / elapsed))
+    per_call = [total / number for total in timer.repeat(repeats, number)]
+    return {
+        "min_us": min(per_call) * 1e6,
+        "median_us": statistics.median(per_call) * 1e6,
+        "calls": number * repeats
+    }
+
+
+def run(transport: str = "mock", only: str | None = None, min_time: float = 0.2, repeats: int = 5) -> dict:
+    # Runs every benchmark whose name contains `only` and returns the JSON report.
+    server = None
+    if transport == "local":
+        from helpers.local_server import LocalBookerServer
+        server = LocalBookerServer().start()
+        client = APIClient(base_url=server.url, metrics_registry=MetricsRegistry())
+        client.token = server.store.issue_token()
+    elif transport == "mock":
+        client = mock_client()
+    else:
+        raise ValueError(f"Unknown transport '{transport}', expected 'mock' or 'local'")
+
+    try:
+        results = {
+            name: measure(fn, min_time, repeats)
+            for name, fn in benchmarks(client).items()
+            if only is None or only in name
+        }
+    finally:
+        # Mock and stand-in bookings vanish with the run; keep them out of session cleanup.
+        created_bookings.forget(client.base_url)
+        if server is not None:
+            server.stop()
+
+    return {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "transport": transport,
+        "benchmarks": results
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> list:
+    # One row per benchmark: (name, baseline_us, current_us, ratio, regressed).
+    # Benchmarks missing from the baseline are reported with no ratio and never fail.
+    rows = []
+    known = baseline.get("benchmarks", {})
+    for name, result in report["benchmarks"].items():
+        current = result["min_us"]
+        if name not in known:
+            rows.append((name, None, current, None, False))
+            continue
+        previous = known[name]["min_us"]
+        ratio = current / previous if previous else 1.0
+        rows.append((name, previous, current, ratio, ratio > 1 + threshold))
+    return rows
+
+
+def format_table(report: dict, rows: list | None = None) -> str:
+    lines = [f"{'benchmark':<34}{'min us':>10}{'median us':>11}{'baseline':>10}{'ratio':>8}"]
+    rows_by_name = {row[0]: row for row in rows or ()}
+    for name, result in report["benchmarks"].items():
+        _, previous, _, ratio, regressed = rows_by_name.get(name, (name, None, None, None, False))
+        line = f"{name:<34}{result['min_us']:>10.2f}{result['median_us']:>11.2f}"
+        if ratio is not None:
+            line += f"{previous:>10.2f}{ratio:>7.2f}x"
+            if regressed:
+                line += "  REGRESSED"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure client-side per-call overhead and gate regressions.")
+    parser.add_argument("--transport", choices=("mock", "local"), default="mock",
+                        help="mock: canned responses, no sockets; local: the in-process stand-in.")
+    parser.add_argument("--only", default=None, help="Run only benchmarks whose name contains this.")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per timing loop.")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--json", dest="json_path", default=config.BENCH_RESULTS_PATH,
+                        help="Write the results here.")
+    parser.add_argument("--baseline", default=config.BENCH_BASELINE_PATH,
+                        help="Compare against this earlier result file when it exists.")
+    parser.add_argument("--threshold", type=float, default=config.BENCH_REGRESSION_THRESHOLD,
+                        help="Allowed slowdown before failing, e.g. 0.25 for 25%%.")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline.")
+    args = parser.parse_args(argv)
+
+    report = run(args.transport, args.only, args.min_time, args.repeats)
+
+    rows = None
+    if not args.save_baseline and args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("transport") == report["transport"]:
+            rows = compare(report, baseline, args.threshold)
+        else:
+            print(f"Baseline {args.baseline} was measured with the {baseline.get('transport')} transport; not comparing")
+    print(format_table(report, rows))
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        directory = os.path.dirname(args.baseline)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+
+    regressed = [row[0] for row in rows or () if row[4]]
+    if regressed:
+        print(f"{len(regressed)} benchmark(s) regressed more than {args.threshold:.0%}: {', '.join(regressed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
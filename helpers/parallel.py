@@ -0,0 +1,27 @@
+import math
+import os
+
+
+# pytest-xdist starts every worker with PYTEST_XDIST_WORKER ("gw0", "gw1", ...) and
+# PYTEST_XDIST_WORKER_COUNT in its environment; neither is set in a serial run.
+
+def worker_id() -> str:
+    return os.getenv("PYTEST_XDIST_WORKER", "")
+
+
+def worker_count() -> int:
+    return int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+
+
+def worker_prefix() -> str:
+    # Prepended to generated names so each worker only ever matches its own bookings
+    # in name filters. Empty in a serial run, which keeps payloads (and cassettes)
+    # identical to a run without xdist.
+    worker = worker_id()
+    return f"{worker}-" if worker else ""
+
+
+def worker_share(total: int) -> int:
+    # This worker's expected part of `total` collected tests. Every worker collects
+    # the whole suite but runs only about 1/worker_count of it.
+    return math.ceil(total / max(worker_count(), 1))
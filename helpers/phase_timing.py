@@ -0,0 +1,131 @@
+import socket
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.connection import allowed_gai_family
+
+
+# Phases recorded for every request, in seconds:
+#   dns      name resolution (0 on a reused connection)
+#   connect  TCP handshake (0 on a reused connection)
+#   tls      TLS handshake (0 for http:// and reused connections)
+#   send     writing the request line, headers and body
+#   ttfb     request sent -> response headers parsed (server processing + network)
+#   body     reading the response body
+PHASES = ("dns", "connect", "tls", "send", "ttfb", "body")
+
+
+class _TimingMixin:
+    # Captures phase timestamps on the urllib3 connection and hands them to the
+    # response it produces. Only perf_counter() calls are added on the hot path.
+
+    _phases = None
+    # True between connect() and the first request sent on that connection.
+    _fresh = False
+
+    def _reset_phases(self):
+        self._phases = {"dns": 0.0, "connect": 0.0, "tls": 0.0, "reused": True}
+
+    def _new_conn(self):
+        # Resolve up front so DNS and TCP connect are timed separately.
+        host = self._dns_host
+        started = time.perf_counter()
+        try:
+            infos = socket.getaddrinfo(host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except socket.gaierror:
+            # Let urllib3 raise its own NameResolutionError.
+            infos = None
+        resolved = time.perf_counter()
+
+        if infos:
+            self._dns_host = infos[0][4][0]
+        try:
+            sock = super()._new_conn()
+        finally:
+            self._dns_host = host
+
+        self._phases["dns"] = resolved - started
+        self._phases["connect"] = time.perf_counter() - resolved
+        return sock
+
+    def connect(self):
+        self._reset_phases()
+        started = time.perf_counter()
+        super().connect()
+        elapsed = time.perf_counter() - started
+        # Whatever connect() spent beyond DNS + TCP is the TLS handshake.
+        self._phases["tls"] = max(elapsed - self._phases["dns"] - self._phases["connect"], 0.0)
+        self._phases["reused"] = False
+        self._fresh = True
+
+    def request(self, *args, **kwargs):
+        # http:// connections open lazily inside request(); https:// ones are
+        # connected by the pool beforehand.
+        connects_inside = self.sock is None
+        if not connects_inside and not self._fresh:
+            self._reset_phases()
+
+        started = time.perf_counter()
+        super().request(*args, **kwargs)
+        self._sent_at = time.perf_counter()
+
+        send = self._sent_at - started
+        if connects_inside:
+            send -= self._phases["dns"] + self._phases["connect"] + self._phases["tls"]
+        self._phases["send"] = max(send, 0.0)
+        self._fresh = False
+
+    def getresponse(self):
+        response = super().getresponse()
+        phases = dict(self._phases)
+        phases["ttfb"] = time.perf_counter() - self._sent_at
+        response.phase_timings = phases
+        return response
+
+
+class TimingHTTPConnection(_TimingMixin, HTTPConnection):
+    pass
+
+
+class TimingHTTPSConnection(_TimingMixin, HTTPSConnection):
+    pass
+
+
+class TimingHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimingHTTPConnection
+
+
+class TimingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimingHTTPSConnection
+
+
+class TimingHTTPAdapter(HTTPAdapter):
+    # HTTPAdapter whose connections record DNS/connect/TLS/send/TTFB/body timings.
+    # The result is exposed as `response.timings` (dict of seconds plus "reused").
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimingHTTPConnectionPool,
+            "https": TimingHTTPSConnectionPool
+        }
+
+    def send(self, request, stream=False, **kwargs):
+        response = super().send(request, stream=stream, **kwargs)
+        timings = getattr(response.raw, "phase_timings", None)
+        if timings is None:
+            return response
+
+        if not stream:
+            # Session.send would read the body next anyway; do it here to time it.
+            started = time.perf_counter()
+            response.content
+            timings["body"] = time.perf_counter() - started
+        else:
+            timings["body"] = 0.0
+
+        timings["total"] = sum(timings[phase] for phase in PHASES)
+        response.timings = timings
+        return response
@@ -0,0 +1,175 @@
+import asyncio
+import threading
+import time
+from urllib.parse import urlsplit
+
+from config import config
+
+
+# Latencies under this are never treated as spikes; jitter on a fast server would
+# otherwise keep halving the limit.
+MIN_SPIKE = 0.050
+
+
+class TokenBucket:
+    # Caps the request rate at `rate` per second with bursts of up to `burst`.
+    # reserve() takes a token and returns how long the caller must wait before
+    # using it, so sync callers sleep and async callers await the same delay.
+
+    def __init__(self, rate: float, burst: float | None = None):
+        self.rate = rate
+        self.burst = burst or max(rate / 10, 1.0)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class AdaptiveConcurrency:
+    # AIMD limit on requests in flight.
+    #
+    # Every successful response raises the limit by 1 / limit (about +1 per
+    # round of `limit` requests). A 503/429, a connection error, or a latency
+    # above `spike_factor` times the running average halves it. Requests that
+    # started before a cut cannot cut again, so one overload burst halves the
+    # limit once, not once per failed request.
+
+    def __init__(self, initial: int | None = None, min_limit: int = 1, max_limit: int | None = None,
+                 spike_factor: float | None = None):
+        self.max_limit = max_limit or config.RATE_LIMIT_MAX_CONCURRENCY
+        self.min_limit = min_limit
+        self.limit = float(initial or self.min_limit)
+        self.spike_factor = config.RATE_LIMIT_LATENCY_SPIKE if spike_factor is None else spike_factor
+
+        self._cond = threading.Condition()
+        self.in_flight = 0
+        self._epoch = 0
+        self._latency = None
+        self._samples = 0
+        self.decreases = 0
+
+    def try_acquire(self):
+        # Returns the epoch to hand back to release(), or None when at the limit.
+        with self._cond:
+            if self.in_flight >= int(self.limit):
+                return None
+            self.in_flight += 1
+            return self._epoch
+
+    def acquire(self) -> int:
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+            return self._epoch
+
+    def _is_spike(self, latency: float) -> bool:
+        # Only judged once a baseline exists; the average excludes spikes themselves.
+        return self._samples >= 20 and latency > max(self.spike_factor * self._latency, MIN_SPIKE)
+
+    def release(self, epoch: int, status: int | None, latency: float):
+        with self._cond:
+            self.in_flight -= 1
+            overloaded = status is None or status in (429, 503)
+            if not overloaded and self._is_spike(latency):
+                overloaded = True
+            elif not overloaded:
+                self._latency = latency if self._latency is None else 0.9 * self._latency + 0.1 * latency
+                self._samples += 1
+
+            if overloaded:
+                if epoch == self._epoch:
+                    self.limit = max(self.min_limit, self.limit / 2)
+                    self._epoch += 1
+                    self.decreases += 1
+            else:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+
+class RateLimiter:
+    # Token bucket (optional RPS ceiling) plus AIMD concurrency in front of every
+    # HTTP attempt, retries included. Use acquire()/release() from threads and
+    # acquire_async()/release() from coroutines.
+
+    def __init__(self, rps: float | None = None, burst: float | None = None, adaptive: bool = True,
+                 **concurrency):
+        self.bucket = TokenBucket(rps, burst) if rps else None
+        self.concurrency = AdaptiveConcurrency(**concurrency) if adaptive else None
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    def _add_wait(self, seconds: float):
+        with self._lock:
+            self.waited += seconds
+
+    def acquire(self):
+        started = time.monotonic()
+        if self.bucket is not None:
+            delay = self.bucket.reserve()
+            if delay:
+                time.sleep(delay)
+        epoch = self.concurrency.acquire() if self.concurrency is not None else None
+        self._add_wait(time.monotonic() - started)
+        return epoch
+
+    async def acquire_async(self):
+        started = time.monotonic()
+        if self.bucket is not None:
+            delay = self.bucket.reserve()
+            if delay:
+                await asyncio.sleep(delay)
+        epoch = None
+        if self.concurrency is not None:
+            # The limit is shared with threads, so poll instead of awaiting a Condition.
+            pause = 0.001
+            while (epoch := self.concurrency.try_acquire()) is None:
+                await asyncio.sleep(pause)
+                pause = min(pause * 2, 0.02)
+        self._add_wait(time.monotonic() - started)
+        return epoch
+
+    def release(self, epoch, status: int | None, latency: float):
+        if self.concurrency is not None:
+            self.concurrency.release(epoch, status, latency)
+
+    def stats(self) -> dict:
+        stats = {"waited": self.waited}
+        if self.concurrency is not None:
+            stats["limit"] = self.concurrency.limit
+            stats["decreases"] = self.concurrency.decreases
+        return stats
+
+
+# One limiter per scheme://host:port, shared by every client in the process.
+_limiters = {}
+_lock = threading.Lock()
+
+
+def limiter_for(base_url: str) -> RateLimiter | None:
+    # None unless RATE_LIMIT_RPS or RATE_LIMIT_ADAPTIVE is configured.
+    if not config.RATE_LIMIT_RPS and not config.RATE_LIMIT_ADAPTIVE:
+        return None
+    parts = urlsplit(base_url)
+    key = f"{parts.scheme}://{parts.netloc}".lower()
+    with _lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = RateLimiter(
+                rps=config.RATE_LIMIT_RPS or None,
+                adaptive=config.RATE_LIMIT_ADAPTIVE,
+                initial=config.RATE_LIMIT_INITIAL_CONCURRENCY
+            )
+    return limiter
+
+
+def limiter_stats() -> dict:
+    with _lock:
+        return {key: limiter.stats() for key, limiter in _limiters.items()}
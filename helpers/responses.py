@@ -0,0 +1,60 @@
+_UNSET = object()
+
+
+class BookingAccessors:
+    # Typed views over a decoded Restful Booker body; needs a json() method.
+
+    @property
+    def booking_id(self) -> int | None:
+        # "bookingid" from POST /booking.
+        data = self.json()
+        return data.get("bookingid") if isinstance(data, dict) else None
+
+    @property
+    def booking(self) -> dict | None:
+        # The booking from POST /booking ({"bookingid", "booking"}) or from
+        # GET/PUT/PATCH /booking/{id} (the booking itself).
+        data = self.json()
+        if not isinstance(data, dict):
+            return None
+        return data.get("booking", data) if "bookingid" in data else data
+
+    @property
+    def booking_ids(self) -> list[int]:
+        # IDs from GET /booking ([{"bookingid": 1}, ...]).
+        data = self.json()
+        return [item["bookingid"] for item in data] if isinstance(data, list) else []
+
+
+class APIResponse(BookingAccessors):
+    # Wraps requests.Response so the body is decoded at most once: json() caches
+    # its result (or its decode error). Everything else (status_code, text,
+    # headers, elapsed, timings, ...) is read from the wrapped response.
+    # The cached object is shared, so tests should not mutate what json() returns.
+
+    def __init__(self, response):
+        self.raw_response = response
+        self._json = _UNSET
+        self._json_error = None
+
+    def json(self, **kwargs):
+        if kwargs:
+            return self.raw_response.json(**kwargs)
+        if self._json_error is not None:
+            raise self._json_error
+        if self._json is _UNSET:
+            try:
+                self._json = self.raw_response.json()
+            except ValueError as e:
+                self._json_error = e
+                raise
+        return self._json
+
+    def __getattr__(self, name):
+        return getattr(self.raw_response, name)
+
+    def __bool__(self):
+        return self.raw_response.ok
+
+    def __repr__(self):
+        return f"<APIResponse [{self.raw_response.status_code}]>"
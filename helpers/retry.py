@@ -0,0 +1,130 @@
+import email.utils
+import threading
+import time
+
+import requests
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+from config import config
+
+
+# Safe to send twice: repeating them cannot create a second booking.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+
+
+def is_connect_error(error: BaseException) -> bool:
+    # True when the request never reached the server (DNS, refused, connect
+    # timeout), which makes it safe to retry for any method.
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    if isinstance(reason, (NewConnectionError, ConnectTimeoutError)):
+        return True
+    try:
+        import aiohttp
+    except ImportError:
+        return False
+    return isinstance(error, aiohttp.ClientConnectorError)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    # Retry-After is either delay-seconds or an HTTP-date.
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(when.timestamp() - time.time(), 0.0)
+
+
+class RetryBudget:
+    # Seconds of retry backoff allowed per test. Spending is tracked per test
+    # node id, so pytest-rerunfailures reruns share one budget instead of each
+    # attempt getting a fresh one.
+
+    def __init__(self, seconds: float | None = None):
+        self.seconds = config.RETRY_TEST_BUDGET if seconds is None else seconds
+        self._lock = threading.Lock()
+        self._spent = {}
+        self.key = None
+
+    def start(self, key: str | None):
+        with self._lock:
+            self.key = key
+
+    def remaining(self) -> float:
+        with self._lock:
+            return self.seconds - self._spent.get(self.key, 0.0)
+
+    def spend(self, seconds: float):
+        with self._lock:
+            self._spent[self.key] = self._spent.get(self.key, 0.0) + seconds
+
+    def spent(self, key: str | None = None) -> float:
+        with self._lock:
+            return self._spent.get(key if key is not None else self.key, 0.0)
+
+
+class RetryPolicy:
+    # Decides whether a failed attempt is retried and how long to wait first.
+    #
+    # - Idempotent methods are retried on `statuses` and on any connection error.
+    # - POST/PATCH are retried only when the request cannot have been processed:
+    #   the connection was never established, or the server answered with a
+    #   Retry-After header (429/503 "come back later").
+    # - Retry-After overrides the exponential backoff.
+    # - No wait may push the call past `call_budget` seconds, or the current
+    #   test past its RetryBudget.
+
+    def __init__(self, total: int | None = None, backoff_factor: float | None = None,
+                 statuses=None, call_budget: float | None = None, budget: RetryBudget | None = None):
+        self.total = config.RETRY_TOTAL if total is None else total
+        self.backoff_factor = config.RETRY_BACKOFF_FACTOR if backoff_factor is None else backoff_factor
+        self.statuses = frozenset(statuses if statuses is not None else config.RETRY_STATUSES)
+        self.call_budget = config.RETRY_CALL_BUDGET if call_budget is None else call_budget
+        self.budget = budget if budget is not None else test_budget
+
+    def backoff(self, attempt: int) -> float:
+        # Same curve as urllib3's Retry: no wait before the first retry, then
+        # backoff_factor * 2, * 4, * 8, ... (`attempt` = retries already made).
+        return 0.0 if attempt == 0 else self.backoff_factor * (2 ** attempt)
+
+    def delay(self, method: str, attempt: int, elapsed: float, status: int | None = None,
+              headers=None, error: BaseException | None = None) -> float | None:
+        # Seconds to wait before retry number attempt + 1, or None to give up.
+        if attempt >= self.total:
+            return None
+
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        retry_after = parse_retry_after(headers.get("Retry-After")) if headers is not None else None
+        if error is not None:
+            retryable = idempotent or is_connect_error(error)
+        else:
+            retryable = status in self.statuses or status == 429
+            retryable = retryable and (idempotent or retry_after is not None)
+        if not retryable:
+            return None
+
+        wait = retry_after if retry_after is not None else self.backoff(attempt)
+        if elapsed + wait > self.call_budget:
+            return None
+        if self.budget is not None and wait > self.budget.remaining():
+            return None
+        return wait
+
+    def charge(self, seconds: float):
+        if self.budget is not None:
+            self.budget.spend(seconds)
+
+    def wait(self, seconds: float):
+        self.charge(seconds)
+        if seconds:
+            time.sleep(seconds)
+
+
+# Process-wide per-test budget; tests_api/conftest.py starts it for every test.
+test_budget = RetryBudget()
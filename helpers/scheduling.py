@@ -0,0 +1,105 @@
+import statistics
+from itertools import cycle
+
+from xdist.scheduler import LoadScheduling
+
+
+# pytest cache key holding {nodeid: seconds} from previous runs.
+CACHE_KEY = "restful_booker/durations"
+
+# Weight of the latest run when smoothing a test's stored duration.
+SMOOTHING = 0.5
+
+
+class DurationStore:
+    # Per-test durations (setup + call + teardown) kept in the pytest cache.
+    # Durations measured in this run are blended into the stored ones on save(),
+    # so one slow outlier does not reorder the next run on its own.
+
+    def __init__(self, cache=None):
+        self.cache = cache
+        self.history = dict(cache.get(CACHE_KEY, {})) if cache is not None else {}
+        self.current = {}
+
+    def add(self, nodeid: str, seconds: float):
+        self.current[nodeid] = self.current.get(nodeid, 0.0) + seconds
+
+    def pytest_runtest_logreport(self, report):
+        # Registered as a plugin; receives setup, call and teardown reports.
+        self.add(report.nodeid, report.duration)
+
+    def estimate(self, nodeid: str, default: float | None = None) -> float:
+        if nodeid in self.history:
+            return self.history[nodeid]
+        return self.fallback() if default is None else default
+
+    def fallback(self) -> float:
+        # Tests without history are assumed to be typical: the median known duration.
+        return statistics.median(self.history.values()) if self.history else 0.0
+
+    def merged(self) -> dict:
+        durations = dict(self.history)
+        for nodeid, seconds in self.current.items():
+            old = durations.get(nodeid)
+            durations[nodeid] = seconds if old is None else SMOOTHING * seconds + (1 - SMOOTHING) * old
+        return durations
+
+    def save(self):
+        if self.cache is not None and self.current:
+            self.cache.set(CACHE_KEY, {k: round(v, 6) for k, v in self.merged().items()})
+
+
+def lpt_order(nodeids: list, store: DurationStore) -> list[int]:
+    # Indices of `nodeids`, longest expected duration first; ties keep collection order.
+    fallback = store.fallback()
+    return sorted(range(len(nodeids)), key=lambda i: (-store.estimate(nodeids[i], fallback), i))
+
+
+class LPTScheduling(LoadScheduling):
+    # pytest-xdist scheduler: longest-processing-time-first list scheduling.
+    #
+    # Tests are queued longest first (by duration history) and handed out one at
+    # a time to whichever worker finishes first, so the long tests start early and
+    # the short ones fill the gaps at the end. LoadScheduling instead sends
+    # contiguous chunks in collection order, which can leave all the slow tests
+    # of one module on a single worker.
+
+    def __init__(self, config, log=None, store: DurationStore | None = None):
+        super().__init__(config, log)
+        self.store = store or DurationStore()
+
+    def check_schedule(self, node, duration: float = 0):
+        if node.shutting_down:
+            return
+        if self.pending:
+            # A worker runs an item once it knows the next one, so keep two queued.
+            if len(self.node2pending[node]) < 2:
+                self._send_tests(node, 2 - len(self.node2pending[node]))
+        else:
+            node.shutdown()
+
+    def schedule(self):
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        self.pending[:] = lpt_order(self.collection, self.store)
+        if not self.collection:
+            return
+
+        # Deal the longest tests one by one so every worker starts with one of them.
+        nodes = cycle(self.nodes)
+        for _ in range(min(len(self.pending), 2 * len(self.nodes))):
+            self._send_tests(next(nodes), 1)
+
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
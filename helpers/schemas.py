@@ -0,0 +1,64 @@
+import json
+import os
+
+from jsonschema import FormatChecker
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+
+SCHEMAS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "schemas"))
+
+
+class SchemaRegistry:
+    # Loads every schema under schemas/ once and compiles one validator per file.
+    # Schemas are addressed by file name without "_schema.json":
+    # schemas/booking_schema.json -> "booking".
+
+    def __init__(self, directory: str = SCHEMAS_DIR):
+        self.directory = directory
+        self._validators = {}
+        self._format_checker = FormatChecker()
+
+        for filename in sorted(os.listdir(directory)):
+            if filename.endswith(".json"):
+                self._load(filename)
+
+    def _load(self, filename: str):
+        with open(os.path.join(self.directory, filename)) as f:
+            schema = json.load(f)
+
+        cls = validator_for(schema)
+        cls.check_schema(schema)
+        name = filename[:-len(".json")].removesuffix("_schema")
+        # format_checker makes "format": "date" an actual check, not an annotation.
+        self._validators[name] = cls(schema, format_checker=self._format_checker)
+
+    @property
+    def names(self) -> list:
+        return sorted(self._validators)
+
+    def validator(self, name: str):
+        try:
+            return self._validators[name]
+        except KeyError:
+            raise KeyError(f"Unknown schema '{name}', expected one of {self.names}") from None
+
+    def is_valid(self, name: str, data) -> bool:
+        return self.validator(name).is_valid(data)
+
+    def assert_matches(self, name: str, data):
+        # Cheap is_valid() first; errors are only collected for failing documents.
+        validator = self.validator(name)
+        if validator.is_valid(data):
+            return
+
+        error = best_match(validator.iter_errors(data))
+        location = "/".join(str(p) for p in error.absolute_path) or "<root>"
+        raise AssertionError(f"Response does not match schema '{name}' at {location}: {error.message}")
+
+
+registry = SchemaRegistry()
+
+
+def assert_matches(name: str, data):
+    registry.assert_matches(name, data)
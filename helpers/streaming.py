@@ -0,0 +1,67 @@
+import codecs
+import json
+
+# Bytes read from the socket per step; memory stays around this size however
+# long the array is.
+CHUNK_SIZE = 16 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+def iter_json_array(chunks, encoding: str = "utf-8"):
+    # Yields the elements of a top-level JSON array from an iterable of byte
+    # chunks, decoding one element at a time; only the undecoded remainder is
+    # buffered. Raises ValueError if the stream is not a complete JSON array.
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder(encoding)(errors="replace")
+    buffer = ""
+    opened = closed = False
+
+    for chunk in chunks:
+        buffer += text.decode(chunk)
+        pos, size = 0, len(buffer)
+        while pos < size:
+            char = buffer[pos]
+            if char in _WHITESPACE:
+                pos += 1
+            elif closed:
+                raise ValueError(f"Extra data after the JSON array: {buffer[pos:pos + 20]!r}")
+            elif not opened:
+                if char != "[":
+                    raise ValueError(f"Expected a JSON array, got {buffer[pos:pos + 20]!r}")
+                opened = True
+                pos += 1
+            elif char == "]":
+                closed = True
+                pos += 1
+            elif char == ",":
+                pos += 1
+            else:
+                try:
+                    item, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    break  # element continues in the next chunk
+                if end == size and not isinstance(item, (dict, list, str)):
+                    break  # a number or literal may be cut off at the chunk edge
+                yield item
+                pos = end
+        buffer = buffer[pos:]
+
+    buffer += text.decode(b"", final=True)
+    if buffer.strip() or not closed:
+        raise ValueError(f"Truncated or invalid JSON array near {buffer[:40]!r}")
+
+
+def stream_booking_ids(response, chunk_size: int = CHUNK_SIZE):
+    # Booking IDs from a streamed GET /booking response ([{"bookingid": 1}, ...]).
+    # Every element is checked against the booking_list shape as it arrives.
+    # The response is closed when the generator finishes or is closed early,
+    # so a caller that stops at the ID it wants never reads the rest.
+    try:
+        for item in iter_json_array(response.iter_content(chunk_size), response.encoding or "utf-8"):
+            booking_id = item.get("bookingid") if isinstance(item, dict) else None
+            if not isinstance(booking_id, int) or isinstance(booking_id, bool):
+                raise ValueError(f"Unexpected element in booking list: {item!r}")
+            yield booking_id
+    finally:
+        response.close()
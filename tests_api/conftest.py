@@ -1,5 +1,335 @@
+import allure
 import pytest
+from config import config as booker_config
 from helpers.api_client import APIClient
+from helpers.attachments import attachments
+from helpers.auth import TokenProvider
+from helpers.booking_pool import BookingPool
+from helpers.cassette import close_active_cassette
+from helpers.cleanup import CleanupResult, created_bookings
+from helpers import metrics
+from helpers.connection_pool import pool_stats
+from helpers.health import wait_until_healthy
+from helpers.local_server import LocalBookerServer, MultiProcessBookerServer
+from helpers.parallel import worker_id, worker_share
+from helpers.rate_limit import limiter_stats
+from helpers.retry import RetryBudget, RetryPolicy, test_budget
+from helpers.scheduling import DurationStore, LPTScheduling
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--local-server",
+        action="store_true",
+        default=False,
+        help="Run the suite against an in-process Restful Booker stand-in instead of BASE_URL."
+    )
+    parser.addoption(
+        "--local-server-workers",
+        type=int,
+        default=None,
+        help="Processes serving --local-server (default: config.LOCAL_SERVER_WORKERS)."
+    )
+    parser.addoption(
+        "--phase-timing",
+        action="store_true",
+        default=False,
+        help="Record DNS/connect/TLS/TTFB/body timings for every request."
+    )
+    parser.addoption(
+        "--attach-always",
+        action="store_true",
+        default=False,
+        help="Write Allure attachments for passing tests too (default: failed tests only)."
+    )
+    parser.addoption(
+        "--cassette",
+        choices=("record", "replay"),
+        default=None,
+        help="Record every HTTP exchange to the cassette, or replay the suite from it without a server."
+    )
+    parser.addoption(
+        "--cassette-path",
+        default=None,
+        help="Cassette file (JSONL), defaults to config.CASSETTE_PATH."
+    )
+
+
+def _is_xdist_controller(config) -> bool:
+    # The pytest-xdist process that only distributes tests; it sends no requests.
+    return getattr(config.option, "dist", "no") != "no" and not hasattr(config, "workerinput")
+
+
+def pytest_configure(config):
+    if config.getoption("--cassette") and (_is_xdist_controller(config) or worker_id()):
+        # Tests land on different workers from run to run, so per-call ordinals
+        # recorded in one run would not line up in the next.
+        raise pytest.UsageError("--cassette cannot be combined with pytest-xdist (-n)")
+
+    # Must be set before the first APIClient creates the shared adapter.
+    if config.getoption("--phase-timing"):
+        booker_config.PHASE_TIMING = True
+    if config.getoption("--attach-always"):
+        booker_config.ALLURE_ATTACH_MODE = "always"
+    if config.getoption("--cassette"):
+        booker_config.CASSETTE_MODE = config.getoption("--cassette")
+    if config.getoption("--cassette-path"):
+        booker_config.CASSETTE_PATH = config.getoption("--cassette-path")
+    if booker_config.CASSETTE_MODE == "replay":
+        # Replayed DELETEs would not touch any server.
+        booker_config.CLEANUP_BOOKINGS = False
+
+    # Test durations are measured where every report ends up: the serial process
+    # or the xdist controller. Replayed runs say nothing about real timings.
+    if not hasattr(config, "workerinput") and booker_config.CASSETTE_MODE != "replay":
+        durations = DurationStore(getattr(config, "cache", None))
+        config.stash[TEST_DURATIONS] = durations
+        config.pluginmanager.register(durations, "test-durations")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # Attachments captured with helpers.attachments.attach() are only serialized
+    # and written when the phase failed (or always with --attach-always).
+    report = (yield).get_result()
+    if report.failed or (report.when == "call" and booker_config.ALLURE_ATTACH_MODE == "always"):
+        attachments.flush()
+    if report.when == "teardown":
+        attachments.discard()
+
+
+def pytest_sessionstart(session):
+    # Health gate: make sure the remote API answers before any test (or the booking
+    # pool) starts hammering it. Skipped for the in-process server, for cassette
+    # replay and on xdist workers (the controller already checked).
+    config = session.config
+    if (not booker_config.HEALTH_GATE or config.getoption("--local-server")
+            or booker_config.CASSETTE_MODE == "replay" or hasattr(config, "workerinput")):
+        return
+
+    healthy, detail = wait_until_healthy(booker_config.BASE_URL)
+    if not healthy:
+        pytest.exit(f"Health gate: {detail}", returncode=pytest.ExitCode.TESTS_FAILED)
+
+
+def pytest_unconfigure(config):
+    close_active_cassette()
+
+
+# Number of selected tests using each booking pool fixture.
+POOL_NEEDS = pytest.StashKey[dict]()
+CLEANUP_RESULT = pytest.StashKey[CleanupResult]()
+CONNECTION_STATS = pytest.StashKey[dict]()
+TEST_DURATIONS = pytest.StashKey[DurationStore]()
+
+
+def pytest_collection_modifyitems(config, items):
+    if booker_config.CASSETTE_MODE != "off":
+        # Framework tests drive their own in-process server (often concurrently), so
+        # their traffic is neither reproducible nor part of the recorded suite.
+        skip = pytest.mark.skip(reason="uses its own server; not recorded in cassettes")
+        for item in items:
+            if "local_server" in item.fixturenames or item.get_closest_marker("own_server"):
+                item.add_marker(skip)
+
+
+def pytest_collection_finish(session):
+    # Sized from session.items, i.e. after -k/-m deselection, so a filtered run
+    # only creates the bookings its selected tests lease.
+    session.config.stash[POOL_NEEDS] = {
+        "shared": sum("shared_booking" in item.fixturenames for item in session.items),
+        "exclusive": sum("exclusive_booking" in item.fixturenames for item in session.items)
+    }
+
+
+def pytest_terminal_summary(terminalreporter):
+    if metrics.registry.items():
+        terminalreporter.write_sep("-", "API latency by endpoint")
+        terminalreporter.write_line(metrics.registry.summary_text())
+
+    retries, waited = metrics.registry.retry_totals()
+    if retries:
+        terminalreporter.write_line(f"Retries: {retries} ({waited:.1f}s in backoff)")
+
+    for url, stats in limiter_stats().items():
+        line = f"Rate limiter {url}: {stats['waited']:.1f}s waiting"
+        if "limit" in stats:
+            line += f", concurrency limit {stats['limit']:.1f} after {stats['decreases']} cut(s)"
+        terminalreporter.write_line(line)
+
+    cleanup = terminalreporter.config.stash.get(CLEANUP_RESULT, None)
+    if cleanup is not None:
+        terminalreporter.write_line(f"Booking cleanup: {cleanup}")
+
+    stats = terminalreporter.config.stash.get(CONNECTION_STATS, None) or pool_stats()
+    if stats["requests"]:
+        terminalreporter.write_line(
+            f"HTTP connections: {stats['opened']} opened, "
+            f"{stats['reused']} of {stats['requests']} requests on reused connections"
+        )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    # `-n` with the default `--dist load`: hand tests out longest-first.
+    if config.option.dist != "load" or not booker_config.DURATION_SCHEDULING:
+        return None
+    return LPTScheduling(config, log, config.stash.get(TEST_DURATIONS, None))
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    durations = config.stash.get(TEST_DURATIONS, None)
+    if durations is not None:
+        durations.save()
+
+    if hasattr(config, "workerinput"):
+        # pytest-xdist worker: hand this worker's numbers to the controller.
+        cleanup = config.stash.get(CLEANUP_RESULT, None)
+        config.workeroutput["latency"] = metrics.registry.export()
+        config.workeroutput["cleanup"] = vars(cleanup) if cleanup is not None else None
+        config.workeroutput["connections"] = pool_stats()
+    elif _is_xdist_controller(config) and metrics.registry.items():
+        metrics.registry.write_json(booker_config.LATENCY_REPORT_PATH)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    # pytest-xdist controller: merge what each worker sent in pytest_sessionfinish.
+    output = getattr(node, "workeroutput", None) or {}
+    stash = node.config.stash
+    if "latency" in output:
+        metrics.registry.merge_export(output["latency"])
+    if output.get("cleanup"):
+        result = CleanupResult()
+        vars(result).update(output["cleanup"])
+        stash.setdefault(CLEANUP_RESULT, CleanupResult()).add(result)
+    if "connections" in output:
+        totals = stash.setdefault(CONNECTION_STATS, {"opened": 0, "requests": 0, "reused": 0})
+        for key in totals:
+            totals[key] += output["connections"][key]
+
+
+@pytest.fixture(scope="session")
+def local_server(request):
+    # Restful Booker stand-in, started once per session. With more than one
+    # worker it runs in separate processes sharing the port (SO_REUSEPORT).
+    workers = request.config.getoption("--local-server-workers") or booker_config.LOCAL_SERVER_WORKERS
+    if workers > 1:
+        server = MultiProcessBookerServer(workers).start()
+    else:
+        server = LocalBookerServer().start()
+    yield server
+    # Its bookings disappear with it; nothing to clean up.
+    created_bookings.forget(server.url)
+    server.stop()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def base_url(request):
+    # Points config.BASE_URL at the local stand-in when --local-server is given.
+    if not request.config.getoption("--local-server"):
+        yield booker_config.BASE_URL
+        return
+
+    server = request.getfixturevalue("local_server")
+    original = booker_config.BASE_URL
+    booker_config.BASE_URL = server.url
+    yield server.url
+    booker_config.BASE_URL = original
+
+
+@pytest.fixture(scope="session", autouse=True)
+def latency_report():
+    # Publishes the per-endpoint latency histograms once the session is done.
+    yield metrics.registry
+    if not metrics.registry.items():
+        return
+
+    worker = worker_id()
+    allure.attach(
+        metrics.registry.summary_text(),
+        name=f"API latency by endpoint ({worker})" if worker else "API latency by endpoint",
+        attachment_type=allure.attachment_type.TEXT
+    )
+    if worker:
+        # The controller writes the merged JSON report (pytest_sessionfinish).
+        return
+
+    metrics.registry.write_json(booker_config.LATENCY_REPORT_PATH)
+    allure.attach.file(
+        booker_config.LATENCY_REPORT_PATH,
+        name="latency-summary.json",
+        attachment_type=allure.attachment_type.JSON
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def booking_cleanup(request, base_url):
+    # Deletes every booking created through booking_helpers once the session ends,
+    # so GET /booking (and the filter tests) does not slow down run after run.
+    yield created_bookings
+    if request.config.getoption("--local-server"):
+        # The stand-in is torn down right after this fixture; its bookings go with it.
+        created_bookings.forget(base_url)
+    if not booker_config.CLEANUP_BOOKINGS or not created_bookings.base_urls:
+        return
+
+    total = CleanupResult()
+    for url in created_bookings.base_urls:
+        # Cleanup DELETEs are not test traffic; keep them out of the latency report
+        # and the per-test retry budget.
+        client = APIClient(base_url=url, token_provider=TokenProvider(base_url=url),
+                           metrics_registry=metrics.MetricsRegistry(),
+                           retry_policy=RetryPolicy(budget=RetryBudget()))
+        total.add(created_bookings.cleanup(client))
+    request.config.stash[CLEANUP_RESULT] = total
+
+
+@pytest.fixture(autouse=True)
+def retry_budget(request):
+    # Caps retry backoff per test (config.RETRY_TEST_BUDGET); reruns of the same
+    # test keep spending from the same budget.
+    test_budget.start(request.node.nodeid)
+    yield test_budget
+    spent = test_budget.spent()
+    test_budget.start(None)
+    if spent:
+        allure.attach(
+            f"{spent:.2f}s of {test_budget.seconds:.0f}s retry budget spent in backoff",
+            name="Retry backoff",
+            attachment_type=allure.attachment_type.TEXT
+        )
+
+
+@pytest.fixture(scope="session")
+def booking_pool(request, base_url):
+    # Creates the bookings the collected tests need, in parallel, as soon as the
+    # first test asks for one. Under pytest-xdist every worker has its own pool,
+    # sized for its share of the suite and named with its worker prefix, so filter
+    # tests only see their own worker's bookings and no two workers ever hold the
+    # same exclusive booking.
+    needs = request.config.stash.get(POOL_NEEDS, {"shared": 1, "exclusive": 0})
+    pool = BookingPool(
+        shared=min(needs["shared"], booker_config.BOOKING_POOL_SHARED_MAX),
+        exclusive=worker_share(needs["exclusive"]),
+        # Cassette ordinals need bookings created in the same order on every run.
+        workers=1 if booker_config.CASSETTE_MODE != "off" else None
+    ).start()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def shared_booking(booking_pool):
+    # Pre-created booking for read-only tests. Do not update or delete it.
+    return booking_pool.lease_shared()
+
+
+@pytest.fixture
+def exclusive_booking(booking_pool):
+    # Pre-created booking owned by this test; it may be updated or deleted.
+    return booking_pool.take_exclusive()
 
 
 @pytest.fixture
@@ -8,20 +338,23 @@ def client():
     return APIClient()
 
 
-@pytest.fixture
-def auth_token():
-    # Generates a valid authorization token for endpoints requiring auth.
-    temp = APIClient()
-    payload = {"username": "admin", "password": "password123"}
-    response = temp.post("/auth", json=payload)
+@pytest.fixture(scope="session")
+def token_provider(base_url):
+    # One /auth round trip per session (and per xdist worker), shared by every auth_client.
+    return TokenProvider()
+
 
-    token = response.json().get("token")
+@pytest.fixture(scope="session")
+def auth_token(token_provider):
+    # Generates a valid authorization token for endpoints requiring auth.
+    token = token_provider.get()
     assert token, "Auth token was not generated"
 
     return token
 
 
 @pytest.fixture
-def auth_client(auth_token):
-    # Authenticated client that includes the token automatically.
-    return APIClient(token=auth_token)
+def auth_client(token_provider):
+    # Authenticated client that includes the token automatically
+    # and re-authenticates if the server rejects it.
+    return APIClient(token_provider=token_provider)
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from helpers.async_api_client import AsyncAPIClient
+from helpers.async_booking_helpers import (
+    create_booking,
+    create_bookings,
+    get_booking,
+    update_booking_full,
+    update_booking_partial,
+    delete_booking)
+from helpers.auth import TokenProvider
+from helpers.booking_payloads import valid_booking_payload
+from helpers.metrics import MetricsRegistry
+
+
+@pytest.mark.booking
+class TestAsyncClient:
+
+    def test_async_ping(self, local_server):
+        async def scenario():
+            async with AsyncAPIClient(base_url=local_server.url, metrics_registry=MetricsRegistry()) as client:
+                return await client.get("/ping")
+
+        response = asyncio.run(scenario())
+
+        assert response.status_code == 201
+        assert response.text == "Created"
+        assert "text/plain" in response.headers["content-type"]
+        assert response.elapsed.total_seconds() < 2
+
+    def test_async_booking_crud(self, local_server):
+        token_provider = TokenProvider(base_url=local_server.url)
+
+        async def scenario():
+            async with AsyncAPIClient(base_url=local_server.url, token_provider=token_provider,
+                                      metrics_registry=MetricsRegistry()) as client:
+                booking_id, created = await create_booking(client)
+
+                payload = valid_booking_payload()
+                payload["firstname"] = "AsyncNew"
+                put_resp = await update_booking_full(client, booking_id, payload)
+                patch_resp = await update_booking_partial(client, booking_id, {"lastname": "Patched"})
+                get_resp = await get_booking(client, booking_id)
+                delete_resp = await delete_booking(client, booking_id)
+                missing = await get_booking(client, booking_id)
+                return created, put_resp, patch_resp, get_resp, delete_resp, missing
+
+        created, put_resp, patch_resp, get_resp, delete_resp, missing = asyncio.run(scenario())
+
+        assert created.status_code == 200
+        assert put_resp.status_code == 200
+        assert patch_resp.status_code == 200
+        assert get_resp.json()["firstname"] == "AsyncNew"
+        assert get_resp.json()["lastname"] == "Patched"
+        assert delete_resp.status_code == 201
+        assert missing.status_code == 404
+
+    def test_async_fan_out_creates_unique_bookings(self, local_server):
+        async def scenario():
+            async with AsyncAPIClient(base_url=local_server.url, max_concurrency=5,
+                                      metrics_registry=MetricsRegistry()) as client:
+                return await create_bookings(client, [valid_booking_payload() for _ in range(50)])
+
+        results = asyncio.run(scenario())
+        ids = [booking_id for booking_id, _ in results]
+
+        assert all(response.status_code == 200 for _, response in results)
+        assert len(set(ids)) == 50
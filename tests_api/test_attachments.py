@@ -0,0 +1,74 @@
+import json
+
+import allure
+import pytest
+
+from helpers import attachments as attachments_module
+from helpers.attachments import LazyAttachments, render, truncate
+
+
+@pytest.fixture
+def written(monkeypatch):
+    calls = []
+    monkeypatch.setattr(attachments_module.allure, "attach",
+                        lambda body, name, attachment_type: calls.append((name, body, attachment_type)))
+    return calls
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, text):
+        self.text = text
+
+    def json(self):
+        return json.loads(self.text)
+
+
+@pytest.mark.smoke
+class TestLazyAttachments:
+
+    def test_nothing_rendered_until_flush(self, written):
+        rendered = []
+        buffer = LazyAttachments()
+
+        buffer.add(lambda: rendered.append(1) or "body", "lazy")
+
+        assert rendered == [] and written == []
+        assert buffer.flush() == 1
+        assert rendered == [1]
+        assert written[0][:2] == ("lazy", "body")
+
+    def test_discard_writes_nothing(self, written):
+        buffer = LazyAttachments()
+        buffer.add({"a": 1}, "payload")
+
+        buffer.discard()
+
+        assert buffer.flush() == 0
+        assert written == []
+
+    def test_duplicates_written_once(self, written):
+        buffer = LazyAttachments()
+        buffer.add({"a": 1}, "first")
+        buffer.add({"a": 1}, "second")
+        buffer.add({"a": 2}, "third")
+
+        assert buffer.flush() == 2
+        assert [name for name, _, _ in written] == ["first", "third"]
+        assert written[0][2] == allure.attachment_type.JSON
+
+    def test_large_bodies_are_truncated(self, written):
+        buffer = LazyAttachments(max_bytes=100)
+        buffer.add("x" * 1000, "big")
+        buffer.flush()
+
+        body = written[0][1]
+        assert body.startswith("x" * 100)
+        assert "truncated 900 of 1000 bytes" in body
+
+    def test_render(self):
+        assert render(FakeResponse('{"b": 1}')) == '{\n  "b": 1\n}'
+        assert render(FakeResponse("Created")) == "Created"
+        assert render({"name": "Ä"}) == '{\n  "name": "Ä"\n}'
+        assert truncate("ÄÄÄ", 3) == "Ä\n... truncated 3 of 6 bytes"
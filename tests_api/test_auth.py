@@ -1,5 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
+from helpers.api_client import APIClient
+from helpers.auth import AuthError, TokenProvider
+from helpers.booking_payloads import valid_booking_payload
+from helpers.metrics import MetricsRegistry
+
 
 @pytest.mark.auth
 class TestAuthBasics:
@@ -60,4 +67,54 @@ class TestAuthBasics:
 
         assert response.status_code == 200
         assert data.get("reason") == "Bad credentials"
-        assert "token" not in data
\ No newline at end of file
+        assert "token" not in data
+
+
+@pytest.mark.auth
+class TestTokenProvider:
+
+    def test_token_is_cached(self, local_server):
+        provider = TokenProvider(base_url=local_server.url)
+
+        first = provider.get()
+        second = provider.get()
+
+        assert first == second
+        assert provider.fetch_count == 1
+
+    def test_token_refetched_after_ttl(self, local_server):
+        provider = TokenProvider(base_url=local_server.url, ttl=0)
+
+        provider.get()
+        provider.get()
+
+        assert provider.fetch_count == 2
+
+    def test_bad_credentials_raise(self, local_server):
+        provider = TokenProvider(password="incorrect_password", base_url=local_server.url)
+
+        with pytest.raises(AuthError):
+            provider.get()
+
+    def test_client_reauthenticates_on_403(self, local_server):
+        provider = TokenProvider(base_url=local_server.url)
+        client = APIClient(base_url=local_server.url, token_provider=provider, metrics_registry=MetricsRegistry())
+        booking_id = client.post("/booking", json=valid_booking_payload()).json()["bookingid"]
+        stale = provider.get()
+
+        local_server.store.revoke_tokens()
+        response = client.delete(f"/booking/{booking_id}")
+
+        assert response.status_code == 201
+        assert provider.get() != stale
+        assert provider.fetch_count == 2
+
+    def test_concurrent_refresh_fetches_once(self, local_server):
+        provider = TokenProvider(base_url=local_server.url)
+        stale = provider.get()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            tokens = set(pool.map(lambda _: provider.refresh(stale=stale), range(8)))
+
+        assert len(tokens) == 1
+        assert provider.fetch_count == 2
@@ -1,6 +1,3 @@
-import json
-from jsonschema import validate
-from jsonschema.exceptions import ValidationError
 import pytest
 
 from helpers.booking_helpers import (
@@ -8,7 +5,9 @@ from helpers.booking_helpers import (
     get_booking,
     update_booking_full,
     update_booking_partial,
-    delete_booking)
+    delete_booking,
+    iter_booking_ids,
+    booking_in_results)
 
 from helpers.booking_payloads import (
     valid_booking_payload,
@@ -16,7 +15,9 @@ from helpers.booking_payloads import (
     invalid_payload_missing_fields,
     invalid_dates_payload)
 
-import os
+from helpers.attachments import attach
+from helpers.schemas import assert_matches
+
 import allure
 
 
@@ -37,9 +38,9 @@ class TestCreateBooking:
             assert response.status_code == 200
 
         with allure.step("Attach full JSON response"):
-            allure.attach(json.dumps(response.json(), indent=2),
-                          "response_body",
-                          allure.attachment_type.JSON)
+            attach(response,
+                   "response_body",
+                   allure.attachment_type.JSON)
 
         with allure.step("Validate booking exists"):
             assert booking_id is not None
@@ -54,18 +55,18 @@ class TestCreateBooking:
         with allure.step("POST /booking with minimal payload"):
             booking_id, response = create_booking(client, payload=body)
 
-        allure.attach(json.dumps(body, indent=2),
-                      "minimal_payload",
-                      allure.attachment_type.JSON)
+        attach(body,
+               "minimal_payload",
+               allure.attachment_type.JSON)
 
-        allure.attach(json.dumps(response.json(), indent=2),
-                      "response_minimal",
-                      allure.attachment_type.JSON)
+        attach(response,
+               "response_minimal",
+               allure.attachment_type.JSON)
 
         assert response.status_code == 200
         assert booking_id is not None
 
-        booking = response.json()["booking"]
+        booking = response.booking
         assert booking["firstname"] == body["firstname"]
         assert booking["lastname"] == body["lastname"]
 
@@ -80,13 +81,13 @@ class TestCreateBooking:
         with allure.step("POST /booking with special characters"):
             booking_id, response = create_booking(client, payload=body)
 
-        allure.attach(json.dumps(body, indent=2),
-                      "payload_with_special_chars",
-                      allure.attachment_type.JSON)
+        attach(body,
+               "payload_with_special_chars",
+               allure.attachment_type.JSON)
 
-        allure.attach(json.dumps(response.json(), indent=2),
-                      "response_with_special_chars",
-                      allure.attachment_type.JSON)
+        attach(response,
+               "response_with_special_chars",
+               allure.attachment_type.JSON)
 
         assert response.status_code == 200
         assert booking_id is not None
@@ -104,19 +105,19 @@ class TestGetBookingByID:
 
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.title("GET Booking by valid ID returns 200 and correct structure")
-    def test_get_booking_by_id(self, client):
-        with allure.step("Create booking to have a valid ID"):
-            booking_id, create_resp = create_booking(client)
-            allure.attach(
-                json.dumps(create_resp.json(), indent=2),
+    def test_get_booking_by_id(self, client, shared_booking):
+        with allure.step("Lease a pre-created booking to have a valid ID"):
+            booking_id, created = shared_booking
+            attach(
+                created,
                 name="Created Booking",
                 attachment_type=allure.attachment_type.JSON
             )
 
         with allure.step(f"GET booking {booking_id}"):
             response = get_booking(client, booking_id)
-            allure.attach(
-                response.text,
+            attach(
+                response,
                 name="GET Response",
                 attachment_type=allure.attachment_type.JSON
             )
@@ -135,8 +136,8 @@ class TestGetBookingByID:
 
         with allure.step(f"GET booking {non_existent_id} (should be 404)"):
             response = get_booking(client, non_existent_id)
-            allure.attach(
-                response.text,
+            attach(
+                response,
                 name="Response 404",
                 attachment_type=allure.attachment_type.TEXT
             )
@@ -150,8 +151,8 @@ class TestGetBookingByID:
 
         with allure.step(f"GET booking with invalid id '{invalid_id}'"):
             response = get_booking(client, invalid_id)
-            allure.attach(
-                response.text,
+            attach(
+                response,
                 name="Invalid ID Response",
                 attachment_type=allure.attachment_type.TEXT
             )
@@ -160,14 +161,14 @@ class TestGetBookingByID:
 
     @allure.severity(allure.severity_level.NORMAL)
     @allure.title("GET Booking response time is under 1 second")
-    def test_get_booking_performance(self, client):
-        booking_id, _ = create_booking(client)
+    def test_get_booking_performance(self, client, shared_booking):
+        booking_id, _ = shared_booking
 
         with allure.step("Measure response time for GET booking"):
             response = get_booking(client, booking_id)
             elapsed = response.elapsed.total_seconds()
 
-            allure.attach(
+            attach(
                 str(elapsed),
                 name="Response Time (seconds)",
                 attachment_type=allure.attachment_type.TEXT
@@ -177,31 +178,24 @@ class TestGetBookingByID:
 
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.title("GET Booking JSON Schema Validation")
-    def test_get_booking_schema_validation(self, client):
-        booking_id, _ = create_booking(client)
+    def test_get_booking_schema_validation(self, client, shared_booking):
+        booking_id, _ = shared_booking
 
         with allure.step(f"GET booking {booking_id} for schema validation"):
             response = get_booking(client, booking_id)
             data = response.json()
-            allure.attach(
-                json.dumps(data, indent=2),
+            attach(
+                data,
                 name="GET Response for Schema",
                 attachment_type=allure.attachment_type.JSON
             )
 
-        with allure.step("Load JSON schema"):
-            schema_path = os.path.abspath(
-                os.path.join(os.path.dirname(__file__), "..", "schemas", "booking_schema.json")
-            )
-            with open(schema_path) as f:
-                schema = json.load(f)
-
         with allure.step("Validate schema"):
             try:
-                validate(instance=data, schema=schema)
-            except ValidationError as e:
-                allure.attach(str(e), name="Schema Validation Error", attachment_type=allure.attachment_type.TEXT)
-                assert False, f"Schema validation failed: {e.message}"
+                assert_matches("booking", data)
+            except AssertionError as e:
+                attach(str(e), name="Schema Validation Error", attachment_type=allure.attachment_type.TEXT)
+                raise
 
 
 @pytest.mark.booking
@@ -212,107 +206,86 @@ class TestGetBookingFilters:
 
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.title("Filter bookings by firstname — correct booking returned")
-    def test_get_booking_by_first_name(self, client):
-        with allure.step("Create booking and extract firstname"):
-            booking_id, response = create_booking(client)
-            firstname = response.json()["booking"]["firstname"]
-            allure.attach(
-                json.dumps(response.json(), indent=2),
+    def test_get_booking_by_first_name(self, client, shared_booking):
+        with allure.step("Lease booking and extract firstname"):
+            booking_id, booking = shared_booking
+            firstname = booking["firstname"]
+            attach(
+                booking,
                 name="Created Booking",
                 attachment_type=allure.attachment_type.JSON
             )
 
-        with allure.step(f"GET /booking?firstname={firstname}"):
-            response = client.get("/booking", params={"firstname": firstname})
-            allure.attach(
-                response.text,
-                name="Filter Response",
-                attachment_type=allure.attachment_type.JSON
-            )
+        with allure.step(f"GET /booking?firstname={firstname} (streamed)"):
+            # Every element is checked against the booking_list shape while streaming.
+            scanned, found = 0, False
+            for returned_id in iter_booking_ids(client, {"firstname": firstname}):
+                scanned += 1
+                found = found or returned_id == booking_id
 
         with allure.step("Validate booking is returned in filtered results"):
-            returned_ids = [item["bookingid"] for item in response.json()]
-            assert booking_id in returned_ids, \
-                f"Booking ID {booking_id} not in {returned_ids}"
+            assert found, f"Booking ID {booking_id} not among {scanned} filtered results"
 
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.title("Filter booking by fullname (firstname + lastname)")
-    def test_get_booking_fullname(self, client):
-        with allure.step("Create booking and extract full name"):
-            booking_id, response = create_booking(client)
-            firstname = response.json()["booking"]["firstname"]
-            lastname = response.json()["booking"]["lastname"]
-
-            allure.attach(
-                json.dumps(response.json(), indent=2),
+    def test_get_booking_fullname(self, client, shared_booking):
+        with allure.step("Lease booking and extract full name"):
+            booking_id, booking = shared_booking
+            firstname = booking["firstname"]
+            lastname = booking["lastname"]
+
+            attach(
+                booking,
                 name="Created Booking",
                 attachment_type=allure.attachment_type.JSON
             )
 
-        with allure.step(f"GET /booking?firstname={firstname}&lastname={lastname}"):
-            response = client.get(
-                "/booking",
+        with allure.step(f"GET /booking?firstname={firstname}&lastname={lastname} (streamed)"):
+            found = booking_in_results(
+                client,
+                booking_id,
                 params={"firstname": firstname, "lastname": lastname}
             )
-            allure.attach(
-                response.text,
-                name="Filter Response",
-                attachment_type=allure.attachment_type.JSON
-            )
 
         with allure.step("Validate booking is returned"):
-            ids = [item["bookingid"] for item in response.json()]
-            assert booking_id in ids, \
-                f"Booking {booking_id} not found in {ids}"
+            assert found, f"Booking {booking_id} not found in filtered results"
 
     @allure.severity(allure.severity_level.NORMAL)
     @allure.title("Filtering with non-existing firstname returns empty list")
     def test_filters_no_result(self, client):
         non_existing = "____NotValidName_____"
 
-        with allure.step(f"GET /booking?firstname={non_existing}"):
-            response = client.get("/booking", params={"firstname": non_existing})
-            allure.attach(
-                response.text,
-                name="Empty Filter Response",
-                attachment_type=allure.attachment_type.JSON
-            )
+        with allure.step(f"GET /booking?firstname={non_existing} (streamed)"):
+            # Raises AssertionError unless the status is 200.
+            first = next(iter_booking_ids(client, {"firstname": non_existing}), None)
 
-        assert response.status_code == 200
-        assert response.json() == [], "Expected empty list"
+        assert first is None, "Expected empty list"
 
     @allure.severity(allure.severity_level.NORMAL)
     @allure.title("Filter by multiple params (firstname + lastname)")
-    def test_filter_by_multiple_params(self, client):
-        with allure.step("Create booking and extract firstname, lastname"):
-            booking_id, response = create_booking(client)
-            body = response.json()["booking"]
+    def test_filter_by_multiple_params(self, client, shared_booking):
+        with allure.step("Lease booking and extract firstname, lastname"):
+            booking_id, body = shared_booking
             firstname = body["firstname"]
             lastname = body["lastname"]
 
-            allure.attach(
-                json.dumps(response.json(), indent=2),
+            attach(
+                body,
                 name="Created Booking",
                 attachment_type=allure.attachment_type.JSON
             )
 
         with allure.step(
-            f"GET /booking?firstname={firstname}&lastname={lastname}"
+            f"GET /booking?firstname={firstname}&lastname={lastname} (streamed)"
         ):
-            resp = client.get(
-                "/booking",
+            found = booking_in_results(
+                client,
+                booking_id,
                 params={"firstname": firstname, "lastname": lastname}
             )
-            allure.attach(
-                resp.text,
-                name="Filtered Response",
-                attachment_type=allure.attachment_type.JSON
-            )
 
         with allure.step("Validate booking ID is included in results"):
-            ids = [item["bookingid"] for item in resp.json()]
-            assert booking_id in ids, \
-                f"Booking ID {booking_id} not found in {ids}"
+            assert found, f"Booking ID {booking_id} not found in filtered results"
 
 
 @pytest.mark.booking
@@ -323,13 +296,12 @@ class TestUpdateBooking:
 
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.title("Full update of an existing booking")
-    def test_update_booking_full(self, auth_client):
-        with allure.step("Create booking for update"):
-            booking_id, response = create_booking(auth_client)
-            created = response.json()["booking"]
+    def test_update_booking_full(self, auth_client, exclusive_booking):
+        with allure.step("Take a pre-created booking for update"):
+            booking_id, created = exclusive_booking
 
-            allure.attach(
-                json.dumps(created, indent=2),
+            attach(
+                created,
                 name="Created Booking",
                 attachment_type=allure.attachment_type.JSON
             )
@@ -342,16 +314,16 @@ class TestUpdateBooking:
             new_payload["depositpaid"] = False
             new_payload["totalprice"] = 555
 
-            allure.attach(
-                json.dumps(new_payload, indent=2),
+            attach(
+                new_payload,
                 name="Update Payload",
                 attachment_type=allure.attachment_type.JSON
             )
 
         with allure.step(f"PUT /booking/{booking_id} — full update"):
             response = update_booking_full(auth_client, booking_id, new_payload)
-            allure.attach(
-                response.text,
+            attach(
+                response,
                 name="PUT Response",
                 attachment_type=allure.attachment_type.JSON
             )
@@ -359,13 +331,13 @@ class TestUpdateBooking:
 
         with allure.step("GET updated booking and validate fields"):
             updated = auth_client.get(f"/booking/{booking_id}")
-            allure.attach(
-                updated.text,
+            attach(
+                updated,
                 name="Updated Booking Response",
                 attachment_type=allure.attachment_type.JSON
             )
 
-            body = updated.json()
+            body = updated.booking
 
             assert body["firstname"] == "AlinaNew"
             assert body["lastname"] == "RozhkoNew"
@@ -374,29 +346,28 @@ class TestUpdateBooking:
 
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.title("Partial update of an existing booking")
-    def test_update_booking_partial(self, auth_client):
-        with allure.step("Create booking to patch"):
-            booking_id, response = create_booking(auth_client)
-            created = response.json()["booking"]
+    def test_update_booking_partial(self, auth_client, exclusive_booking):
+        with allure.step("Take a pre-created booking to patch"):
+            booking_id, created = exclusive_booking
 
-            allure.attach(
-                json.dumps(created, indent=2),
+            attach(
+                created,
                 name="Created Booking",
                 attachment_type=allure.attachment_type.JSON
             )
 
         with allure.step("Prepare partial update payload"):
             patch_payload = {"firstname": "OnlyPatched"}
-            allure.attach(
-                json.dumps(patch_payload, indent=2),
+            attach(
+                patch_payload,
                 name="PATCH Payload",
                 attachment_type=allure.attachment_type.JSON
             )
 
         with allure.step(f"PATCH /booking/{booking_id} — partial update"):
             response = update_booking_partial(auth_client, booking_id, patch_payload)
-            allure.attach(
-                response.text,
+            attach(
+                response,
                 name="PATCH Response",
                 attachment_type=allure.attachment_type.JSON
             )
@@ -405,8 +376,8 @@ class TestUpdateBooking:
         with allure.step("Verify patched firstname"):
             updated = auth_client.get(f"/booking/{booking_id}")
             body = updated.json()
-            allure.attach(
-                json.dumps(body, indent=2),
+            attach(
+                body,
                 name="After PATCH",
                 attachment_type=allure.attachment_type.JSON
             )
@@ -419,8 +390,8 @@ class TestUpdateBooking:
 
         with allure.step("Prepare valid update payload for invalid ID"):
             payload = valid_booking_payload()
-            allure.attach(
-                json.dumps(payload, indent=2),
+            attach(
+                payload,
                 name="Payload Sent to Invalid ID",
                 attachment_type=allure.attachment_type.JSON
             )
@@ -428,8 +399,8 @@ class TestUpdateBooking:
         with allure.step(f"PUT /booking/{invalid_id} — expecting error"):
             response = update_booking_full(client, invalid_id, payload)
 
-            allure.attach(
-                response.text,
+            attach(
+                response,
                 name="Invalid Update Response",
                 attachment_type=allure.attachment_type.TEXT
             )
@@ -446,21 +417,20 @@ class TestDeleteBooking:
 
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.title("Successful deletion of an existing booking")
-    def test_delete_booking_success(self, auth_client):
-        with allure.step("Create booking for deletion"):
-            booking_id, response = create_booking(auth_client)
-            booking_data = response.json()["booking"]
+    def test_delete_booking_success(self, auth_client, exclusive_booking):
+        with allure.step("Take a pre-created booking for deletion"):
+            booking_id, booking_data = exclusive_booking
 
-            allure.attach(
-                json.dumps(booking_data, indent=2),
+            attach(
+                booking_data,
                 name="Created Booking",
                 attachment_type=allure.attachment_type.JSON
             )
 
         with allure.step(f"DELETE /booking/{booking_id}"):
             response = delete_booking(auth_client, booking_id)
-            allure.attach(
-                response.text,
+            attach(
+                response,
                 name="Delete Response",
                 attachment_type=allure.attachment_type.TEXT
             )
@@ -469,8 +439,8 @@ class TestDeleteBooking:
         with allure.step("Verify booking no longer exists"):
             get_resp = auth_client.get(f"/booking/{booking_id}")
 
-            allure.attach(
-                get_resp.text,
+            attach(
+                get_resp,
                 name="GET After Deletion",
                 attachment_type=allure.attachment_type.TEXT
             )
@@ -486,8 +456,8 @@ class TestDeleteBooking:
         with allure.step("Attempt delete for invalid ID"):
             response = delete_booking(auth_client, invalid_id)
 
-            allure.attach(
-                response.text,
+            attach(
+                response,
                 name="Delete Invalid ID Response",
                 attachment_type=allure.attachment_type.TEXT
             )
@@ -497,15 +467,15 @@ class TestDeleteBooking:
 
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.title("Attempt to delete booking without authentication token")
-    def test_delete_booking_without_token(self, client):
-        with allure.step("Create booking (no auth required)"):
-            booking_id, _ = create_booking(client)
+    def test_delete_booking_without_token(self, client, exclusive_booking):
+        with allure.step("Take a pre-created booking"):
+            booking_id, _ = exclusive_booking
 
         with allure.step("Attempt DELETE without token"):
             response = delete_booking(client, booking_id)
 
-            allure.attach(
-                response.text,
+            attach(
+                response,
                 name="Unauthorized Delete Response",
                 attachment_type=allure.attachment_type.TEXT
             )
@@ -515,15 +485,15 @@ class TestDeleteBooking:
 
     @allure.severity(allure.severity_level.NORMAL)
     @allure.title("Delete booking twice → second delete should return 404/405")
-    def test_delete_booking_twice(self, auth_client):
-        with allure.step("Create booking for double delete"):
-            booking_id, _ = create_booking(auth_client)
+    def test_delete_booking_twice(self, auth_client, exclusive_booking):
+        with allure.step("Take a pre-created booking for double delete"):
+            booking_id, _ = exclusive_booking
 
         with allure.step("First DELETE request"):
             first_resp = delete_booking(auth_client, booking_id)
 
-            allure.attach(
-                first_resp.text,
+            attach(
+                first_resp,
                 name="First Delete Response",
                 attachment_type=allure.attachment_type.TEXT
             )
@@ -533,8 +503,8 @@ class TestDeleteBooking:
         with allure.step("Second DELETE request → expect 404/405"):
             second_resp = delete_booking(auth_client, booking_id)
 
-            allure.attach(
-                second_resp.text,
+            attach(
+                second_resp,
                 name="Second Delete Response",
                 attachment_type=allure.attachment_type.TEXT
             )
@@ -544,14 +514,14 @@ class TestDeleteBooking:
 
     @allure.severity(allure.severity_level.NORMAL)
     @allure.title("GET after deletion should return 404 Not Found")
-    def test_delete_booking_then_get_returns_404(self, auth_client):
-        with allure.step("Create booking"):
-            booking_id, _ = create_booking(auth_client)
+    def test_delete_booking_then_get_returns_404(self, auth_client, exclusive_booking):
+        with allure.step("Take a pre-created booking"):
+            booking_id, _ = exclusive_booking
 
         with allure.step("DELETE booking"):
             delete_resp = delete_booking(auth_client, booking_id)
-            allure.attach(
-                delete_resp.text,
+            attach(
+                delete_resp,
                 name="Delete Response",
                 attachment_type=allure.attachment_type.TEXT
             )
@@ -560,8 +530,8 @@ class TestDeleteBooking:
         with allure.step("GET deleted booking → expect 404"):
             get_resp = auth_client.get(f"/booking/{booking_id}")
 
-            allure.attach(
-                get_resp.text,
+            attach(
+                get_resp,
                 name="GET After Deletion",
                 attachment_type=allure.attachment_type.TEXT
             )
@@ -586,14 +556,14 @@ class TestNegativeBooking:
         with allure.step("Send POST /booking with missing fields"):
             booking_id, response = create_booking(client, payload)
 
-            allure.attach(
-                json.dumps(payload, indent=2),
+            attach(
+                payload,
                 name="Invalid Payload (Missing Fields)",
                 attachment_type=allure.attachment_type.JSON
             )
 
-            allure.attach(
-                response.text,
+            attach(
+                response,
                 name="Response Body",
                 attachment_type=allure.attachment_type.TEXT
             )
@@ -611,14 +581,14 @@ class TestNegativeBooking:
         with allure.step("Send POST /booking with invalid dates"):
             booking_id, response = create_booking(client, payload)
 
-            allure.attach(
-                json.dumps(payload, indent=2),
+            attach(
+                payload,
                 name="Invalid Dates Payload",
                 attachment_type=allure.attachment_type.JSON
             )
 
-            allure.attach(
-                response.text,
+            attach(
+                response,
                 name="Response Body",
                 attachment_type=allure.attachment_type.TEXT
             )
@@ -640,14 +610,14 @@ class TestNegativeBooking:
         with allure.step(f"Send PUT /booking/{invalid_id} for nonexistent booking"):
             response = update_booking_full(client, booking_id=invalid_id, payload=payload)
 
-            allure.attach(
-                json.dumps(payload, indent=2),
+            attach(
+                payload,
                 name="Payload for Nonexistent Booking",
                 attachment_type=allure.attachment_type.JSON
             )
 
-            allure.attach(
-                response.text,
+            attach(
+                response,
                 name="Response Body",
                 attachment_type=allure.attachment_type.TEXT
             )
@@ -658,15 +628,15 @@ class TestNegativeBooking:
 
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.title("Delete booking without authentication → expect 403 (forbidden)")
-    def test_delete_booking_unauthorized(self, client):
-        with allure.step("Create booking with no auth"):
-            booking_id, _ = create_booking(client)
+    def test_delete_booking_unauthorized(self, client, exclusive_booking):
+        with allure.step("Take a pre-created booking"):
+            booking_id, _ = exclusive_booking
 
         with allure.step("Attempt to DELETE without token"):
             response = delete_booking(client, booking_id)
 
-            allure.attach(
-                response.text,
+            attach(
+                response,
                 name="Unauthorized Delete Response",
                 attachment_type=allure.attachment_type.TEXT
             )
@@ -693,13 +663,13 @@ class TestBoundaryBooking:
         with allure.step("Send POST /booking with 255-char names"):
             booking_id, response = create_booking(client, payload)
 
-            allure.attach(
-                json.dumps(payload, indent=2),
+            attach(
+                payload,
                 name="Payload (255-char names)",
                 attachment_type=allure.attachment_type.JSON
             )
-            allure.attach(response.text, "Response Body",
-                          allure.attachment_type.TEXT)
+            attach(response, "Response Body",
+                   allure.attachment_type.TEXT)
 
         with allure.step("Validate creation with 255-char names"):
             assert response.status_code == 200
@@ -716,8 +686,8 @@ class TestBoundaryBooking:
         with allure.step("Send POST /booking with totalprice = 0"):
             booking_id, response = create_booking(client, payload)
 
-            allure.attach(
-                json.dumps(payload, indent=2),
+            attach(
+                payload,
                 name="Payload (totalprice=0)",
                 attachment_type=allure.attachment_type.JSON
             )
@@ -735,8 +705,8 @@ class TestBoundaryBooking:
         with allure.step("Send POST /booking with huge totalprice"):
             booking_id, response = create_booking(client, payload)
 
-            allure.attach(
-                json.dumps(payload, indent=2),
+            attach(
+                payload,
                 name="Payload (1B price)",
                 attachment_type=allure.attachment_type.JSON
             )
@@ -755,8 +725,8 @@ class TestBoundaryBooking:
         with allure.step("Send POST /booking with year 2100 dates"):
             booking_id, response = create_booking(client, payload)
 
-            allure.attach(
-                json.dumps(payload, indent=2),
+            attach(
+                payload,
                 name="Payload (far-future dates)",
                 attachment_type=allure.attachment_type.JSON
             )
@@ -774,9 +744,9 @@ class TestBoundaryBooking:
 
         with allure.step("Send POST /booking with same-day dates"):
             booking_id, response = create_booking(client, payload)
-            allure.attach(json.dumps(payload, indent=2),
-                          "Payload (same-day dates)",
-                          allure.attachment_type.JSON)
+            attach(payload,
+                   "Payload (same-day dates)",
+                   allure.attachment_type.JSON)
 
         with allure.step("Validate API behaviour (200 or 500 allowed)"):
             assert response.status_code in (200, 500)
@@ -790,8 +760,8 @@ class TestBoundaryBooking:
         with allure.step("Send POST /booking with empty firstname"):
             booking_id, response = create_booking(client, payload)
 
-            allure.attach(
-                json.dumps(payload, indent=2),
+            attach(
+                payload,
                 name="Payload (empty firstname)",
                 attachment_type=allure.attachment_type.JSON
             )
@@ -808,8 +778,8 @@ class TestBoundaryBooking:
         with allure.step("Send POST /booking with 500-char field"):
             booking_id, response = create_booking(client, payload)
 
-            allure.attach(
-                json.dumps(payload, indent=2),
+            attach(
+                payload,
                 name="Payload (500-char additionalneeds)",
                 attachment_type=allure.attachment_type.JSON
             )
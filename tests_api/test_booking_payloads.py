@@ -0,0 +1,61 @@
+import itertools
+
+import pytest
+
+from helpers.booking_payloads import BookingPayloadGenerator, PayloadStream, generate_bookings
+from helpers.schemas import registry
+
+
+def booking_key(payload):
+    dates = payload["bookingdates"]
+    return payload["firstname"], payload["lastname"], dates["checkin"], dates["checkout"]
+
+
+@pytest.mark.booking
+class TestBookingPayloadGenerator:
+
+    def test_same_seed_same_stream(self):
+        assert list(generate_bookings(50, seed=7)) == list(generate_bookings(50, seed=7))
+        assert list(generate_bookings(50, seed=7)) != list(generate_bookings(50, seed=8))
+
+    def test_payloads_are_unique(self):
+        keys = {booking_key(p) for p in generate_bookings(20000, seed=3, batch_size=512)}
+
+        assert len(keys) == 20000
+
+    def test_each_name_matches_one_payload(self):
+        payloads = list(generate_bookings(20000, seed=3))
+
+        assert len({p["firstname"] for p in payloads}) == 20000
+        assert len({p["lastname"] for p in payloads}) == 20000
+
+    def test_payloads_match_booking_schema(self):
+        for payload in generate_bookings(200, seed=1):
+            registry.assert_matches("booking", payload)
+            dates = payload["bookingdates"]
+            assert dates["checkin"] < dates["checkout"]
+            assert payload["totalprice"] >= 1
+
+    def test_stream_is_lazy_and_resumable(self):
+        generator = BookingPayloadGenerator(seed=5, batch_size=100)
+        endless = generator.stream()
+
+        first = list(itertools.islice(endless, 250))
+        assert list(generator.stream(10, start=245)) == first[245:] + list(itertools.islice(endless, 5))
+
+    def test_distributions_follow_settings(self):
+        payloads = list(generate_bookings(5000, seed=2))
+        deposit_ratio = sum(p["depositpaid"] for p in payloads) / len(payloads)
+
+        assert 0.65 < deposit_ratio < 0.75
+        assert len({p["firstname"] for p in payloads}) > 50
+        assert len({p["additionalneeds"] for p in payloads}) > 1
+
+    def test_payload_stream_is_thread_safe(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        stream = PayloadStream(BookingPayloadGenerator(seed=9))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            payloads = list(pool.map(lambda _: stream.next(), range(2000)))
+
+        assert len({booking_key(p) for p in payloads}) == 2000
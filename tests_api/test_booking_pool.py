@@ -0,0 +1,81 @@
+import time
+
+import pytest
+
+from helpers.booking_payloads import PayloadStream, invalid_payload_missing_fields
+from helpers.booking_pool import BookingPool
+
+
+class BrokenPayloads(PayloadStream):
+    # Missing lastname, price, dates: the server answers every POST with 500.
+    def next(self):
+        return invalid_payload_missing_fields()
+
+
+@pytest.mark.booking
+class TestBookingPool:
+
+    def test_shared_leases_are_reused(self, local_server):
+        pool = BookingPool(shared=2, base_url=local_server.url).start()
+        try:
+            ids = {pool.lease_shared().booking_id for _ in range(6)}
+        finally:
+            pool.close()
+
+        # Leasing starts as soon as the first shared booking exists.
+        assert 1 <= len(ids) <= 2
+        assert pool.created == 2
+
+    def test_exclusive_leases_are_unique(self, local_server):
+        pool = BookingPool(shared=1, exclusive=5, base_url=local_server.url, refill_below=0).start()
+        try:
+            leases = [pool.take_exclusive() for _ in range(5)]
+        finally:
+            pool.close()
+
+        assert len({lease.booking_id for lease in leases}) == 5
+        assert all(lease.booking["firstname"] for lease in leases)
+
+    def test_exhausted_pool_creates_inline(self, local_server):
+        pool = BookingPool(shared=1, exclusive=0, base_url=local_server.url, refill_below=0).start()
+        try:
+            booking_id, booking = pool.take_exclusive()
+        finally:
+            pool.close()
+
+        assert booking_id is not None
+        assert booking["lastname"]
+
+    def test_exclusive_queue_refilled_in_background(self, local_server):
+        pool = BookingPool(shared=1, exclusive=1, base_url=local_server.url, refill_below=3).start()
+        try:
+            pool.take_exclusive()
+            deadline = time.monotonic() + 5
+            while pool._exclusive.qsize() < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert pool._exclusive.qsize() == 3
+        finally:
+            pool.close()
+
+    def test_failed_creation_fails_fast(self, local_server):
+        pool = BookingPool(shared=1, exclusive=1, base_url=local_server.url, payloads=BrokenPayloads()).start()
+        started = time.perf_counter()
+        try:
+            with pytest.raises(RuntimeError, match="returned 500"):
+                pool.lease_shared()
+            with pytest.raises(RuntimeError, match="exclusive lease"):
+                pool.take_exclusive()
+        finally:
+            pool.close()
+
+        assert time.perf_counter() - started < 5
+
+    def test_pool_backoff_not_charged_to_current_test(self, local_server, retry_budget):
+        pool = BookingPool(shared=1, base_url=local_server.url)
+        try:
+            policy = pool._client().retry_policy
+            assert policy.budget is not retry_budget
+            policy.charge(1.5)
+            assert retry_budget.spent() == 0
+        finally:
+            pool.close()
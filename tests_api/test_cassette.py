@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+from helpers.api_client import APIClient
+from helpers.booking_payloads import valid_booking_payload
+from helpers.cassette import Cassette, CassetteMiss, normalize_url
+from helpers.metrics import MetricsRegistry
+
+
+@pytest.mark.booking
+class TestCassette:
+
+    def test_normalize_url_drops_host_and_sorts_query(self):
+        url = "http://127.0.0.1:5000/booking"
+
+        assert normalize_url(url, {"lastname": "B", "firstname": "A"}) == "/booking?firstname=A&lastname=B"
+        assert normalize_url(url, {"firstname": None}) == "/booking"
+
+    def test_record_streams_one_line_per_exchange(self, local_server, tmp_path):
+        path = tmp_path / "cassette.jsonl"
+        cassette = Cassette(str(path), "record")
+        client = APIClient(base_url=local_server.url, cassette=cassette, metrics_registry=MetricsRegistry())
+
+        client.get("/ping")
+        assert len(path.read_text().splitlines()) == 1
+
+        client.post("/booking", json=valid_booking_payload())
+        cassette.close()
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["request"]["method"] for line in lines] == ["GET", "POST"]
+        assert lines[0]["response"]["body"] == "Created"
+
+    def test_replay_without_server(self, local_server, tmp_path):
+        path = str(tmp_path / "cassette.jsonl")
+        recorder = Cassette(path, "record")
+        client = APIClient(base_url=local_server.url, cassette=recorder, metrics_registry=MetricsRegistry())
+        booking_id = client.post("/booking", json=valid_booking_payload()).json()["bookingid"]
+        first = client.get(f"/booking/{booking_id}")
+        client.patch(f"/booking/{booking_id}", json={"firstname": "Patched"})
+        recorder.close()
+
+        player = Cassette(path, "replay")
+        offline = APIClient(base_url="http://127.0.0.1:9", cassette=player)
+
+        replayed_id = offline.post("/booking", json=valid_booking_payload()).json()["bookingid"]
+        replayed = offline.get(f"/booking/{replayed_id}")
+        patched = offline.patch(f"/booking/{replayed_id}", json={"firstname": "Patched"})
+        player.close()
+
+        assert replayed_id == booking_id
+        assert replayed.status_code == 200
+        assert replayed.json() == first.json()
+        # No token was sent, so the server's 403 is what was recorded.
+        assert patched.status_code == 403
+        assert "application/json" in replayed.headers["content-type"]
+
+    def test_repeated_calls_replay_in_order(self, local_server, tmp_path):
+        path = str(tmp_path / "cassette.jsonl")
+        client = APIClient(base_url=local_server.url, cassette=Cassette(path, "record"),
+                           token="unused", metrics_registry=MetricsRegistry())
+        booking_id = client.post("/booking", json=valid_booking_payload()).json()["bookingid"]
+        before = client.get(f"/booking/{booking_id}").status_code
+        local_server.store.delete(booking_id)
+        after = client.get(f"/booking/{booking_id}").status_code
+        client.cassette.close()
+
+        offline = APIClient(base_url="http://127.0.0.1:9", cassette=Cassette(path, "replay"))
+        offline.post("/booking", json=valid_booking_payload())
+
+        assert (before, after) == (200, 404)
+        assert offline.get(f"/booking/{booking_id}").status_code == 200
+        assert offline.get(f"/booking/{booking_id}").status_code == 404
+        # Past the recorded calls the last recorded exchange keeps being served.
+        assert offline.get(f"/booking/{booking_id}").status_code == 404
+
+    def test_unrecorded_request_raises(self, tmp_path):
+        path = tmp_path / "empty.jsonl"
+        path.write_text("")
+        offline = APIClient(base_url="http://127.0.0.1:9", cassette=Cassette(str(path), "replay"))
+
+        with pytest.raises(CassetteMiss):
+            offline.get("/ping")
+
+    def test_index_built_lazily(self, tmp_path):
+        path = tmp_path / "lazy.jsonl"
+        path.write_text("")
+        cassette = Cassette(str(path), "replay")
+
+        assert cassette._index is None
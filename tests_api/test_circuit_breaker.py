@@ -0,0 +1,130 @@
+import time
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from helpers.api_client import APIClient
+from helpers.circuit_breaker import CircuitBreaker, CircuitOpenError, breaker_for
+from helpers.health import wait_until_healthy
+from helpers.metrics import MetricsRegistry
+from helpers.retry import RetryBudget, RetryPolicy
+
+
+class RaisingAdapter(BaseAdapter):
+    # Fails every request with `error` before any response arrives.
+
+    def __init__(self, error: BaseException):
+        super().__init__()
+        self.error = error
+
+    def send(self, request, **kwargs):
+        raise self.error
+
+    def close(self):
+        pass
+
+
+def unused_port_url():
+    import socket
+
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{s.getsockname()[1]}"
+
+
+@pytest.mark.smoke
+class TestCircuitBreaker:
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker("http://api", failure_threshold=3, reset_timeout=60)
+        for _ in range(2):
+            breaker.before_call()
+            breaker.record(status=503)
+        breaker.before_call()
+        breaker.record(status=200)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        for _ in range(3):
+            breaker.before_call()
+            breaker.record(error=requests.exceptions.ConnectionError())
+
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError, match="http://api is open after 3 consecutive failures"):
+            breaker.before_call()
+
+    def test_other_errors_do_not_count(self):
+        breaker = CircuitBreaker("http://api", failure_threshold=1)
+
+        breaker.record(status=500)
+        breaker.record(status=404)
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_lets_one_probe_through(self):
+        breaker = CircuitBreaker("http://api", failure_threshold=1, reset_timeout=0.05)
+        breaker.record(status=503)
+        time.sleep(0.06)
+
+        breaker.before_call()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record(status=503)
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.times_opened == 2
+
+        time.sleep(0.06)
+        breaker.before_call()
+        breaker.record(status=201)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    @pytest.mark.own_server
+    def test_half_open_probe_resolved_by_non_connection_error(self):
+        url = unused_port_url()
+        client = APIClient(base_url=url, metrics_registry=MetricsRegistry())
+        client.circuit_breaker = breaker = CircuitBreaker(url, failure_threshold=1, reset_timeout=0.05)
+        client.session.mount(url + "/", RaisingAdapter(requests.exceptions.ChunkedEncodingError("truncated")))
+        breaker.record(status=503)
+        time.sleep(0.06)
+
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            client.get("/ping")
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.last_failure == "ChunkedEncodingError"
+
+        time.sleep(0.06)
+        breaker.before_call()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    @pytest.mark.own_server
+    def test_client_fails_fast_once_open(self):
+        url = unused_port_url()
+        client = APIClient(base_url=url, metrics_registry=MetricsRegistry(),
+                           retry_policy=RetryPolicy(backoff_factor=0.001, budget=RetryBudget(30)))
+
+        # One GET: the first attempt plus retries hit the threshold and open the circuit.
+        with pytest.raises(CircuitOpenError):
+            client.get("/ping")
+        assert breaker_for(url).state == CircuitBreaker.OPEN
+
+        started = time.perf_counter()
+        with pytest.raises(CircuitOpenError):
+            APIClient(base_url=url, metrics_registry=MetricsRegistry()).get("/ping")
+        assert time.perf_counter() - started < 0.05
+
+
+@pytest.mark.healthcheck
+class TestHealthGate:
+
+    def test_healthy_server(self, local_server):
+        healthy, detail = wait_until_healthy(local_server.url, attempts=3, backoff=0)
+
+        assert healthy, detail
+
+    def test_dead_server(self):
+        healthy, detail = wait_until_healthy(unused_port_url(), attempts=2, backoff=0.01, timeout=1)
+
+        assert not healthy
+        assert "failed 2 times" in detail
@@ -0,0 +1,51 @@
+import pytest
+
+from helpers.api_client import APIClient
+from helpers.auth import TokenProvider
+from helpers.booking_helpers import create_booking, delete_booking, get_booking
+from helpers.cleanup import BookingRegistry, created_bookings
+from helpers.metrics import MetricsRegistry
+
+
+@pytest.mark.booking
+class TestBookingCleanup:
+
+    def test_created_bookings_are_tracked(self, local_server):
+        client = APIClient(base_url=local_server.url, metrics_registry=MetricsRegistry())
+
+        booking_id, _ = create_booking(client)
+
+        assert booking_id in created_bookings.pending(local_server.url)
+
+    def test_deleted_bookings_are_untracked(self, local_server):
+        client = APIClient(base_url=local_server.url, token_provider=TokenProvider(base_url=local_server.url),
+                           metrics_registry=MetricsRegistry())
+        booking_id, _ = create_booking(client)
+
+        delete_booking(client, booking_id)
+
+        assert booking_id not in created_bookings.pending(local_server.url)
+
+    def test_cleanup_deletes_in_parallel(self, local_server):
+        registry = BookingRegistry()
+        client = APIClient(base_url=local_server.url, token_provider=TokenProvider(base_url=local_server.url),
+                           metrics_registry=MetricsRegistry())
+        ids = [create_booking(client)[0] for _ in range(10)]
+        for booking_id in ids:
+            registry.record(local_server.url, booking_id)
+        registry.record(local_server.url, 99999999)
+
+        result = registry.cleanup(client, workers=4)
+
+        assert (result.cleaned, result.skipped, result.failed) == (10, 1, 0)
+        assert all(get_booking(client, i).status_code == 404 for i in ids)
+
+    def test_unauthenticated_cleanup_fails(self, local_server):
+        registry = BookingRegistry()
+        client = APIClient(base_url=local_server.url, metrics_registry=MetricsRegistry())
+        registry.record(local_server.url, create_booking(client)[0])
+
+        result = registry.cleanup(client)
+
+        assert result.failed == 1
+        assert len(registry.pending(local_server.url)) == 1
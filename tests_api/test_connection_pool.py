@@ -0,0 +1,31 @@
+import pytest
+
+from helpers.api_client import APIClient
+from helpers.connection_pool import get_adapter, pool_stats
+from helpers.metrics import MetricsRegistry
+
+
+@pytest.mark.smoke
+class TestConnectionPool:
+
+    def test_clients_share_adapter_per_base_url(self, local_server):
+        first = APIClient(base_url=local_server.url, metrics_registry=MetricsRegistry())
+        second = APIClient(base_url=local_server.url + "/", metrics_registry=MetricsRegistry())
+
+        adapter = get_adapter(local_server.url)
+
+        assert first.session.get_adapter(local_server.url + "/ping") is adapter
+        assert second.session.get_adapter(local_server.url + "/ping") is adapter
+
+    def test_connections_reused_across_clients(self, local_server):
+        before = pool_stats(local_server.url)
+
+        for _ in range(5):
+            response = APIClient(base_url=local_server.url, metrics_registry=MetricsRegistry()).get("/ping")
+            assert response.status_code == 201
+
+        after = pool_stats(local_server.url)
+
+        assert after["requests"] - before["requests"] == 5
+        assert after["opened"] - before["opened"] <= 1
+        assert after["reused"] - before["reused"] >= 4
@@ -0,0 +1,60 @@
+import pytest
+
+from helpers.load_runner import DEFAULT_MIX, LoadRunner, parse_mix
+
+
+@pytest.mark.load
+class TestLoadRunner:
+
+    def test_parse_mix(self):
+        assert parse_mix("create=2,get=4,filter") == {"create": 2, "get": 4, "filter": 1}
+
+    def test_unknown_operation_rejected(self, local_server):
+        with pytest.raises(ValueError):
+            LoadRunner({"explode": 1}, base_url=local_server.url)
+
+    def test_mixed_workload_report(self, local_server):
+        report = LoadRunner(concurrency=4, duration=1, base_url=local_server.url).run()
+        data = report.as_dict()
+
+        assert data["total"] > 0
+        assert data["errors"] == 0, report.summary()
+        assert set(data["operations"]) == set(DEFAULT_MIX)
+        for name, op in data["operations"].items():
+            assert op["count"] > 0, f"{name} never ran"
+            assert op["p50"] <= op["p90"] <= op["p99"] <= op["max"]
+
+    def test_open_loop_schedules_every_slot(self, local_server):
+        report = LoadRunner(concurrency=8, duration=1, base_url=local_server.url, rate=100).run()
+        data = report.as_dict()
+
+        assert data["mode"] == "open"
+        assert data["total"] + data["dropped"] == 100
+        assert data["errors"] == 0, report.summary()
+
+    def test_open_loop_drops_when_in_flight_cap_is_hit(self, local_server):
+        report = LoadRunner({"filter": 1}, concurrency=1, duration=0.5,
+                            base_url=local_server.url, rate=5000).run()
+
+        assert report.dropped > 0
+        assert report.total + report.dropped == 2500
+
+    def test_invalid_rate_rejected(self, local_server):
+        with pytest.raises(ValueError):
+            LoadRunner(base_url=local_server.url, rate=0)
+
+    def test_validated_workload(self, local_server):
+        report = LoadRunner(concurrency=2, duration=0.5, base_url=local_server.url, validate=True).run()
+
+        assert report.total > 0
+        assert report.errors == 0, report.summary()
+
+    def test_delete_fallback_is_recorded_as_create(self, local_server):
+        # With nothing disposable a delete turns into a create; it must not skew delete latencies.
+        report = LoadRunner({"delete": 1}, concurrency=1, duration=0.5, base_url=local_server.url).run()
+        data = report.as_dict()
+
+        assert data["errors"] == 0, report.summary()
+        creates, deletes = data["operations"]["create"]["count"], data["operations"]["delete"]["count"]
+        assert deletes > 0
+        assert creates - deletes in (0, 1)
@@ -0,0 +1,146 @@
+import socket
+
+import pytest
+import requests
+
+from helpers.booking_payloads import valid_booking_payload
+from helpers.local_server import BookingStore, LocalBookerServer, MultiProcessBookerServer
+
+
+def booking(firstname="Ann", lastname="Lee", checkin="2026-01-10", checkout="2026-01-12", **extra) -> dict:
+    return {
+        "firstname": firstname,
+        "lastname": lastname,
+        "totalprice": 100,
+        "depositpaid": True,
+        "bookingdates": {"checkin": checkin, "checkout": checkout},
+        **extra
+    }
+
+
+def scan(bookings: dict, firstname=None, lastname=None, checkin=None, checkout=None) -> list:
+    # Reference implementation: the linear scan the indexes replace.
+    return [
+        booking_id for booking_id, b in sorted(bookings.items())
+        if (firstname is None or b["firstname"] == firstname)
+        and (lastname is None or b["lastname"] == lastname)
+        and (checkin is None or b["bookingdates"]["checkin"] >= checkin)
+        and (checkout is None or b["bookingdates"]["checkout"] >= checkout)
+    ]
+
+
+@pytest.mark.smoke
+class TestBookingStore:
+
+    def test_round_trip(self):
+        store = BookingStore()
+        with_needs = booking(additionalneeds="Breakfast")
+        first = store.create(booking())
+        second = store.create(with_needs)
+
+        assert (first, second) == (1, 2)
+        assert store.get(first) == booking()
+        assert store.get(second) == with_needs
+        assert store.get(first) is not store.get(first)
+        assert store.get(3) is None and store.get("1") is None
+
+    def test_indexes_follow_replace_and_delete(self):
+        store = BookingStore()
+        ann, bob = store.create(booking()), store.create(booking("Bob", checkin="2026-03-01"))
+
+        assert store.filter(firstname="Ann") == [ann]
+        assert store.replace(ann, booking("Cid", checkin="2026-05-01"))
+        assert store.filter(firstname="Ann") == []
+        assert store.filter(firstname="Cid", lastname="Lee") == [ann]
+        assert store.filter(checkin="2026-02-01") == [ann, bob]
+
+        assert store.delete(bob)
+        assert not store.delete(bob)
+        assert not store.replace(bob, booking())
+        assert store.filter(checkin="2026-02-01") == [ann]
+        assert store.filter() == [ann]
+        assert len(store) == 1
+
+    def test_filters_match_linear_scan(self):
+        server = LocalBookerServer()
+        server.preload(2_000, seed=3)
+        store = server.store
+        for booking_id in range(1, 2_001, 7):
+            store.delete(booking_id)
+        bookings = {i: store.get(i) for i in range(1, 2_001) if store.get(i) is not None}
+
+        sample = bookings[1_000]
+        dates = sample["bookingdates"]
+        queries = [
+            {},
+            {"firstname": sample["firstname"]},
+            {"firstname": sample["firstname"], "lastname": sample["lastname"]},
+            {"lastname": sample["lastname"], "checkout": dates["checkout"]},
+            {"checkin": dates["checkin"]},
+            {"checkin": dates["checkin"], "checkout": dates["checkout"]},
+            {"firstname": "Nobody"},
+            {"checkin": "9999-01-01"}
+        ]
+        for query in queries:
+            assert store.filter(**query) == scan(bookings, **query), query
+
+    def test_unhashable_names_are_stored_but_not_indexed(self):
+        store = BookingStore()
+        booking_id = store.create(booking(firstname={"first": "Ann"}))
+
+        assert store.get(booking_id)["firstname"] == {"first": "Ann"}
+        assert store.filter(firstname="Ann") == []
+        assert store.delete(booking_id)
+
+    def test_id_residue_class(self):
+        store = BookingStore(first_id=2, id_step=3)
+        ids = [store.create(booking(firstname=name)) for name in ("Ann", "Bob", "Cid")]
+
+        assert ids == [2, 5, 8]
+        assert store.get(3) is None and store.get(11) is None
+        assert store.get(5)["firstname"] == "Bob"
+        assert store.delete(5)
+        assert store.filter() == [2, 8]
+        assert store.filter(checkin="2026-01-01") == [2, 8]
+
+
+@pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"), reason="needs SO_REUSEPORT")
+class TestMultiProcessServer:
+
+    def test_workers_share_port_and_state(self):
+        with MultiProcessBookerServer(workers=2) as server:
+            assert server.preload(50) == 50
+            # A fresh connection per request lets the kernel pick any worker.
+            created = [
+                requests.post(f"{server.url}/booking", json=valid_booking_payload()).json()["bookingid"]
+                for _ in range(10)
+            ]
+            for booking_id in created:
+                assert requests.get(f"{server.url}/booking/{booking_id}").status_code == 200
+
+            assert server.store.size() == 60
+            assert len(requests.get(f"{server.url}/booking").json()) == 60
+            url = server.url
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            requests.get(f"{url}/ping", timeout=1)
+
+    def test_any_worker_accepts_any_token(self):
+        with MultiProcessBookerServer(workers=2) as server:
+            server.preload(20)
+            booking_ids = [entry["bookingid"] for entry in requests.get(f"{server.url}/booking").json()]
+            token = requests.post(f"{server.url}/auth",
+                                  json={"username": "admin", "password": "password123"}).json()["token"]
+            assert server.store.is_valid_token(token)
+
+            # Bookings are split across both workers, and each request may land on either.
+            assert {booking_id % 2 for booking_id in booking_ids} == {0, 1}
+            for booking_id in booking_ids:
+                response = requests.delete(f"{server.url}/booking/{booking_id}", cookies={"token": token})
+                assert response.status_code == 201
+            assert server.store.size() == 0
+
+            server.store.revoke_tokens()
+            assert not server.store.is_valid_token(token)
+            created = requests.post(f"{server.url}/booking", json=valid_booking_payload()).json()["bookingid"]
+            assert requests.delete(f"{server.url}/booking/{created}", cookies={"token": token}).status_code == 403
@@ -0,0 +1,112 @@
+import pytest
+import requests
+
+from helpers.booking_payloads import valid_booking_payload
+from helpers.local_server import ADMIN_BASIC_AUTH, ADMIN_PASSWORD, ADMIN_USERNAME
+
+# Status codes and bodies the public Restful Booker returns, checked at the HTTP
+# level so the stand-in cannot drift from the API the suite is written against.
+
+
+@pytest.fixture
+def url(local_server):
+    # Plain requests calls: no retries, token refresh or response wrapping.
+    return local_server.url
+
+
+@pytest.fixture
+def token(url):
+    response = requests.post(f"{url}/auth", json={"username": ADMIN_USERNAME, "password": ADMIN_PASSWORD})
+    return response.json()["token"]
+
+
+@pytest.fixture
+def booking_id(url):
+    return requests.post(f"{url}/booking", json=valid_booking_payload()).json()["bookingid"]
+
+
+@pytest.mark.smoke
+class TestStandInContract:
+
+    def test_ping(self, url):
+        response = requests.get(f"{url}/ping")
+
+        assert response.status_code == 201
+        assert response.text == "Created"
+
+    def test_auth(self, url, token):
+        assert len(token) == 15
+        bad = requests.post(f"{url}/auth", json={"username": ADMIN_USERNAME, "password": "wrong"})
+
+        assert bad.status_code == 200
+        assert bad.json() == {"reason": "Bad credentials"}
+
+    def test_create_returns_id_and_booking(self, url):
+        payload = valid_booking_payload()
+        response = requests.post(f"{url}/booking", json=payload)
+
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith("application/json")
+        assert response.json()["booking"] == payload
+        assert isinstance(response.json()["bookingid"], int)
+
+    def test_get_existing_and_unknown(self, url, booking_id):
+        assert requests.get(f"{url}/booking/{booking_id}").json() == valid_booking_payload()
+
+        unknown = requests.get(f"{url}/booking/999999999")
+        assert unknown.status_code == 404
+        assert unknown.text == "Not Found"
+        assert requests.get(f"{url}/booking/not-a-number").status_code == 404
+
+    @pytest.mark.parametrize("method", ["PUT", "PATCH", "DELETE"])
+    def test_writes_without_token_are_forbidden(self, url, booking_id, method):
+        for cookies in ({}, {"token": "not-a-real-token"}):
+            response = requests.request(method, f"{url}/booking/{booking_id}",
+                                        json=valid_booking_payload(), cookies=cookies)
+            assert response.status_code == 403
+            assert response.text == "Forbidden"
+
+    def test_basic_auth_is_accepted(self, url, booking_id):
+        response = requests.delete(f"{url}/booking/{booking_id}", headers={"Authorization": ADMIN_BASIC_AUTH})
+
+        assert response.status_code == 201
+
+    @pytest.mark.parametrize("method", ["PUT", "PATCH", "DELETE"])
+    def test_writes_to_unknown_id_are_not_allowed(self, url, token, method):
+        response = requests.request(method, f"{url}/booking/999999999",
+                                    json=valid_booking_payload(), cookies={"token": token})
+
+        assert response.status_code == 405
+        assert response.text == "Method Not Allowed"
+
+    def test_bad_bodies(self, url, token, booking_id):
+        missing_fields = {"firstname": "Ann"}
+
+        assert requests.post(f"{url}/booking", json=missing_fields).status_code == 500
+        assert requests.post(f"{url}/booking", data="{not json",
+                             headers={"Content-Type": "application/json"}).status_code == 500
+        assert requests.put(f"{url}/booking/{booking_id}", json=missing_fields,
+                            cookies={"token": token}).status_code == 400
+
+    def test_update_and_delete(self, url, token, booking_id):
+        payload = valid_booking_payload()
+        payload["firstname"] = "Updated"
+
+        put = requests.put(f"{url}/booking/{booking_id}", json=payload, cookies={"token": token})
+        assert put.status_code == 200
+        assert put.json() == payload
+
+        patch = requests.patch(f"{url}/booking/{booking_id}", json={"lastname": "Patched"},
+                               cookies={"token": token})
+        assert patch.status_code == 200
+        assert patch.json()["lastname"] == "Patched"
+
+        delete = requests.delete(f"{url}/booking/{booking_id}", cookies={"token": token})
+        assert delete.status_code == 201
+        assert delete.text == "Created"
+        assert requests.get(f"{url}/booking/{booking_id}").status_code == 404
+
+    def test_unknown_routes(self, url):
+        assert requests.get(f"{url}/nothing-here").status_code == 404
+        assert requests.put(f"{url}/ping").status_code == 404
+        assert requests.delete(f"{url}/booking").status_code == 404
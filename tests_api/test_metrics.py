@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from helpers.api_client import APIClient
+from helpers.booking_payloads import valid_booking_payload
+from helpers.metrics import LatencyHistogram, MetricsRegistry, route_template
+
+
+@pytest.mark.smoke
+class TestLatencyHistogram:
+
+    def test_percentiles_within_one_percent(self):
+        histogram = LatencyHistogram()
+        samples = [i / 1000 for i in range(1, 1001)]  # 1ms .. 1s
+        random.shuffle(samples)
+        for value in samples:
+            histogram.record(value)
+
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(0.5, rel=0.01)
+        assert histogram.percentile(90) == pytest.approx(0.9, rel=0.01)
+        assert histogram.percentile(99) == pytest.approx(0.99, rel=0.01)
+        assert histogram.percentile(100) == pytest.approx(1.0)
+
+    def test_memory_does_not_grow_with_samples(self):
+        histogram = LatencyHistogram()
+        for _ in range(100_000):
+            histogram.record(0.0123)
+
+        assert len(histogram._buckets) == 1
+        assert histogram.percentile(99) == pytest.approx(0.0123, rel=0.01)
+
+    def test_merge(self):
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(0.001)
+        second.record(0.002)
+
+        first.merge(second)
+
+        assert first.count == 2
+        assert first.summary()["max"] == pytest.approx(0.002)
+
+    def test_empty_histogram(self):
+        assert LatencyHistogram().summary()["p99"] == 0.0
+
+
+@pytest.mark.smoke
+class TestMetricsRegistry:
+
+    @pytest.mark.parametrize("path, expected", [
+        ("/booking/123", "/booking/{id}"),
+        ("/booking/abc", "/booking/{id}"),
+        ("/booking?firstname=Alina", "/booking"),
+        ("/ping", "/ping"),
+        ("/orders/7/items", "/orders/{id}/items"),
+    ])
+    def test_route_template(self, path, expected):
+        assert route_template(path) == expected
+
+    def test_client_records_per_route(self, local_server):
+        registry = MetricsRegistry()
+        client = APIClient(base_url=local_server.url, metrics_registry=registry)
+
+        client.post("/booking", json=valid_booking_payload())
+        client.get("/booking/1")
+        client.get("/booking/2")
+        client.get("/ping")
+
+        summary = registry.summary()
+        assert summary["GET /booking/{id}"]["count"] == 2
+        assert summary["GET /ping"]["count"] == 1
+        assert "POST /booking" in summary
+
+    def test_export_merges_into_another_registry(self):
+        worker, controller = MetricsRegistry(), MetricsRegistry()
+        worker.record("GET", "/booking/1", 0.010)
+        worker.record("GET", "/booking/2", 0.020)
+        worker.record_phases("GET", "/booking/1", {"ttfb": 0.008, "reused": True})
+        controller.record("GET", "/booking/3", 0.030)
+
+        controller.merge_export(worker.export())
+
+        summary = controller.summary()["GET /booking/{id}"]
+        assert summary["count"] == 3
+        assert summary["max"] == pytest.approx(0.030)
+        assert summary["phases"]["ttfb"]["p50"] == pytest.approx(0.008, rel=0.01)
@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from helpers import microbench
+from helpers.booking_helpers import create_booking, iter_booking_ids
+from helpers.cleanup import created_bookings
+
+
+def report(**min_us) -> dict:
+    return {"benchmarks": {name: {"min_us": value, "median_us": value, "calls": 1} for name, value in min_us.items()}}
+
+
+@pytest.fixture(autouse=True)
+def forget_mock_bookings():
+    yield
+    created_bookings.forget(microbench.MOCK_BASE_URL)
+
+
+@pytest.mark.benchmark
+class TestMicrobench:
+
+    def test_mock_transport_answers_every_verb(self):
+        client = microbench.mock_client()
+        booking_id, created = create_booking(client)
+
+        assert booking_id == 1 and created.status_code == 200
+        assert client.get(f"/booking/{booking_id}").booking["firstname"]
+        assert client.put(f"/booking/{booking_id}", json={}).status_code == 200
+        assert client.patch(f"/booking/{booking_id}", json={}).status_code == 200
+        assert client.delete(f"/booking/{booking_id}").status_code == 201
+        assert len(list(iter_booking_ids(client))) == microbench.LIST_SIZE
+        assert client.get("/nowhere").status_code == 404
+
+    def test_compare_flags_only_regressions_beyond_threshold(self):
+        baseline = report(fast=10.0, steady=10.0, slow=10.0)
+        current = report(fast=5.0, steady=12.0, slow=13.0, new=1.0)
+
+        rows = {row[0]: row for row in microbench.compare(current, baseline, threshold=0.25)}
+
+        assert not rows["fast"][4] and rows["fast"][3] == 0.5
+        assert not rows["steady"][4]
+        assert rows["slow"][4]
+        assert rows["new"][3] is None and not rows["new"][4]
+
+    def test_run_measures_selected_benchmarks(self):
+        result = microbench.run(only="client.get", min_time=0.01, repeats=2)
+
+        assert set(result["benchmarks"]) == {"client.get", "client.get_list"}
+        for stats in result["benchmarks"].values():
+            assert 0 < stats["min_us"] <= stats["median_us"]
+            assert stats["calls"] >= 2
+
+    def test_cli_gates_against_baseline(self, tmp_path, capsys):
+        baseline = tmp_path / "baseline.json"
+        results = tmp_path / "results.json"
+        args = ["--only", "client.headers", "--min-time", "0.01", "--repeats", "2",
+                "--json", str(results), "--baseline", str(baseline)]
+
+        assert microbench.main(args + ["--save-baseline"]) == 0
+        # A generous threshold keeps timing noise on busy CI workers from failing the pass case.
+        assert microbench.main(args + ["--threshold", "100"]) == 0
+
+        saved = json.loads(baseline.read_text())
+        saved["benchmarks"]["client.headers"]["min_us"] /= 1000
+        baseline.write_text(json.dumps(saved))
+
+        assert microbench.main(args) == 1
+        assert "REGRESSED" in capsys.readouterr().out
+        assert json.loads(results.read_text())["transport"] == "mock"
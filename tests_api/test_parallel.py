@@ -0,0 +1,46 @@
+import pytest
+
+from helpers.booking_payloads import BookingPayloadGenerator
+from helpers.booking_pool import BookingPool
+from helpers.parallel import worker_id, worker_prefix, worker_share
+
+
+@pytest.mark.smoke
+class TestParallelWorkers:
+
+    def test_serial_run_has_no_prefix(self, monkeypatch):
+        monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+        monkeypatch.delenv("PYTEST_XDIST_WORKER_COUNT", raising=False)
+
+        assert worker_id() == ""
+        assert worker_prefix() == ""
+        assert worker_share(7) == 7
+
+    def test_worker_prefix_and_share(self, monkeypatch):
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw2")
+        monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "4")
+
+        assert worker_prefix() == "gw2-"
+        assert worker_share(10) == 3
+        assert worker_share(0) == 0
+
+    def test_prefixed_payloads_never_collide_across_workers(self):
+        first = BookingPayloadGenerator(seed=0, name_prefix="gw0-")
+        second = BookingPayloadGenerator(seed=0, name_prefix="gw1-")
+
+        first_names = {p["firstname"] for p in first.stream(500)}
+        second_names = {p["firstname"] for p in second.stream(500)}
+
+        assert first_names.isdisjoint(second_names)
+        assert all(name.startswith("gw0-") for name in first_names)
+
+    def test_pool_uses_worker_prefix(self, local_server, monkeypatch):
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw5")
+        pool = BookingPool(shared=1, base_url=local_server.url).start()
+        try:
+            _, booking = pool.lease_shared()
+        finally:
+            pool.close()
+
+        assert booking["firstname"].startswith("gw5-")
+        assert booking["lastname"].startswith("gw5-")
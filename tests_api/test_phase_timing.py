@@ -0,0 +1,41 @@
+import pytest
+import requests
+
+from helpers.metrics import MetricsRegistry
+from helpers.phase_timing import PHASES, TimingHTTPAdapter
+
+
+@pytest.mark.healthcheck
+class TestPhaseTiming:
+
+    def test_phases_recorded_for_new_and_reused_connections(self, local_server):
+        session = requests.Session()
+        session.mount("http://", TimingHTTPAdapter())
+
+        first = session.get(local_server.url + "/ping")
+        second = session.get(local_server.url + "/ping")
+
+        for response in (first, second):
+            assert set(PHASES) <= set(response.timings)
+            assert response.timings["total"] == pytest.approx(
+                sum(response.timings[p] for p in PHASES))
+
+        assert first.timings["reused"] is False
+        assert first.timings["connect"] > 0
+        assert second.timings["reused"] is True
+        assert second.timings["connect"] == 0
+        assert second.timings["dns"] == 0
+        assert second.text == "Created"
+
+    def test_phases_aggregated_per_route(self):
+        registry = MetricsRegistry()
+        timings = {"dns": 0.001, "connect": 0.002, "tls": 0.0, "send": 0.0001,
+                   "ttfb": 0.01, "body": 0.0002, "total": 0.0133, "reused": False}
+
+        registry.record("GET", "/booking/1", 0.0133)
+        registry.record_phases("GET", "/booking/1", timings)
+        registry.record_phases("GET", "/booking/2", timings)
+
+        phases = registry.summary()["GET /booking/{id}"]["phases"]
+        assert "reused" not in phases
+        assert phases["ttfb"]["p50"] == pytest.approx(0.01, rel=0.01)
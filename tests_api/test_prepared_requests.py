@@ -0,0 +1,121 @@
+import json
+
+import pytest
+import requests
+
+from helpers import api_client
+from helpers.api_client import APIClient
+from helpers.metrics import MetricsRegistry
+from helpers.microbench import MOCK_BASE_URL, MockTransportAdapter
+from helpers.retry import RetryBudget, RetryPolicy
+
+
+class FlakyAdapter(MockTransportAdapter):
+    # Answers the first `failures` requests with 503 and keeps every request it was sent.
+
+    def __init__(self, failures: int = 0):
+        super().__init__()
+        self.failures = failures
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request)
+        response = super().send(request, **kwargs)
+        if len(self.sent) <= self.failures:
+            response.status_code = 503
+        return response
+
+
+def client_with(adapter, token="abc123") -> APIClient:
+    client = APIClient(token=token, base_url=MOCK_BASE_URL, metrics_registry=MetricsRegistry(), cassette=False,
+                       retry_policy=RetryPolicy(backoff_factor=0.001, budget=RetryBudget(30)))
+    client.session.mount(MOCK_BASE_URL + "/", adapter)
+    return client
+
+
+@pytest.mark.smoke
+class TestPreparedRequests:
+
+    @pytest.mark.parametrize("method, endpoint, params, body", [
+        ("GET", "/booking/1", None, None),
+        ("GET", "/booking", {"firstname": "Łucja Ann", "lastname": None, "checkin": "2026-01-01"}, None),
+        ("GET", "/booking?page=1", {"firstname": ["A", "B"]}, None),
+        ("GET", "/booking/a b", None, None),
+        ("POST", "/booking", None, {"firstname": "Żaneta", "bookingdates": {"checkin": "2026-01-01"}}),
+        ("PUT", "/booking/1", None, {}),
+        ("PATCH", "/booking/1", None, None),
+        ("DELETE", "/booking/1", None, None)
+    ])
+    def test_matches_session_prepare_request(self, method, endpoint, params, body):
+        client = client_with(FlakyAdapter())
+        expected = client.session.prepare_request(requests.Request(
+            method, client.base_url + endpoint, headers=client._headers("abc123"), params=params, json=body
+        ))
+
+        encoded = json.dumps(body).encode("utf-8") if body is not None else None
+        prepared = client._prepare(method, client.base_url + endpoint, "abc123", params=params, body=encoded)
+
+        assert prepared.url == expected.url
+        assert dict(prepared.headers) == dict(expected.headers)
+        assert prepared.body == expected.body
+
+    def test_template_is_built_once_per_token(self):
+        client = client_with(FlakyAdapter())
+        client.get("/booking/1")
+        template = client._templates["GET"][1]
+        client.get("/booking/2")
+
+        assert client._templates["GET"][1] is template
+        assert template.url == MOCK_BASE_URL + "/"
+
+        client.token = "new-token"
+        client.get("/booking/1")
+        assert client._templates["GET"][1] is not template
+        assert client._templates["GET"][1].headers["Cookie"] == "token=new-token"
+
+    def test_body_serialized_once_and_reused_by_retries(self, monkeypatch):
+        payload = {"firstname": "A"}
+        dumps, original = [], json.dumps
+        # Patches the shared json module, so only calls serializing this payload count.
+        monkeypatch.setattr(api_client.jsonlib, "dumps",
+                            lambda obj, *a, **kw: dumps.append(obj is payload) or original(obj, *a, **kw))
+        adapter = FlakyAdapter(failures=2)
+        client = client_with(adapter)
+
+        assert client.put("/booking/1", json=payload).status_code == 200
+        assert dumps.count(True) == 1
+        assert len(adapter.sent) == 3
+        assert all(request is adapter.sent[0] for request in adapter.sent)
+        assert adapter.sent[0].body == b'{"firstname": "A"}'
+
+    def test_environment_is_not_reread_per_call(self, monkeypatch):
+        client = client_with(FlakyAdapter())
+        calls = []
+        monkeypatch.setattr(client.session, "merge_environment_settings", lambda *a: calls.append(a))
+
+        client.get("/booking/1")
+        client.post("/booking", json={})
+
+        assert calls == []
+
+    def test_session_cookies_are_still_sent(self):
+        adapter = FlakyAdapter()
+        client = client_with(adapter, token=None)
+        client.session.cookies.set("affinity", "node-2", domain="bench.invalid", path="/")
+
+        client.get("/booking/1")
+
+        assert adapter.sent[-1].headers["Cookie"] == "affinity=node-2"
+
+    def test_changed_session_cookie_is_not_sent_stale(self):
+        adapter = FlakyAdapter()
+        client = client_with(adapter, token=None)
+        client.session.cookies.set("affinity", "node-1", domain="bench.invalid", path="/")
+        client.get("/booking/1")
+        client.session.cookies.set("affinity", "node-2", domain="bench.invalid", path="/")
+        client.get("/booking/1")
+        client.session.cookies.clear()
+        client.get("/booking/1")
+
+        assert adapter.sent[1].headers["Cookie"] == "affinity=node-2"
+        assert "Cookie" not in adapter.sent[2].headers
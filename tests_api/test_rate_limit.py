@@ -0,0 +1,158 @@
+import asyncio
+import threading
+import time
+
+import aiohttp
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from helpers.api_client import APIClient
+from helpers.async_api_client import AsyncAPIClient
+from helpers.circuit_breaker import CircuitBreaker
+from helpers.metrics import MetricsRegistry
+from helpers.rate_limit import AdaptiveConcurrency, RateLimiter, TokenBucket
+
+
+@pytest.mark.smoke
+class TestTokenBucket:
+
+    def test_rate_is_capped_after_the_burst(self):
+        bucket = TokenBucket(rate=100, burst=5)
+
+        delays = [bucket.reserve() for _ in range(15)]
+
+        assert delays[:5] == [0.0] * 5
+        # The 15th token is 10 beyond the burst: about 10 / 100 s away.
+        assert delays[-1] == pytest.approx(0.10, abs=0.01)
+
+
+@pytest.mark.smoke
+class TestAdaptiveConcurrency:
+
+    def test_additive_increase(self):
+        limiter = AdaptiveConcurrency(initial=2, max_limit=10)
+        for _ in range(20):
+            limiter.release(limiter.acquire(), 200, 0.01)
+
+        assert 5 < limiter.limit <= 10
+
+    def test_one_cut_per_overload_burst(self):
+        limiter = AdaptiveConcurrency(initial=8, max_limit=10)
+        permits = [limiter.acquire() for _ in range(8)]
+
+        for permit in permits:
+            limiter.release(permit, 503, 0.01)
+
+        # All eight started before the first cut, so the limit is halved once.
+        assert limiter.limit == 4
+        assert limiter.decreases == 1
+
+        limiter.release(limiter.acquire(), 429, 0.01)
+        assert limiter.limit == 2
+
+    def test_latency_spike_cuts_the_limit(self):
+        limiter = AdaptiveConcurrency(initial=8, max_limit=8, spike_factor=3)
+        for _ in range(30):
+            limiter.release(limiter.acquire(), 200, 0.02)
+
+        limiter.release(limiter.acquire(), 200, 0.5)
+
+        assert limiter.limit == 4
+
+    def test_in_flight_never_exceeds_limit(self):
+        limiter = AdaptiveConcurrency(initial=3, max_limit=3)
+        peak, lock = [0], threading.Lock()
+
+        def call():
+            permit = limiter.acquire()
+            with lock:
+                peak[0] = max(peak[0], limiter.in_flight)
+            time.sleep(0.01)
+            limiter.release(permit, 200, 0.01)
+
+        threads = [threading.Thread(target=call) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak[0] <= 3
+        assert limiter.in_flight == 0
+
+
+class TruncatingAdapter(BaseAdapter):
+    # Every response body is cut short.
+
+    def send(self, request, **kwargs):
+        raise requests.exceptions.ChunkedEncodingError("Connection broken: IncompleteRead")
+
+    def close(self):
+        pass
+
+
+class TruncatedRequest:
+    # Stands in for session.request(...); the body breaks off while being read.
+
+    async def __aenter__(self):
+        raise aiohttp.ClientPayloadError("Response payload is not completed")
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.mark.smoke
+class TestClientsWithLimiter:
+
+    def test_sync_client_respects_rps(self, local_server):
+        limiter = RateLimiter(rps=50, burst=1, adaptive=False)
+        client = APIClient(base_url=local_server.url, metrics_registry=MetricsRegistry(), rate_limiter=limiter)
+
+        started = time.perf_counter()
+        for _ in range(6):
+            assert client.get("/ping").status_code == 201
+
+        assert time.perf_counter() - started >= 0.09
+        assert limiter.waited > 0
+
+    def test_async_client_shares_the_adaptive_limit(self, local_server):
+        limiter = RateLimiter(initial=2, max_limit=4)
+
+        async def run():
+            async with AsyncAPIClient(base_url=local_server.url, metrics_registry=MetricsRegistry(),
+                                      rate_limiter=limiter) as client:
+                return await asyncio.gather(*(client.get("/ping") for _ in range(30)))
+
+        responses = asyncio.run(run())
+
+        assert {r.status_code for r in responses} == {201}
+        assert limiter.concurrency.in_flight == 0
+        assert limiter.concurrency.limit > 2
+
+    def test_sync_client_releases_on_non_connection_error(self, local_server):
+        limiter = RateLimiter(initial=4, max_limit=8)
+        client = APIClient(base_url=local_server.url, metrics_registry=MetricsRegistry(), rate_limiter=limiter)
+        client.circuit_breaker = CircuitBreaker(local_server.url)
+        client.session.mount(local_server.url + "/", TruncatingAdapter())
+
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            client.get("/ping")
+
+        assert limiter.concurrency.in_flight == 0
+        assert limiter.concurrency.limit == 2
+
+    def test_async_client_releases_on_non_connection_error(self, local_server, monkeypatch):
+        limiter = RateLimiter(initial=4, max_limit=8)
+
+        async def run():
+            async with AsyncAPIClient(base_url=local_server.url, metrics_registry=MetricsRegistry(),
+                                      rate_limiter=limiter) as client:
+                client.circuit_breaker = CircuitBreaker(local_server.url)
+                monkeypatch.setattr(client._get_session(), "request", lambda *a, **kw: TruncatedRequest())
+                await client.get("/ping")
+
+        with pytest.raises(aiohttp.ClientPayloadError):
+            asyncio.run(run())
+
+        assert limiter.concurrency.in_flight == 0
+        assert limiter.concurrency.limit == 2
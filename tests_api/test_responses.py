@@ -0,0 +1,78 @@
+import datetime
+
+import pytest
+import requests
+
+from helpers.api_client import APIClient
+from helpers.async_api_client import AsyncResponse
+from helpers.booking_payloads import valid_booking_payload
+from helpers.metrics import MetricsRegistry
+from helpers.responses import APIResponse
+
+
+def raw_response(body: bytes, status: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.encoding = "utf-8"
+    response.headers["Content-Type"] = "application/json"
+    response.elapsed = datetime.timedelta(milliseconds=5)
+    return response
+
+
+@pytest.mark.smoke
+class TestAPIResponse:
+
+    def test_json_decoded_once(self, monkeypatch):
+        raw = raw_response(b'{"bookingid": 7, "booking": {"firstname": "A"}}')
+        calls = []
+        original = raw.json
+        monkeypatch.setattr(raw, "json", lambda **kw: calls.append(1) or original(**kw))
+        response = APIResponse(raw)
+
+        assert response.json() is response.json()
+        assert response.booking_id == 7
+        assert response.booking == {"firstname": "A"}
+        assert len(calls) == 1
+
+    def test_drop_in_attributes(self):
+        response = APIResponse(raw_response(b"[]", status=404))
+
+        assert response.status_code == 404
+        assert response.text == "[]"
+        assert response.headers["content-type"] == "application/json"
+        assert response.elapsed.total_seconds() == pytest.approx(0.005)
+        assert not response
+
+    def test_decode_error_is_cached(self):
+        response = APIResponse(raw_response(b"Created", status=201))
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                response.json()
+        assert response._json_error is not None
+
+    def test_booking_accessors(self):
+        listing = APIResponse(raw_response(b'[{"bookingid": 1}, {"bookingid": 2}]'))
+        single = APIResponse(raw_response(b'{"firstname": "B", "lastname": "C"}'))
+
+        assert listing.booking_ids == [1, 2]
+        assert listing.booking is None
+        assert single.booking == {"firstname": "B", "lastname": "C"}
+        assert single.booking_id is None
+
+    def test_async_response_caches(self):
+        response = AsyncResponse("GET", "/booking", 200, {}, b'[{"bookingid": 3}]',
+                                 datetime.timedelta(0))
+
+        assert response.json() is response.json()
+        assert response.booking_ids == [3]
+
+    def test_client_returns_wrapper(self, local_server):
+        client = APIClient(base_url=local_server.url, metrics_registry=MetricsRegistry())
+
+        response = client.post("/booking", json=valid_booking_payload())
+
+        assert isinstance(response, APIResponse)
+        assert response.booking["firstname"] == valid_booking_payload()["firstname"]
+        assert client.get(f"/booking/{response.booking_id}").booking == response.booking
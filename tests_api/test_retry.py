@@ -0,0 +1,160 @@
+import email.utils
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from helpers.api_client import APIClient
+from helpers.metrics import MetricsRegistry
+from helpers.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    # Answers `failures` requests with `status` (plus Retry-After if set), then 200.
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self):
+        server = self.server
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        with server.lock:
+            server.calls += 1
+            failing = server.calls <= server.failures
+
+        body = b'{"ok": true}'
+        self.send_response(server.status if failing else 200)
+        if failing and server.retry_after is not None:
+            self.send_header("Retry-After", server.retry_after)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def flaky_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    server.lock = threading.Lock()
+    server.calls, server.failures, server.status, server.retry_after = 0, 0, 503, None
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def fast_policy(**kwargs):
+    kwargs.setdefault("backoff_factor", 0.01)
+    kwargs.setdefault("budget", RetryBudget(30))
+    return RetryPolicy(**kwargs)
+
+
+@pytest.mark.smoke
+class TestRetryPolicy:
+
+    def test_idempotent_methods_retry_on_5xx(self):
+        policy = fast_policy()
+
+        assert policy.delay("GET", 0, 0.0, status=503, headers={}) == 0.0
+        assert policy.delay("PUT", 1, 0.0, status=500, headers={}) == pytest.approx(0.02)
+        assert policy.delay("GET", 0, 0.0, status=404, headers={}) is None
+
+    def test_post_is_not_retried_on_5xx(self):
+        policy = fast_policy()
+
+        assert policy.delay("POST", 0, 0.0, status=500, headers={}) is None
+        assert policy.delay("PATCH", 0, 0.0, status=503, headers={}) is None
+
+    def test_retry_after_allows_post_and_overrides_backoff(self):
+        policy = fast_policy()
+
+        assert policy.delay("POST", 0, 0.0, status=503, headers={"Retry-After": "2"}) == 2.0
+        assert policy.delay("GET", 3, 0.0, status=429, headers={"Retry-After": "1"}) == 1.0
+
+    def test_retry_after_http_date(self):
+        when = email.utils.formatdate(time.time() + 30, usegmt=True)
+
+        assert parse_retry_after(when) == pytest.approx(30, abs=1.5)
+        assert parse_retry_after("soon") is None
+
+    def test_connect_errors_are_safe_for_any_method(self):
+        policy = fast_policy()
+
+        assert policy.delay("POST", 0, 0.0, error=requests.exceptions.ConnectTimeout()) == 0.0
+        # The request may have reached the server before the connection dropped.
+        assert policy.delay("POST", 0, 0.0, error=requests.exceptions.ConnectionError("reset")) is None
+        assert policy.delay("GET", 0, 0.0, error=requests.exceptions.ConnectionError("reset")) == 0.0
+
+    def test_call_and_test_budgets(self):
+        policy = fast_policy(call_budget=5)
+        assert policy.delay("GET", 0, 4.0, status=503, headers={"Retry-After": "2"}) is None
+
+        budget = RetryBudget(1)
+        budget.start("test_a")
+        policy = fast_policy(budget=budget)
+        policy.charge(0.9)
+        assert policy.delay("GET", 0, 0.0, status=503, headers={"Retry-After": "1"}) is None
+
+        budget.start("test_b")
+        assert policy.delay("GET", 0, 0.0, status=503, headers={"Retry-After": "1"}) == 1.0
+
+    def test_total_is_respected(self):
+        assert fast_policy(total=2).delay("GET", 2, 0.0, status=503, headers={}) is None
+
+
+@pytest.mark.smoke
+@pytest.mark.own_server
+class TestClientRetries:
+
+    def test_get_retried_and_recorded(self, flaky_server):
+        flaky_server.failures = 2
+        registry = MetricsRegistry()
+        client = APIClient(base_url=flaky_server.url, metrics_registry=registry, retry_policy=fast_policy())
+
+        response = client.get("/booking/1")
+
+        assert response.status_code == 200
+        assert flaky_server.calls == 3
+        summary = registry.summary()["GET /booking/{id}"]
+        assert summary["retries"] == 2
+        assert registry.retry_totals()[0] == 2
+
+    def test_post_not_duplicated(self, flaky_server):
+        flaky_server.failures, flaky_server.status = 1, 500
+        client = APIClient(base_url=flaky_server.url, metrics_registry=MetricsRegistry(),
+                           retry_policy=fast_policy())
+
+        response = client.post("/booking", json={"firstname": "A"})
+
+        assert response.status_code == 500
+        assert flaky_server.calls == 1
+
+    def test_post_retried_when_server_sends_retry_after(self, flaky_server):
+        flaky_server.failures, flaky_server.retry_after = 1, "0"
+        client = APIClient(base_url=flaky_server.url, metrics_registry=MetricsRegistry(),
+                           retry_policy=fast_policy())
+
+        assert client.post("/booking", json={"firstname": "A"}).status_code == 200
+        assert flaky_server.calls == 2
+
+    def test_call_budget_stops_retrying(self, flaky_server):
+        flaky_server.failures = 100
+        registry = MetricsRegistry()
+        client = APIClient(base_url=flaky_server.url, metrics_registry=registry,
+                           retry_policy=fast_policy(backoff_factor=0.2, call_budget=0.5))
+
+        response = client.get("/ping")
+
+        assert response.status_code == 503
+        assert flaky_server.calls == 3
+        # Waited 0 + 0.4s; the next 0.8s backoff would have overrun the 0.5s budget.
+        # Checked on the recorded backoff, not wall time, which varies on loaded CI workers.
+        assert registry.retry_totals() == (2, pytest.approx(0.4))
@@ -0,0 +1,45 @@
+import pytest
+
+from helpers.scheduling import CACHE_KEY, DurationStore, lpt_order
+
+
+class FakeCache:
+
+    def __init__(self, data=None):
+        self.data = dict(data or {})
+
+    def get(self, key, default):
+        return self.data.get(key, default)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+
+@pytest.mark.smoke
+class TestDurationScheduling:
+
+    def test_longest_first_with_median_for_new_tests(self):
+        store = DurationStore(FakeCache({CACHE_KEY: {"a": 1.0, "b": 5.0, "c": 0.1}}))
+
+        # "new" has no history and is placed as a median (1.0) test, after "a".
+        assert lpt_order(["a", "b", "c", "new"], store) == [1, 0, 3, 2]
+
+    def test_without_history_collection_order_is_kept(self):
+        assert lpt_order(["x", "y", "z"], DurationStore()) == [0, 1, 2]
+
+    def test_phases_are_summed_and_smoothed_on_save(self):
+        cache = FakeCache({CACHE_KEY: {"a": 4.0, "old": 1.0}})
+        store = DurationStore(cache)
+
+        store.add("a", 1.5)
+        store.add("a", 0.5)
+        store.add("b", 3.0)
+        store.save()
+
+        assert cache.data[CACHE_KEY] == {"a": 3.0, "b": 3.0, "old": 1.0}
+
+    def test_nothing_saved_without_measurements(self):
+        cache = FakeCache()
+        DurationStore(cache).save()
+
+        assert CACHE_KEY not in cache.data
@@ -0,0 +1,41 @@
+import pytest
+
+from helpers.booking_payloads import valid_booking_payload
+from helpers.schemas import SchemaRegistry, registry
+
+
+@pytest.mark.booking
+class TestSchemaRegistry:
+
+    def test_all_schema_files_loaded(self):
+        assert {"booking", "booking_list"} <= set(registry.names)
+
+    def test_valid_booking_matches(self):
+        registry.assert_matches("booking", valid_booking_payload())
+
+    def test_date_format_is_enforced(self):
+        booking = valid_booking_payload()
+        booking["bookingdates"]["checkin"] = "0NaN-aN-aN"
+
+        with pytest.raises(AssertionError, match="bookingdates/checkin"):
+            registry.assert_matches("booking", booking)
+
+    def test_booking_list_schema(self):
+        assert registry.is_valid("booking_list", [{"bookingid": 1}, {"bookingid": 2}])
+        assert registry.is_valid("booking_list", [])
+        assert not registry.is_valid("booking_list", [{"bookingid": "1"}])
+
+    def test_unknown_schema(self):
+        with pytest.raises(KeyError):
+            registry.validator("nope")
+
+    def test_validators_compiled_once(self):
+        assert registry.validator("booking") is registry.validator("booking")
+
+    def test_custom_directory(self, tmp_path):
+        (tmp_path / "ping_schema.json").write_text('{"type": "string"}')
+
+        custom = SchemaRegistry(str(tmp_path))
+
+        assert custom.names == ["ping"]
+        assert custom.is_valid("ping", "Created")
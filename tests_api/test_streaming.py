@@ -0,0 +1,117 @@
+import json
+
+import pytest
+
+from helpers.api_client import APIClient
+from helpers.booking_helpers import booking_in_results, create_booking, iter_booking_ids
+from helpers.booking_payloads import valid_booking_payload
+from helpers.cassette import Cassette
+from helpers.metrics import MetricsRegistry
+from helpers.streaming import iter_json_array, stream_booking_ids
+
+
+def chunked(data: bytes, size: int) -> list:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class FakeStream:
+    # Stands in for a streamed requests.Response; counts the chunks handed out.
+
+    def __init__(self, body: bytes, chunk_size: int = 7, status_code: int = 200):
+        self.body = body
+        self.status_code = status_code
+        self.chunk_size = chunk_size
+        self.encoding = "utf-8"
+        self.read_chunks = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size=None):
+        for chunk in chunked(self.body, self.chunk_size):
+            self.read_chunks += 1
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.smoke
+class TestJsonArrayStream:
+
+    @pytest.mark.parametrize("size", [1, 3, 16, 1 << 20])
+    def test_any_chunk_boundary(self, size):
+        items = [{"bookingid": i} for i in range(200)] + [12345, "a,]b", [1, [2]], None, True]
+        body = json.dumps(items, indent=1).encode()
+
+        assert list(iter_json_array(chunked(body, size))) == items
+
+    def test_multibyte_characters_split_across_chunks(self):
+        items = [{"firstname": "Łucja"}, {"firstname": "沙羅"}]
+
+        assert list(iter_json_array(chunked(json.dumps(items, ensure_ascii=False).encode(), 1))) == items
+
+    @pytest.mark.parametrize("body", [b"", b"{}", b"[1, 2", b"[{\"a\": }]", b"[] []"])
+    def test_rejects_non_arrays_and_truncated_bodies(self, body):
+        with pytest.raises(ValueError):
+            list(iter_json_array([body]))
+
+    def test_short_circuit_reads_only_what_it_needs(self):
+        body = json.dumps([{"bookingid": i} for i in range(10_000)]).encode()
+        response = FakeStream(body)
+
+        ids = stream_booking_ids(response)
+        assert 5 in ids
+        ids.close()
+
+        assert response.closed
+        assert response.read_chunks < 20
+
+    def test_unexpected_element_fails(self):
+        response = FakeStream(b'[{"bookingid": 1}, {"bookingid": "2"}]')
+
+        with pytest.raises(ValueError, match="Unexpected element"):
+            list(stream_booking_ids(response))
+        assert response.closed
+
+
+@pytest.mark.booking
+class TestStreamedBookingIds:
+
+    def test_matches_materialized_list(self, local_server):
+        client = APIClient(base_url=local_server.url, metrics_registry=MetricsRegistry())
+        create_booking(client, valid_booking_payload())
+
+        assert list(iter_booking_ids(client)) == client.get("/booking").booking_ids
+
+    def test_booking_in_results(self, local_server):
+        client = APIClient(base_url=local_server.url, metrics_registry=MetricsRegistry())
+        payload = valid_booking_payload()
+        booking_id, _ = create_booking(client, payload)
+
+        assert booking_in_results(client, booking_id, {"firstname": payload["firstname"]})
+        assert not booking_in_results(client, booking_id, {"firstname": "____NoSuchName____"})
+
+    def test_non_200_raises(self):
+        response = FakeStream(b"Service Unavailable", status_code=503)
+
+        class Client:
+            def get(self, endpoint, params=None, stream=False):
+                return response
+
+        with pytest.raises(AssertionError, match="returned 503"):
+            next(iter_booking_ids(Client()))
+        assert response.closed
+
+    def test_streams_from_cassette_replay(self, local_server, tmp_path):
+        path = str(tmp_path / "cassette.jsonl")
+        recorder = Cassette(path, "record")
+        booking_id, _ = create_booking(APIClient(base_url=local_server.url, cassette=recorder,
+                                                 metrics_registry=MetricsRegistry()))
+        expected = list(iter_booking_ids(APIClient(base_url=local_server.url, cassette=recorder,
+                                                   metrics_registry=MetricsRegistry())))
+        recorder.close()
+
+        player = Cassette(path, "replay")
+        client = APIClient(base_url="http://127.0.0.1:9", cassette=player)
+        assert list(iter_booking_ids(client)) == expected
+        assert booking_id in expected
+        player.close()